@@ -78,6 +78,9 @@ class Config:
         # 시작 Slave ID
         self.power_meter_start_slave_id = int(os.getenv('POWER_METER_START_SLAVE_ID', '31'))
         
+        # 비동기 읽기 사용 여부 (asyncio + AsyncModbusTcpClient)
+        self.power_meter_async = os.getenv('POWER_METER_ASYNC', 'false').lower() == 'true'
+        
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # Modbus TCP 공통 설정
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -143,6 +146,7 @@ class Config:
         print(f"  IP 주소       : {self.power_meter_ip}")
         print(f"  개수          : {self.power_meter_count}개")
         print(f"  시작 Slave ID : {self.power_meter_start_slave_id}")
+        print(f"  비동기 읽기   : {self.power_meter_async}")
         
         print("\n[Modbus TCP]")
         print(f"  포트          : {self.modbus_tcp_port}")
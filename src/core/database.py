@@ -41,6 +41,9 @@ logger = logging.getLogger(__name__)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 _connection_pool = None
 
+# execute_query_iter 기본 fetch 크기 (행)
+ITER_FETCH_SIZE = 1024
+
 
 def initialize_connection_pool(minconn: int = 1, maxconn: int = 10):
     """데이터베이스 연결 풀 초기화"""
@@ -98,6 +101,16 @@ def get_connection():
     return _connection_pool.getconn()
 
 
+def get_pool_maxconn() -> int:
+    """연결 풀 최대 연결 수 (동시 작업 수를 풀 크기에 맞출 때 사용)"""
+    global _connection_pool
+    
+    if _connection_pool is None:
+        initialize_connection_pool()
+    
+    return _connection_pool.maxconn
+
+
 def return_connection(conn):
     """연결 풀에 연결 반환"""
     global _connection_pool
@@ -148,13 +161,23 @@ def test_db_connection() -> bool:
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 def execute_query(query: str, params: tuple = None, fetch_mode: str = 'all'):
-    """쿼리 실행 헬퍼 함수 (UI 데이터 조회용)"""
+    """
+    쿼리 실행 헬퍼 함수 (UI 데이터 조회용)
+    
+    fetch_mode:
+        'all': List[dict], 'one': dict 또는 None,
+        'all_tuples': List[tuple] (dict 변환 없이 컬럼 순서대로, 대량 조회용),
+        그 외: 커밋만 수행
+    """
     connection = None
     cursor = None
     
     try:
         connection = get_connection()
-        cursor = connection.cursor(cursor_factory=RealDictCursor)
+        if fetch_mode == 'all_tuples':
+            cursor = connection.cursor()
+        else:
+            cursor = connection.cursor(cursor_factory=RealDictCursor)
         
         if params:
             cursor.execute(query, params)
@@ -167,6 +190,8 @@ def execute_query(query: str, params: tuple = None, fetch_mode: str = 'all'):
         elif fetch_mode == 'one':
             result = cursor.fetchone()
             return dict(result) if result else None
+        elif fetch_mode == 'all_tuples':
+            return cursor.fetchall()
         else:
             connection.commit()
             return None
@@ -186,6 +211,52 @@ def execute_query(query: str, params: tuple = None, fetch_mode: str = 'all'):
             return_connection(connection)
 
 
+def execute_query_iter(query: str, params: tuple = None, itersize: int = ITER_FETCH_SIZE):
+    """
+    서버 측(named) 커서로 조회 결과를 나눠 받으며 행 단위로 반환 (긴 기간 조회용)
+    
+    전체 결과를 클라이언트에 한 번에 버퍼링하지 않으므로 메모리 사용이 itersize 행
+    수준으로 유지됩니다. 반복이 끝나거나 중단될 때 연결을 풀에 반환합니다.
+    
+    Args:
+        query: SELECT 쿼리
+        params: 쿼리 파라미터
+        itersize: 한 번에 가져올 행 수
+    
+    Yields:
+        tuple: 조회 행 (컬럼 순서대로)
+    """
+    connection = get_connection()
+    cursor = None
+    
+    try:
+        # named 커서는 트랜잭션 안에서만 유효 (반복 종료 시 rollback으로 정리)
+        cursor = connection.cursor(name=f'iter_{id(connection):x}')
+        cursor.itersize = itersize
+        cursor.execute(query, params)
+        
+        while True:
+            rows = cursor.fetchmany(itersize)
+            if not rows:
+                break
+            yield from rows
+    
+    except Exception as e:
+        logger.error(f"쿼리 실행 실패: {e}")
+        logger.error(f"쿼리: {query}")
+        logger.error(f"파라미터: {params}")
+        raise
+    
+    finally:
+        try:
+            if cursor:
+                cursor.close()
+            connection.rollback()
+        except Exception:
+            pass
+        return_connection(connection)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 히트펌프 데이터 저장/조회
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -8,7 +8,7 @@ Modbus RTU over TCP 연결 관리
 (Hercules 등 Raw TCP 기반 Modbus 장비와 통신)
 
 주요 기능:
-1. 연결 풀 관리 (IP:Port별로 연결 재사용)
+1. 연결 풀 관리 (IP:Port별로 연결 재사용, TCP Keep-Alive)
 2. 자동 재연결
 3. 스레드 안전성 (Lock)
 4. 싱글톤 패턴
@@ -22,6 +22,7 @@ Modbus RTU over TCP 연결 관리
         result = client.read_holding_registers(...)
 """
 import logging
+import socket
 import threading
 import time
 from typing import Dict, Optional, Tuple
@@ -40,6 +41,40 @@ FAILURE_THRESHOLD = 3      # 연속 실패 N회 → 차단
 RECOVERY_TIMEOUT  = 30.0   # 차단 후 재시도까지 대기 시간(초)
 CONNECT_TIMEOUT   = 2.0    # 연결 타임아웃 (기존 3초 → 2초)
 
+# TCP Keep-Alive 설정 (폴링 사이 유휴 소켓 유지)
+KEEPALIVE_IDLE     = 30    # 유휴 후 첫 probe까지 대기(초)
+KEEPALIVE_INTERVAL = 10    # probe 간격(초)
+KEEPALIVE_COUNT    = 3     # 응답 없을 때 끊기 전 probe 횟수
+
+# 같은 게이트웨이에 동시에 여는 소켓 수 상한 (전력량계 비동기 읽기용, 게이트웨이 부하 제한)
+MAX_CLIENT_POOL = 4
+
+
+def _apply_socket_options(client: ModbusTcpClient, key: str):
+    """
+    연결된 소켓에 Keep-Alive + TCP_NODELAY 적용.
+    폴링마다 재연결(3-way handshake)하지 않고 같은 소켓을 재사용하기 위함.
+    """
+    sock = getattr(client, 'socket', None)
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            # Linux
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT)
+        elif hasattr(socket, 'SIO_KEEPALIVE_VALS'):
+            # Windows (ms 단위)
+            sock.ioctl(
+                socket.SIO_KEEPALIVE_VALS,
+                (1, KEEPALIVE_IDLE * 1000, KEEPALIVE_INTERVAL * 1000)
+            )
+    except OSError as e:
+        logger.debug(f"[{key}] 소켓 옵션 설정 실패: {e}")
+
 
 class _ConnectionState:
     """IP:Port 단위 연결 상태 관리"""
@@ -149,9 +184,19 @@ class ModbusTcpManager:
 
         # 장치별 Lock — 같은 IP를 여러 스레드가 동시에 재연결 시도하지 않도록
         with state.lock:
-            # 이미 연결된 경우
+            # 이미 연결된 경우 — 소켓이 살아있으면 그대로 재사용
             if state.client and state.client.connected:
-                return state.client
+                if state.client.is_socket_open():
+                    return state.client
+
+                # 소켓이 닫혔으면 같은 클라이언트로 1회만 재연결
+                logger.info(f"[{key}] 소켓 닫힘 감지 — 재연결 시도")
+                try:
+                    if state.client.connect():
+                        _apply_socket_options(state.client, key)
+                        return state.client
+                except Exception as e:
+                    logger.debug(f"[{key}] 재연결 실패: {e}")
 
             # 끊어진 연결 정리
             if state.client:
@@ -171,6 +216,7 @@ class ModbusTcpManager:
                     framer=ModbusRtuFramer
                 )
                 if client.connect():
+                    _apply_socket_options(client, key)
                     state.client = client
                     state.record_success()
                     state.status = _ConnectionState.OPEN
@@ -235,6 +281,21 @@ class ModbusTcpManager:
                 }
             return result
 
+    def close(self, ip: str, port: int = 502):
+        """특정 IP:Port 연결만 종료 (다른 장치 연결은 유지)"""
+        key = f"{ip}:{port}"
+        with self._pool_lock:
+            state = self._states.pop(key, None)
+        if state is None or state.client is None:
+            return
+        with state.lock:
+            try:
+                state.client.close()
+                logger.debug(f"[{key}] 연결 종료")
+            except Exception as e:
+                logger.error(f"[{key}] 연결 종료 오류: {e}")
+            state.client = None
+
     def close_all(self):
         """모든 연결 종료"""
         with self._pool_lock:
@@ -220,6 +220,9 @@ def run_gui_mode():
     # 메인 윈도우 생성
     window = MainWindow()
     
+    # 수집 완료 시 UI 통계 캐시를 비워 다음 갱신에서 최신값을 바로 반영
+    data_service.on_collection_complete = lambda _result: window.data_service.invalidate_latest()
+    
     # 윈도우가 닫힐 때 데이터 수집 서비스도 함께 종료되도록 설정
     def on_app_quit():
         print("데이터 수집 서비스 중지 중...")
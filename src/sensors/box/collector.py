@@ -2,7 +2,7 @@
 # 온도, 유량 센서 데이터 수집기 (병렬 수집 버전)
 # ==============================================
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, TimeoutError
 from typing import Dict, Optional
 from datetime import datetime
 
@@ -63,8 +63,7 @@ class BoxSensorCollector:
     # ─────────────────────────────────────────
     # 단일 장치 수집 (워커 스레드에서 실행)
     # ─────────────────────────────────────────
-    def _read_heatpump_sensor(self, device_id: str,
-                                power_meter_data=None) -> dict:
+    def _read_heatpump_sensor(self, device_id: str) -> dict:
         """센서 읽기만 수행 (DB 저장 없음)"""
         try:
             device_config = self.config_service.get_device_config(device_id)
@@ -90,7 +89,21 @@ class BoxSensorCollector:
     # 전체 병렬 수집
     # ─────────────────────────────────────────
     def collect_all_heatpumps(self, power_meter_data=None):
+        """
+        히트펌프 전체 수집 (센서 읽기 → 전력량 대기 → 배치 저장)
+
+        Args:
+            power_meter_data: {device_id: 전력량} 또는 그 결과를 줄 Future
+        """
         heatpumps = self.config_service.get_heatpump_ips()
+        sensor_results = self._read_all_heatpumps(heatpumps)
+        power_meter_data = self._resolve_power_data(
+            power_meter_data, timeout=DEVICE_COLLECT_TIMEOUT
+        )
+        return self._save_heatpumps(heatpumps, sensor_results, power_meter_data)
+
+    def _read_all_heatpumps(self, heatpumps) -> dict:
+        """히트펌프 센서 병렬 읽기만 수행 (DB 저장 없음)"""
         logger.info(f"히트펌프 {len(heatpumps)}개 병렬 수집 시작")
 
         # 병렬로 센서 읽기만 수행
@@ -98,13 +111,10 @@ class BoxSensorCollector:
         for hp in heatpumps:
             device_id = hp.get('device_id')
             if device_id:
-                future = self._executor.submit(
-                    self._read_heatpump_sensor, device_id, power_meter_data
-                )
+                future = self._executor.submit(self._read_heatpump_sensor, device_id)
                 futures[future] = device_id
 
         # 결과 수집
-        # collect_all_groundpipes() 수정
         sensor_results = {}
         total_timeout = DEVICE_COLLECT_TIMEOUT * len(futures) / MAX_WORKERS + 5
 
@@ -123,7 +133,21 @@ class BoxSensorCollector:
                 if device_id not in sensor_results:
                     sensor_results[device_id] = None
 
-        # 배치 INSERT (한 트랜잭션)
+        return sensor_results
+
+    @staticmethod
+    def _resolve_power_data(power_meter_data, timeout=None):
+        """전력량계 수집과 병렬로 실행된 경우 Future에서 전력량 결과를 꺼냄"""
+        if not isinstance(power_meter_data, Future):
+            return power_meter_data
+        try:
+            return power_meter_data.result(timeout=timeout)
+        except Exception as e:
+            logger.error(f"전력량 데이터 대기 실패 (energy 없이 저장): {e}")
+            return None
+
+    def _save_heatpumps(self, heatpumps, sensor_results, power_meter_data) -> dict:
+        """히트펌프 센서 값 + 전력량 배치 INSERT (한 트랜잭션)"""
         batch = []
         results = {}
         now = datetime.now()
@@ -249,29 +273,34 @@ class BoxSensorCollector:
         """
         전체 장치 병렬 수집.
         히트펌프와 지중배관을 동시에 수집.
+
+        Args:
+            power_meter_data: {device_id: 전력량} 또는 그 결과를 줄 Future
+                (Future면 센서 읽기를 먼저 하고 저장 직전에 결과를 기다림)
         """
         logger.info("온도, 유량 전체 병렬 수집 시작")
 
-        # 히트펌프 + 지중배관 동시 수집
-        hp_future = self._executor.submit(
-            self.collect_all_heatpumps, power_meter_data
-        )
+        heatpumps = self.config_service.get_heatpump_ips()
+
+        # 히트펌프 센서 읽기 + 지중배관 수집 동시 진행
+        # (히트펌프 저장은 전력량 결과가 필요하므로 아래에서 따로)
+        hp_future = self._executor.submit(self._read_all_heatpumps, heatpumps)
         gp_future = self._executor.submit(
             self.collect_all_groundpipes
         )
 
         # 내부에서 total_timeout = 25 × 10 / 8 + 5 = 36.25초
         # 외부가 50초라 충분하긴 한데, 더 명확하게 장치 수 기반으로
-        hp_count = len(self.config_service.get_heatpump_ips())
+        hp_count = len(heatpumps)
         gp_count = len(self.config_service.get_groundpipe_ips())
 
         try:
-            hp_results = hp_future.result(
+            sensor_results = hp_future.result(
                 timeout=DEVICE_COLLECT_TIMEOUT * hp_count / MAX_WORKERS + 10 
             )
         except Exception as e:
             logger.error(f"히트펌프 전체 수집 오류: {e}")
-            hp_results = {}
+            sensor_results = {}
 
         try:
             gp_results = gp_future.result(
@@ -281,6 +310,15 @@ class BoxSensorCollector:
             logger.error(f"지중배관 전체 수집 오류: {e}")
             gp_results = {}
 
+        # 전력량 결과는 센서 읽기 타임아웃과 별개로 기다림
+        # (전력량계 수집은 소켓 타임아웃/재시도로 끝이 정해져 있음)
+        power_meter_data = self._resolve_power_data(power_meter_data)
+        try:
+            hp_results = self._save_heatpumps(heatpumps, sensor_results, power_meter_data)
+        except Exception as e:
+            logger.error(f"히트펌프 저장 오류: {e}")
+            hp_results = {}
+
         results = {'heatpump': hp_results, 'groundpipe': gp_results}
 
         total_success = (
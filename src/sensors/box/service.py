@@ -4,6 +4,7 @@
 import logging
 import threading
 import time
+from types import MappingProxyType
 from typing import Optional, Dict, Callable
 from datetime import datetime
 
@@ -23,6 +24,8 @@ class BoxSensorService:
         self.stats = {'total_collections': 0, 'successful_collections': 0,
                       'failed_collections': 0, 'last_collection_time': None,
                       'last_success_time': None, 'last_error': None}
+        # get_stats()용 읽기 전용 뷰 (호출마다 복사하지 않음)
+        self._stats_view = MappingProxyType(self.stats)
         self.on_collection_complete: Optional[Callable] = None
         self.on_collection_error: Optional[Callable] = None
         logger.info("BoxSensorService 초기화 완료")
@@ -93,10 +96,13 @@ class BoxSensorService:
         self._collect_once(power_meter_data)
 
     def is_running(self): return self._running
-    def get_stats(self): return self.stats.copy()
+    def get_stats(self, copy: bool = False):
+        """통계 조회 (기본: 읽기 전용 뷰, copy=True면 dict 복사본)"""
+        return self.stats.copy() if copy else self._stats_view
 
     def reset_stats(self):
-        self.stats = {'total_collections': 0, 'successful_collections': 0,
-                      'failed_collections': 0, 'last_collection_time': None,
-                      'last_success_time': None, 'last_error': None}
+        # 뷰가 같은 dict를 가리키도록 교체하지 않고 제자리 갱신
+        self.stats.update({'total_collections': 0, 'successful_collections': 0,
+                           'failed_collections': 0, 'last_collection_time': None,
+                           'last_success_time': None, 'last_error': None})
         logger.info("통계 초기화")
@@ -7,6 +7,7 @@
 주요 클래스:
 1. PowerMeterData: 전력량계 데이터
 2. PowerMeterConfig: 전력량계 설정
+3. PowerMeterStats: 수집 통계 스냅샷
 
 사용 예:
     from sensors.power.models import PowerMeterData
@@ -183,6 +184,40 @@ class PowerMeterSystemConfig:
         )
 
 
+@dataclass(frozen=True)
+class PowerMeterStats:
+    """
+    전력량계 수집 통계 스냅샷
+    
+    불변 객체이므로 수집 스레드는 새 인스턴스로 교체만 하고,
+    조회 측은 락 없이 참조를 그대로 읽을 수 있습니다.
+    시각 값은 time.time() 기준 epoch 초입니다.
+    """
+    total_collections: int = 0
+    successful_collections: int = 0
+    failed_collections: int = 0
+    last_collection_time: Optional[float] = None
+    last_success_time: Optional[float] = None
+    last_error: Optional[str] = None
+    
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (시각은 datetime으로 변환)"""
+        return {
+            'total_collections': self.total_collections,
+            'successful_collections': self.successful_collections,
+            'failed_collections': self.failed_collections,
+            'last_collection_time': (
+                datetime.fromtimestamp(self.last_collection_time)
+                if self.last_collection_time is not None else None
+            ),
+            'last_success_time': (
+                datetime.fromtimestamp(self.last_success_time)
+                if self.last_success_time is not None else None
+            ),
+            'last_error': self.last_error
+        }
+
+
 @dataclass
 class EnergyStatistics:
     """
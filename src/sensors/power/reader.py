@@ -9,6 +9,7 @@
 1. 전력량계 설정 로드 (JSON)
 2. Modbus RTU over TCP 통신
 3. 전력량 데이터 읽기
+4. 비동기 동시 읽기 (POWER_METER_ASYNC=true, AsyncModbusTcpClient)
 
 
 레지스터 맵:
@@ -28,18 +29,88 @@
 """
 
 
+import asyncio
 import json
 import logging
+import select
+import socket
+import struct
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
+try:
+    from pymodbus.client import AsyncModbusTcpClient
+except ImportError:
+    AsyncModbusTcpClient = None
 
-from sensors.power.models import PowerMeterData, PowerMeterSystemConfig
-from core.modbus_tcp_manager import ModbusTcpManager
+
+from sensors.power.models import PowerMeterData, PowerMeterConfig, PowerMeterSystemConfig
+from core.modbus_tcp_manager import (
+    ModbusTcpManager, ModbusRtuFramer, MAX_CLIENT_POOL, CONNECT_TIMEOUT
+)
+from core.config import get_config
+from services.config_service import load_json_file
 
 
 logger = logging.getLogger(__name__)
 
+# 레지스터 2개(Big Endian 16bit × 2) → 32bit unsigned 변환용 (미리 컴파일)
+_REGS_PACK = struct.Struct('>HH')
+_U32_UNPACK = struct.Struct('>I')
+
+# RTU 요청 프레임 본문: slave_id, 함수코드(0x03), 시작 주소, 레지스터 수
+_RTU_REQUEST = struct.Struct('>BBHH')
+_CRC_PACK = struct.Struct('<H')  # Modbus CRC는 Little Endian
+
+# 0x03 정상 응답: slave(1) + fc(1) + byte count(1) + 데이터(4) + CRC(2)
+_RTU_RESPONSE_LEN = 9
+# 예외 응답: slave(1) + fc|0x80(1) + 예외코드(1) + CRC(2)
+_RTU_EXCEPTION_LEN = 5
+
+# 응답 없음/어긋난 응답 시 재시도 횟수 (pymodbus ModbusTcpClient 기본 retries와 동일)
+_RAW_RETRIES = 3
+
+
+def _build_crc16_table() -> List[int]:
+    """Modbus CRC16 (poly 0xA001) 조회 테이블 생성"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC16_TABLE = _build_crc16_table()
+
+
+def _crc16(data: bytes) -> int:
+    """Modbus RTU CRC16 계산"""
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def _recv_exact(sock, size: int) -> bytes:
+    """소켓에서 정확히 size 바이트 수신 (소켓 타임아웃 적용)"""
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("게이트웨이가 연결을 닫음")
+        buf += chunk
+    return bytes(buf)
+
+
+def _drain_input(sock):
+    """이전 요청의 늦은 응답 등 수신 버퍼에 남은 데이터 버리기 (대기 없음)"""
+    while select.select([sock], [], [], 0)[0]:
+        if not sock.recv(256):
+            raise ConnectionError("게이트웨이가 연결을 닫음")
+
 
 
 class PowerMeterReader:
@@ -64,7 +135,26 @@ class PowerMeterReader:
         self.meter_configs = self.system_config.get_enabled_meters()
         
         # Modbus 매니저 초기화
-        self.modbus_manager = ModbusTcpManager()
+        self.modbus_manager = ModbusTcpManager.get_instance()
+        
+        # 비동기 읽기용 게이트웨이 소켓 수 (전력량계 수 이하, 최대 MAX_CLIENT_POOL)
+        self.pool_size = max(1, min(len(self.meter_configs), MAX_CLIENT_POOL))
+        
+        # 비동기 읽기 (전용 이벤트 루프 스레드에서 실행, 동기 API 유지)
+        self.use_async = get_config().power_meter_async
+        if self.use_async and AsyncModbusTcpClient is None:
+            logger.warning("AsyncModbusTcpClient 사용 불가 - 동기 읽기로 동작")
+            self.use_async = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._async_clients: Dict[int, 'AsyncModbusTcpClient'] = {}
+        
+        # Slave별 RTU 요청 프레임 (CRC 포함) 미리 생성
+        # RTU 프레임에는 트랜잭션 ID가 없어 Slave마다 매번 같은 바이트열임
+        self._request_frames: Dict[int, bytes] = {
+            m.slave_id: self._build_request_frame(m.slave_id)
+            for m in self.meter_configs
+        }
         
         logger.info(f"PowerMeterReader 초기화: {self.ip}:{self.port}")
         logger.info(f"  전력량계 개수: {len(self.meter_configs)}개")
@@ -78,8 +168,7 @@ class PowerMeterReader:
             PowerMeterSystemConfig: 시스템 설정
         """
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = load_json_file(self.config_file)
             
             system_config = PowerMeterSystemConfig.from_dict(config_data)
             
@@ -112,9 +201,20 @@ class PowerMeterReader:
         """
         try:
             # Modbus RTU over TCP 연결
+            # (동기 읽기는 순차이므로 게이트웨이 소켓 1개만 사용 -
+            #  클라이언트 수가 1~2개로 제한된 시리얼 게이트웨이가 많음.
+            #  소켓 여러 개는 실제로 읽기가 겹치는 비동기 경로에서만 사용)
             client = self.modbus_manager.get_client(self.ip, self.port)
+            if not client:
+                # Circuit Breaker 차단 중이거나 연결 실패
+                return None
             
             # 레지스터 읽기 (2개 워드 = 32bit Long)
+            # 미리 만든 요청 프레임을 소켓에 직접 송수신 (pymodbus 인코딩 생략)
+            sock = getattr(client, 'socket', None)
+            if sock is not None:
+                return self._read_energy_raw(client, sock, slave_id)
+            
             result = client.read_holding_registers(
                 address=self.REGISTER_ENERGY,
                 count=2,
@@ -122,40 +222,220 @@ class PowerMeterReader:
             )
             
             if result.isError():
-                logger.error(f"[Slave {slave_id}] Modbus 읽기 오류: {result}")
+                logger.error("[Slave %s] Modbus 읽기 오류: %s", slave_id, result)
                 return None
             
-            # 상위/하위 워드
-            high_word = result.registers[0]
-            low_word = result.registers[1]
+            return self._decode_energy(slave_id, result.registers)
             
-            # 디버깅 로그 (DEBUG 레벨)
+        except Exception as e:
+            logger.error(
+                "[Slave %s] 전력량 읽기 오류: %s", slave_id, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            return None
+    
+    def _build_request_frame(self, slave_id: int) -> bytes:
+        """누적 전력량 읽기(0x03) RTU 요청 프레임 생성 (CRC 포함)"""
+        body = _RTU_REQUEST.pack(slave_id, 0x03, self.REGISTER_ENERGY, 2)
+        return body + _CRC_PACK.pack(_crc16(body))
+    
+    def _read_energy_raw(self, client, sock, slave_id: int) -> Optional[float]:
+        """
+        미리 만든 RTU 프레임으로 누적 전력량 읽기
+        
+        pymodbus read_holding_registers()처럼 응답이 없거나 어긋나면
+        (타임아웃, CRC/Slave/길이 불일치) 최대 _RAW_RETRIES회 다시 요청합니다.
+        요청마다 수신 버퍼를 먼저 비워 늦게 도착한 이전 응답과 섞이지 않게 하고,
+        끝내 실패하면 클라이언트를 닫아 다음 읽기 때 재연결되게 합니다.
+        """
+        frame = self._request_frames.get(slave_id)
+        if frame is None:
+            frame = self._request_frames[slave_id] = self._build_request_frame(slave_id)
+        
+        try:
+            for attempt in range(_RAW_RETRIES + 1):
+                try:
+                    _drain_input(sock)
+                    sock.sendall(frame)
+                    
+                    # 예외 응답 길이만큼 먼저 받고, 정상 응답이면 나머지 수신
+                    resp = _recv_exact(sock, _RTU_EXCEPTION_LEN)
+                    if resp[1] == 0x83:
+                        if _crc16(resp) == 0:
+                            logger.error(
+                                "[Slave %s] Modbus 예외 응답: 코드 %d", slave_id, resp[2]
+                            )
+                            return None
+                        raise ValueError(f"예외 응답 CRC 오류: {resp.hex()}")
+                    
+                    resp += _recv_exact(sock, _RTU_RESPONSE_LEN - _RTU_EXCEPTION_LEN)
+                    
+                    # CRC를 포함해 다시 계산하면 0이어야 정상
+                    if (_crc16(resp) != 0 or resp[0] != slave_id
+                            or resp[1] != 0x03 or resp[2] != 4):
+                        raise ValueError(f"잘못된 응답: {resp.hex()}")
+                    
+                    return self._decode_energy(slave_id, _REGS_PACK.unpack_from(resp, 3))
+                
+                except (socket.timeout, ValueError) as e:
+                    if attempt == _RAW_RETRIES:
+                        raise
+                    logger.debug(
+                        "[Slave %s] 응답 오류, 재시도 %d/%d: %s",
+                        slave_id, attempt + 1, _RAW_RETRIES, e
+                    )
+        except Exception:
+            client.close()
+            raise
+    
+    @staticmethod
+    def _decode_energy(slave_id: int, registers: Sequence[int]) -> float:
+        """
+        레지스터 2개 → 누적 전력량 (kWh) 변환
+        
+        Args:
+            slave_id: Slave ID (로그용)
+            registers: (상위 워드, 하위 워드)
+        
+        Returns:
+            float: 누적 전력량 (kWh)
+        """
+        # 상위/하위 워드
+        high_word = registers[0]
+        low_word = registers[1]
+        
+        # 32비트 값 계산 (Big Endian)
+        raw_value = _U32_UNPACK.unpack(_REGS_PACK.pack(high_word, low_word))[0]
+        
+        # kWh 변환 (0.01 kWh 단위)
+        energy_kwh = raw_value * 0.01
+        
+        # 디버깅 로그 (DEBUG 레벨일 때만 문자열 생성)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"[Slave {slave_id}] RAW 데이터: "
                 f"High=0x{high_word:04X} ({high_word}), "
-                f"Low=0x{low_word:04X} ({low_word})"
+                f"Low=0x{low_word:04X} ({low_word}), "
+                f"32bit Long: {raw_value} (0x{raw_value:08X}), "
+                f"전력량: {energy_kwh:.2f} kWh"
             )
-            
-            # 32비트 값 계산 (Big Endian)
-            raw_value = (high_word << 16) | low_word
-            
-            logger.debug(
-                f"[Slave {slave_id}] 32bit Long: {raw_value} "
-                f"(0x{raw_value:08X})"
+        
+        return energy_kwh
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 비동기 읽기 (asyncio + AsyncModbusTcpClient)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """전용 이벤트 루프 스레드 시작 (최초 1회)"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever,
+                daemon=True,
+                name="PowerMeterAsyncLoop"
             )
-            
-            # kWh 변환 (0.01 kWh 단위)
-            energy_kwh = raw_value * 0.01
-            
-            logger.debug(
-                f"[Slave {slave_id}] 전력량: {energy_kwh:.2f} kWh"
+            self._loop_thread.start()
+        return self._loop
+    
+    async def _get_async_client(self, slot: int) -> Optional['AsyncModbusTcpClient']:
+        """슬롯별 비동기 클라이언트 반환 (연결 유지, 끊겼으면 재연결)"""
+        client = self._async_clients.get(slot)
+        if client is None:
+            client = AsyncModbusTcpClient(
+                self.ip,
+                port=self.port,
+                framer=ModbusRtuFramer,
+                timeout=CONNECT_TIMEOUT,
+                reconnect_delay=1
             )
-            
-            return energy_kwh
-            
+            self._async_clients[slot] = client
+        
+        if not client.connected:
+            await client.connect()
+        
+        return client if client.connected else None
+    
+    async def _read_slot_async(
+        self,
+        slot: int,
+        meters: List[PowerMeterConfig]
+    ) -> Dict[str, Optional[float]]:
+        """
+        한 소켓에 할당된 전력량계 순차 읽기
+        
+        RTU 프레임에는 트랜잭션 ID가 없으므로 소켓당 요청은 1개씩만 보냅니다.
+        """
+        energies: Dict[str, Optional[float]] = {m.device_id: None for m in meters}
+        
+        try:
+            client = await self._get_async_client(slot)
         except Exception as e:
-            logger.error(f"[Slave {slave_id}] 전력량 읽기 오류: {e}", exc_info=True)
-            return None
+            logger.error("[%s:%s #%d] 비동기 연결 오류: %s", self.ip, self.port, slot, e)
+            return energies
+        if client is None:
+            logger.error("[%s:%s #%d] 비동기 연결 실패", self.ip, self.port, slot)
+            return energies
+        
+        for meter in meters:
+            try:
+                result = await client.read_holding_registers(
+                    address=self.REGISTER_ENERGY,
+                    count=2,
+                    slave=meter.slave_id
+                )
+                if result.isError():
+                    logger.error("[Slave %s] Modbus 읽기 오류: %s", meter.slave_id, result)
+                    continue
+                energies[meter.device_id] = self._decode_energy(
+                    meter.slave_id, result.registers
+                )
+            except Exception as e:
+                logger.error(
+                    "[Slave %s] 전력량 읽기 오류: %s", meter.slave_id, e,
+                    exc_info=logger.isEnabledFor(logging.DEBUG)
+                )
+        
+        return energies
+    
+    async def _read_all_async(
+        self,
+        meters: List[PowerMeterConfig]
+    ) -> Dict[str, Optional[float]]:
+        """전력량계를 소켓 수만큼 나눠 동시에 읽기"""
+        slots = [meters[i::self.pool_size] for i in range(self.pool_size)]
+        parts = await asyncio.gather(*(
+            self._read_slot_async(slot, slot_meters)
+            for slot, slot_meters in enumerate(slots)
+            if slot_meters
+        ))
+        
+        energies: Dict[str, Optional[float]] = {}
+        for part in parts:
+            energies.update(part)
+        return energies
+    
+    def _read_energies(self, meters: List[PowerMeterConfig]) -> Dict[str, Optional[float]]:
+        """
+        전력량계 목록의 누적 전력량 읽기 (동기/비동기 자동 선택)
+        
+        Returns:
+            dict: {device_id: energy (kWh) 또는 None}
+        """
+        if not self.use_async:
+            return {m.device_id: self.read_total_energy(m.slave_id) for m in meters}
+        
+        future = asyncio.run_coroutine_threadsafe(
+            self._read_all_async(meters), self._ensure_loop()
+        )
+        # 소켓당 순차 읽기이므로 최악의 경우 (연결 + 장치 수) × 타임아웃
+        per_slot = -(-len(meters) // self.pool_size)
+        try:
+            return future.result(timeout=CONNECT_TIMEOUT * (per_slot + 1) + 1)
+        except Exception as e:
+            future.cancel()
+            logger.error("전력량계 비동기 읽기 실패: %s", e)
+            return {m.device_id: None for m in meters}
     
     def read_all_meters(self) -> Dict[str, PowerMeterData]:
         """
@@ -164,59 +444,79 @@ class PowerMeterReader:
         Returns:
             dict: {device_id: PowerMeterData, ...}
         """
-        logger.info(f"전력량계 데이터 읽기 시작 ({self.ip}:{self.port})")
+        logger.info("전력량계 데이터 읽기 시작 (%s:%s)", self.ip, self.port)
         
         results = {}
         success_count = 0
         fail_count = 0
-        skip_count = 0
         
-        for meter_config in self.meter_configs:
-            # 비활성화된 전력량계는 건너뛰기
-            if not meter_config.enabled:
-                skip_count += 1
-                continue
+        # 비활성화된 전력량계는 건너뛰기
+        enabled_meters = [m for m in self.meter_configs if m.enabled]
+        skip_count = len(self.meter_configs) - len(enabled_meters)
+        
+        # 전력량 읽기 (동기 또는 비동기 동시 읽기)
+        energies = self._read_energies(enabled_meters)
+        
+        for meter_config in enabled_meters:
+            total_energy = energies.get(meter_config.device_id)
             
-            try:
-                # 전력량 읽기
-                total_energy = self.read_total_energy(meter_config.slave_id)
+            if total_energy is not None:
+                # PowerMeterData 객체 생성
+                data = PowerMeterData(
+                    device_id=meter_config.device_id,
+                    total_energy=total_energy
+                )
                 
-                if total_energy is not None:
-                    # PowerMeterData 객체 생성
-                    data = PowerMeterData(
-                        device_id=meter_config.device_id,
-                        total_energy=total_energy
-                    )
-                    
-                    results[meter_config.device_id] = data
-                    success_count += 1
-                    
-                    logger.info(
-                        f"✓ [{meter_config.device_id}] {total_energy:.2f} kWh"
-                    )
-                else:
-                    fail_count += 1
-                    logger.warning(f"✗ [{meter_config.device_id}] 데이터 읽기 실패")
-                    
-            except Exception as e:
-                fail_count += 1
-                logger.error(
-                    f"✗ [{meter_config.device_id}] 데이터 읽기 오류: {e}",
-                    exc_info=True
+                results[meter_config.device_id] = data
+                success_count += 1
+                
+                logger.info(
+                    "✓ [%s] %.2f kWh", meter_config.device_id, total_energy
                 )
+            else:
+                fail_count += 1
+                logger.warning("✗ [%s] 데이터 읽기 실패", meter_config.device_id)
         
         total_count = len(self.meter_configs)
         logger.info(
-            f"전력량계 데이터 읽기 완료: "
-            f"성공 {success_count}개, 실패 {fail_count}개, "
-            f"건너뜀 {skip_count}개 (총 {total_count}개)"
+            "전력량계 데이터 읽기 완료: "
+            "성공 %d개, 실패 %d개, 건너뜀 %d개 (총 %d개)",
+            success_count, fail_count, skip_count, total_count
         )
         
         return results
     
     def close(self):
-        """연결 종료"""
-        self.modbus_manager.close_all()
+        """
+        이 게이트웨이 연결만 종료
+        
+        ModbusTcpManager는 박스 센서와 공유하는 싱글톤이므로 close_all()은 쓰지 않음
+        (전체 종료는 프로그램 종료 시에만)
+        """
+        self.modbus_manager.close(self.ip, self.port)
+        
+        # 비동기 클라이언트 / 이벤트 루프 정리
+        if self._loop is not None:
+            loop = self._loop
+            clients = list(self._async_clients.values())
+            
+            def _shutdown():
+                for client in clients:
+                    try:
+                        client.close()
+                    except Exception:
+                        pass
+                loop.stop()
+            
+            loop.call_soon_threadsafe(_shutdown)
+            if self._loop_thread:
+                self._loop_thread.join(timeout=2)
+            if not loop.is_running():
+                loop.close()
+            self._loop = None
+            self._loop_thread = None
+            self._async_clients.clear()
+        
         logger.info("PowerMeterReader 연결 종료")
 
 
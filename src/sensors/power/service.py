@@ -20,14 +20,20 @@
 import logging
 import threading
 import time
-from typing import Optional, Dict, Callable
-from datetime import datetime
+from dataclasses import replace
+from typing import Optional, Dict, Callable, Tuple
+
+import numpy as np
 
 from sensors.power.collector import PowerMeterCollector
+from sensors.power.models import PowerMeterStats
 from core.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# 메모리에 보관할 최근 수집 이력 개수 (기본 주기 60초 기준 1시간)
+HISTORY_SIZE = 60
+
 
 class PowerMeterService:
     """
@@ -46,19 +52,22 @@ class PowerMeterService:
         self._stop_event = threading.Event()
         self._running = False
         
-        # 최신 데이터 캐시
-        self._latest_data: Optional[Dict[str, float]] = None
-        self._data_lock = threading.Lock()
-        
-        # 통계
-        self.stats = {
-            'total_collections': 0,
-            'successful_collections': 0,
-            'failed_collections': 0,
-            'last_collection_time': None,
-            'last_success_time': None,
-            'last_error': None
-        }
+        # 최근 수집 이력 링 버퍼 (HISTORY_SIZE × 전력량계 수, 실패 장치는 NaN)
+        # 수집 스레드만 쓰고, 행을 다 채운 뒤 _ring_idx를 올려 공개함
+        # 다음에 덮어쓸 행(_ring_idx % HISTORY_SIZE)은 가장 오래된 공개 행이므로
+        # 읽기는 최근 HISTORY_SIZE - 1개 행까지만 복사 → 쓰는 중인 행을 읽지 않아 락 불필요
+        meter_ids = [m.device_id for m in self.collector.reader.meter_configs]
+        self._device_ids = np.array(meter_ids)
+        self._device_index = {device_id: i for i, device_id in enumerate(meter_ids)}
+        self._ring = np.full((HISTORY_SIZE, len(meter_ids)), np.nan, dtype=np.float64)
+        self._ring_times = np.full(HISTORY_SIZE, np.nan, dtype=np.float64)
+        self._ring_idx = 0  # 지금까지 기록한 행 수 (0: 아직 수집 전)
+        
+        # get_latest_data 결과 캐시 (링 인덱스, 변환된 딕셔너리)
+        self._latest_data: Optional[Tuple[int, Dict]] = None
+        
+        # 통계 (불변 스냅샷을 통째로 교체하므로 락 불필요)
+        self._stats = PowerMeterStats()
         
         # 콜백 함수 (UI 업데이트용)
         self.on_collection_complete: Optional[Callable] = None
@@ -111,20 +120,29 @@ class PowerMeterService:
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5)
         
+        # 연결은 수집 주기 사이에 유지하고 중지 시에만 종료
+        self.collector.reader.close()
+        
         logger.info("PowerMeterService 중지 완료")
     
     def _collection_loop(self):
         """데이터 수집 루프 (백그라운드 스레드)"""
         logger.info("전력량계 수집 루프 시작")
         
+        # 수집 시간만큼 주기가 밀리지 않도록 다음 기준 시각(deadline)으로 대기
+        next_deadline = time.monotonic() + self.interval
+        
         while not self._stop_event.is_set():
             try:
                 # 데이터 수집 실행
                 self._collect_once()
                 
             except Exception as e:
-                logger.error(f"전력량계 수집 루프 오류: {e}", exc_info=True)
-                self.stats['last_error'] = str(e)
+                logger.error(
+                    "전력량계 수집 루프 오류: %s", e,
+                    exc_info=logger.isEnabledFor(logging.DEBUG)
+                )
+                self._stats = replace(self._stats, last_error=str(e))
                 
                 if self.on_collection_error:
                     try:
@@ -133,7 +151,13 @@ class PowerMeterService:
                         pass
             
             # 다음 수집까지 대기
-            self._stop_event.wait(self.interval)
+            self._stop_event.wait(max(0.0, next_deadline - time.monotonic()))
+            next_deadline += self.interval
+            
+            # 수집이 한 주기 이상 걸렸으면 놓친 주기는 건너뜀
+            now = time.monotonic()
+            while next_deadline <= now:
+                next_deadline += self.interval
         
         logger.info("전력량계 수집 루프 종료")
     
@@ -143,33 +167,47 @@ class PowerMeterService:
         
         logger.debug("전력량계 데이터 수집 시작")
         
-        # 통계 업데이트
-        self.stats['total_collections'] += 1
-        self.stats['last_collection_time'] = datetime.now()
+        stats = self._stats
         
         try:
             # 데이터 수집
             data = self.collector.collect_all()
             
-            # 최신 데이터 캐시 업데이트
-            with self._data_lock:
-                self._latest_data = data
-            
-            # 성공 여부 확인
-            success_count = sum(1 for v in data.values() if v is not None)
+            # 링 버퍼 다음 행 채운 뒤 인덱스 증가로 공개 (실패 장치는 NaN)
+            success_count = 0
+            ring_idx = self._ring_idx
+            row = self._ring[ring_idx % HISTORY_SIZE]
+            row.fill(np.nan)
+            for meter_data in data.get('data', []):
+                i = self._device_index.get(meter_data.device_id)
+                if i is not None and meter_data.total_energy is not None:
+                    row[i] = meter_data.total_energy
+                    success_count += 1
+            self._ring_times[ring_idx % HISTORY_SIZE] = start_time
+            self._ring_idx = ring_idx + 1
             
+            # 통계 스냅샷 교체
             if success_count > 0:
-                self.stats['successful_collections'] += 1
-                self.stats['last_success_time'] = datetime.now()
+                self._stats = replace(
+                    stats,
+                    total_collections=stats.total_collections + 1,
+                    successful_collections=stats.successful_collections + 1,
+                    last_collection_time=start_time,
+                    last_success_time=time.time()
+                )
             else:
-                self.stats['failed_collections'] += 1
+                self._stats = replace(
+                    stats,
+                    total_collections=stats.total_collections + 1,
+                    failed_collections=stats.failed_collections + 1,
+                    last_collection_time=start_time
+                )
             
             elapsed_time = time.time() - start_time
             
             logger.info(
-                f"전력량계 데이터 수집 완료: "
-                f"{success_count}/{len(data)}개 성공, "
-                f"소요 시간: {elapsed_time:.2f}초"
+                "전력량계 데이터 수집 완료: %d/%d개 성공, 소요 시간: %.2f초",
+                success_count, len(self._device_ids), elapsed_time
             )
             
             # 콜백 호출 (UI 업데이트)
@@ -180,10 +218,18 @@ class PowerMeterService:
                     pass
             
         except Exception as e:
-            self.stats['failed_collections'] += 1
-            self.stats['last_error'] = str(e)
+            self._stats = replace(
+                stats,
+                total_collections=stats.total_collections + 1,
+                failed_collections=stats.failed_collections + 1,
+                last_collection_time=start_time,
+                last_error=str(e)
+            )
             
-            logger.error(f"전력량계 데이터 수집 실패: {e}", exc_info=True)
+            logger.error(
+                "전력량계 데이터 수집 실패: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             
             if self.on_collection_error:
                 try:
@@ -201,12 +247,15 @@ class PowerMeterService:
         logger.info("수동 전력량계 데이터 수집 트리거")
         self._collect_once()
     
-    def get_latest_data(self) -> Optional[Dict[str, float]]:
+    def get_latest_data(self) -> Optional[Dict[str, Optional[float]]]:
         """
         최신 수집 데이터 조회
         
+        딕셔너리는 수집 1회당 최초 호출 시에만 배열에서 만들고,
+        이후 호출에는 같은 객체를 반환합니다 (읽기 전용으로 사용할 것).
+        
         Returns:
-            dict: {device_id: energy (kWh)}
+            dict: {device_id: energy (kWh), 읽기 실패 장치는 None}
             None: 아직 수집된 데이터 없음
             
         Example:
@@ -214,8 +263,53 @@ class PowerMeterService:
             >>> if data:
             >>>     print(data['HP_1'])
         """
-        with self._data_lock:
-            return self._latest_data.copy() if self._latest_data else None
+        ring_idx = self._ring_idx
+        if ring_idx == 0:
+            return None
+        
+        cached = self._latest_data
+        if cached is not None and cached[0] == ring_idx:
+            return cached[1]
+        
+        energies = self._ring[(ring_idx - 1) % HISTORY_SIZE].tolist()
+        data = {
+            device_id: (None if energy != energy else energy)  # NaN → None
+            for device_id, energy in zip(self._device_ids.tolist(), energies)
+        }
+        self._latest_data = (ring_idx, data)
+        return data
+    
+    def get_recent(self, k: int = HISTORY_SIZE - 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        최근 k회 수집 이력 조회 (DB 조회 없이 메모리에서)
+        
+        Args:
+            k: 조회할 수집 횟수 (최대 HISTORY_SIZE - 1,
+               가장 오래된 행은 수집 스레드가 다음에 덮어쓰는 행이라 제외)
+        
+        Returns:
+            tuple: (timestamps, energies)
+                - timestamps: shape (n,) 수집 시각 (epoch 초), 오래된 순
+                - energies: shape (n, 전력량계 수) kWh, 실패 장치는 NaN
+                  (열 순서는 get_device_ids()와 같음)
+            
+        Example:
+            >>> times, energies = service.get_recent(10)
+            >>> print(energies[-1])  # 최신 수집값
+        """
+        ring_idx = self._ring_idx
+        n = max(0, min(k, ring_idx, HISTORY_SIZE - 1))
+        rows = np.arange(ring_idx - n, ring_idx) % HISTORY_SIZE
+        return self._ring_times[rows], self._ring[rows]
+    
+    def get_device_ids(self) -> list:
+        """
+        get_recent() 결과의 열 순서에 해당하는 장치 ID 목록
+        
+        Returns:
+            list: device_id 목록
+        """
+        return self._device_ids.tolist()
     
     def is_running(self) -> bool:
         """
@@ -226,25 +320,18 @@ class PowerMeterService:
         """
         return self._running
     
-    def get_stats(self) -> Dict:
+    def get_stats(self) -> PowerMeterStats:
         """
         통계 정보 반환
         
         Returns:
-            dict: 통계 정보
+            PowerMeterStats: 통계 스냅샷 (불변, 복사 불필요)
         """
-        return self.stats.copy()
+        return self._stats
     
     def reset_stats(self):
         """통계 초기화"""
-        self.stats = {
-            'total_collections': 0,
-            'successful_collections': 0,
-            'failed_collections': 0,
-            'last_collection_time': None,
-            'last_success_time': None,
-            'last_error': None
-        }
+        self._stats = PowerMeterStats()
         logger.info("통계 초기화")
     
     def reload_config(self):
@@ -312,9 +399,9 @@ if __name__ == "__main__":
     # 통계 확인
     print("\n[테스트 3] 통계 확인")
     stats = service.get_stats()
-    print(f"  총 수집 횟수: {stats['total_collections']}")
-    print(f"  성공 횟수: {stats['successful_collections']}")
-    print(f"  실패 횟수: {stats['failed_collections']}")
+    print(f"  총 수집 횟수: {stats.total_collections}")
+    print(f"  성공 횟수: {stats.successful_collections}")
+    print(f"  실패 횟수: {stats.failed_collections}")
     
     # 백그라운드 수집 테스트
     print("\n[테스트 4] 백그라운드 수집 (10초 간격, 3회)")
@@ -328,9 +415,9 @@ if __name__ == "__main__":
     # 최종 통계
     print("\n[최종 통계]")
     stats = service.get_stats()
-    print(f"  총 수집 횟수: {stats['total_collections']}")
-    print(f"  성공 횟수: {stats['successful_collections']}")
-    print(f"  실패 횟수: {stats['failed_collections']}")
+    print(f"  총 수집 횟수: {stats.total_collections}")
+    print(f"  성공 횟수: {stats.successful_collections}")
+    print(f"  실패 횟수: {stats.failed_collections}")
     
     print("\n" + "=" * 70)
     print("✓ 테스트 완료")
@@ -25,17 +25,237 @@ JSON 설정 파일 로드/저장 관리
     service.update_device_slave_ids('HP_1', temp1_slave_id=10)
 """
 
+import copy
+import functools
 import json
 import logging
+import os
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 from core.config import get_config
 
 logger = logging.getLogger(__name__)
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 설정 파일 스키마
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 로드 직후 한 번 검증하고 누락된 목록 키는 default로 채우므로
+# 조회 메서드는 data['heatpump'] 처럼 바로 인덱싱할 수 있습니다.
+
+_BOX_DEVICE_SCHEMA = {
+    'type': 'object',
+    'required': ['device_id', 'ip'],
+    'properties': {
+        'device_id': {'type': 'string'},
+        'ip': {'type': 'string'},
+        'port': {'type': 'integer'},
+    },
+}
+
+BOX_IPS_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'heatpump': {'type': 'array', 'items': _BOX_DEVICE_SCHEMA, 'default': []},
+        'groundpipe': {'type': 'array', 'items': _BOX_DEVICE_SCHEMA, 'default': []},
+        'powermeter_groups': {
+            'type': 'array',
+            'default': [],
+            'items': {
+                'type': 'object',
+                'required': ['ip', 'port'],
+                'properties': {
+                    'ip': {'type': 'string'},
+                    'port': {'type': 'integer'},
+                    'meters': {'type': 'array', 'default': []},
+                },
+            },
+        },
+    },
+}
+
+POWER_METER_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'ip': {'type': 'string', 'default': '192.168.1.200'},
+        'port': {'type': 'integer'},
+        'meters': {
+            'type': 'array',
+            'default': [],
+            'items': {
+                'type': 'object',
+                'required': ['device_id', 'slave_id'],
+                'properties': {
+                    'device_id': {'type': 'string'},
+                    'slave_id': {'type': 'integer'},
+                },
+            },
+        },
+    },
+}
+
+
+class ConfigValidationError(ValueError):
+    """설정 파일이 스키마와 맞지 않을 때 발생"""
+
+
+_JSON_TYPES = {
+    'object': dict,
+    'array': list,
+    'string': str,
+    'integer': int,
+}
+
+
+def _check_schema(schema: Dict[str, Any], value: Any, path: str = 'data'):
+    """fastjsonschema가 없을 때 쓰는 최소 검증 (type/required/default/items만 지원)"""
+    expected = _JSON_TYPES[schema['type']]
+    if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+        raise ConfigValidationError(f"{path} must be {schema['type']}")
+    
+    if expected is dict:
+        for key in schema.get('required', []):
+            if key not in value:
+                raise ConfigValidationError(f"{path} must contain ['{key}'] properties")
+        for key, sub in schema.get('properties', {}).items():
+            if key not in value and 'default' in sub:
+                value[key] = copy.deepcopy(sub['default'])
+            if key in value:
+                _check_schema(sub, value[key], f"{path}.{key}")
+    elif expected is list and 'items' in schema:
+        for i, item in enumerate(value):
+            _check_schema(schema['items'], item, f"{path}[{i}]")
+
+
+def _compile_validator(schema: Dict[str, Any]):
+    """스키마 검증 함수 생성 (fastjsonschema 있으면 컴파일된 검증기 사용)"""
+    if fastjsonschema is not None:
+        compiled = fastjsonschema.compile(schema)
+        
+        def validate(data):
+            try:
+                return compiled(data)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ConfigValidationError(e.message) from e
+        return validate
+    
+    def validate(data):
+        _check_schema(schema, data)
+        return data
+    return validate
+
+
+# 모듈 로드 시 한 번만 컴파일
+_validate_box_ips = _compile_validator(BOX_IPS_SCHEMA)
+_validate_power_meter = _compile_validator(POWER_METER_SCHEMA)
+
+# 예상 가능한 로드 오류 - 트레이스백 없이 한 줄로 기록
+# (파일 없음/권한/파싱/스키마 오류, 그 외 예외만 exc_info로 기록)
+_EXPECTED_LOAD_ERRORS = (
+    FileNotFoundError,
+    PermissionError,
+    json.JSONDecodeError,
+    UnicodeDecodeError,
+    ConfigValidationError,
+)
+
+
+def load_json_file(path: Path) -> Any:
+    """
+    JSON 파일 로드 (orjson 있으면 bytes 그대로 파싱, 없으면 표준 json)
+    
+    파싱 오류는 두 경우 모두 json.JSONDecodeError (orjson.JSONDecodeError는 하위 클래스)
+    """
+    return parse_json_bytes(path.read_bytes())
+
+
+def parse_json_bytes(raw: bytes) -> Any:
+    """JSON bytes 파싱 (load_json_file과 같은 규칙)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def _dump_json_bytes(data: Dict[str, Any]) -> bytes:
+    """JSON 직렬화 (orjson 있으면 사용, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+# 연속 저장 시 last_updated 타임스탬프 재사용 간격 (초)
+LAST_UPDATED_REUSE_SEC = 0.1
+
+# (monotonic 시각, isoformat 문자열) - 마지막으로 생성한 타임스탬프
+_last_stamp: Tuple[float, str] = (float('-inf'), '')
+
+
+def _last_updated_stamp() -> str:
+    """
+    저장용 last_updated 문자열 반환
+    
+    100ms 이내 연속 저장이면 직전 문자열을 재사용합니다.
+    """
+    global _last_stamp
+    now = time.monotonic()
+    stamped_at, stamp = _last_stamp
+    if now - stamped_at >= LAST_UPDATED_REUSE_SEC:
+        stamp = datetime.now().isoformat()
+        _last_stamp = (now, stamp)
+    return stamp
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]):
+    """
+    JSON 파일 원자적 저장
+    
+    임시 파일에 먼저 쓰고 os.replace로 교체하므로
+    저장 중 오류/종료가 발생해도 기존 파일이 깨지지 않습니다.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    try:
+        tmp.write_bytes(_dump_json_bytes(data))
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def save_json_file(path: Path, data: Dict[str, Any]):
+    """JSON 파일 저장 (load_json_file 짝, orjson 있으면 사용, 원자적 교체)"""
+    _write_json_atomic(path, data)
+
+
+@functools.lru_cache(maxsize=None)
+def _config_paths() -> Tuple[Path, Path, Path]:
+    """
+    설정 디렉토리/파일 경로 (최초 1회만 계산, config 디렉토리 생성 포함)
+    
+    Returns:
+        tuple: (config_dir, box_ips_file, power_meter_file)
+    """
+    config_dir = get_config().project_root / 'config'
+    config_dir.mkdir(exist_ok=True)
+    return (
+        config_dir,
+        config_dir / 'box_ips.json',
+        config_dir / 'power_meter_config.json',
+    )
+
+
 class ConfigService:
     """
     설정 파일 관리 서비스
@@ -45,15 +265,15 @@ class ConfigService:
     
     def __init__(self):
         """초기화"""
-        config = get_config()
-        self.config_dir = config.project_root / 'config'
-        
-        # 설정 파일 경로
-        self.box_ips_file = self.config_dir / 'box_ips.json'
-        self.power_meter_file = self.config_dir / 'power_meter_config.json'
-        
-        # config 디렉토리 생성 (없으면)
-        self.config_dir.mkdir(exist_ok=True)
+        # 설정 파일 경로 (인스턴스마다 다시 만들지 않고 모듈 캐시 사용)
+        self.config_dir, self.box_ips_file, self.power_meter_file = _config_paths()
+        
+        # 파싱된 설정 캐시 (파일 mtime이 바뀔 때만 다시 읽음)
+        # 박스 설정은 (mtime, 데이터, {device_id: (카테고리, 인덱스)})를 튜플 하나로
+        # 한 번에 교체 — 수집 스레드들이 재로드 중에도 짝이 맞는 데이터/인덱스를 읽도록
+        self._box_snapshot: Optional[Tuple[int, Dict[str, Any], Dict[str, Tuple[str, int]]]] = None
+        self._pm_cache: Optional[Dict[str, Any]] = None
+        self._pm_mtime = 0
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 플라스틱 함 IP 설정
@@ -64,7 +284,7 @@ class ConfigService:
         플라스틱 함 IP 설정 로드
         
         Returns:
-            dict: 설정 딕셔너리 (실패 시 None)
+            dict: 설정 딕셔너리 사본 (실패 시 None)
             
         Example:
             >>> service = ConfigService()
@@ -72,21 +292,80 @@ class ConfigService:
             >>> print(config['heatpump'][0]['ip'])
             '192.168.1.101'
         """
+        data = self._load_box_ips_cached()
+        return copy.deepcopy(data) if data is not None else None
+    
+    def _load_box_ips_cached(self) -> Optional[Dict[str, Any]]:
+        """
+        플라스틱 함 IP 설정 로드 (읽기 전용 캐시)
+        
+        파일 mtime이 그대로면 디스크를 다시 읽지 않습니다.
+        반환값은 캐시 원본이므로 수정하지 마세요. (수정은 load_box_ips 사용)
+        """
+        snapshot = self._load_box_snapshot()
+        return snapshot[1] if snapshot is not None else None
+    
+    def _load_box_snapshot(
+        self
+    ) -> Optional[Tuple[int, Dict[str, Any], Dict[str, Tuple[str, int]]]]:
+        """
+        (mtime, 설정 데이터, 장치 인덱스) 스냅샷 조회
+        
+        데이터와 인덱스는 항상 같은 스냅샷에서 꺼내 써야 합니다.
+        """
+        try:
+            mtime = self.box_ips_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            logger.warning(f"설정 파일 없음: {self.box_ips_file}")
+            return None
+        
+        snapshot = self._box_snapshot
+        if snapshot is not None and snapshot[0] == mtime:
+            return snapshot
+        
         try:
-            if not self.box_ips_file.exists():
-                logger.warning(f"설정 파일 없음: {self.box_ips_file}")
-                return None
+            data = _validate_box_ips(load_json_file(self.box_ips_file))
             
-            with open(self.box_ips_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            snapshot = (mtime, data, self._build_device_index(data))
+            self._box_snapshot = snapshot
             
             logger.debug(f"플라스틱 함 IP 설정 로드: {self.box_ips_file}")
-            return data
+            return snapshot
             
+        except _EXPECTED_LOAD_ERRORS as e:
+            logger.error(f"플라스틱 함 IP 설정 로드 실패: {type(e).__name__}: {e}")
+            return None
         except Exception as e:
             logger.error(f"플라스틱 함 IP 설정 로드 실패: {e}", exc_info=True)
             return None
     
+    @staticmethod
+    def _build_device_index(data: Dict[str, Any]) -> Dict[str, Tuple[str, int]]:
+        """device_id → (카테고리, 인덱스) 조회 테이블 생성"""
+        index = {}
+        for category in ('heatpump', 'groundpipe'):
+            for i, device in enumerate(data[category]):
+                index[device['device_id']] = (category, i)
+        return index
+    
+    @staticmethod
+    def _find_device(
+        data: Dict[str, Any],
+        index: Dict[str, Tuple[str, int]],
+        device_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        인덱스로 장치 설정 찾기
+        
+        data와 index는 같은 스냅샷에서 나온 것이어야 합니다.
+        (data는 스냅샷 원본 또는 그 사본 — 구조가 같으므로 인덱스가 그대로 유효함)
+        """
+        location = index.get(device_id)
+        if location is None:
+            return None
+        category, i = location
+        return data[category][i]
+    
     def save_box_ips(self, data: Dict[str, Any]) -> bool:
         """
         플라스틱 함 IP 설정 저장
@@ -98,16 +377,23 @@ class ConfigService:
             bool: 저장 성공 시 True
         """
         try:
-            # 수정 시간 업데이트
-            data['last_updated'] = datetime.now().isoformat()
+            # 수정 시간 업데이트 (직렬화 전에 미리 계산, 같은 값이면 재기록 생략)
+            last_updated = _last_updated_stamp()
+            if data.get('last_updated') != last_updated:
+                data['last_updated'] = last_updated
+            
+            # JSON 저장 (원자적 교체)
+            _write_json_atomic(self.box_ips_file, data)
             
-            # JSON 저장
-            with open(self.box_ips_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 다음 조회 시 다시 읽도록 캐시 무효화 (인덱스는 재로드 시 재생성)
+            self._box_snapshot = None
             
             logger.info(f"플라스틱 함 IP 설정 저장: {self.box_ips_file}")
             return True
             
+        except OSError as e:
+            logger.error(f"플라스틱 함 IP 설정 저장 실패: {type(e).__name__}: {e}")
+            return False
         except Exception as e:
             logger.error(f"플라스틱 함 IP 설정 저장 실패: {e}", exc_info=True)
             return False
@@ -125,10 +411,8 @@ class ConfigService:
             >>> for hp in heatpumps:
             >>>     print(hp['device_id'], hp['ip'])
         """
-        data = self.load_box_ips()
-        if data and 'heatpump' in data:
-            return data['heatpump']
-        return []
+        data = self._load_box_ips_cached()
+        return data['heatpump'] if data else []
     
     def get_groundpipe_ips(self) -> List[Dict[str, Any]]:
         """
@@ -137,24 +421,20 @@ class ConfigService:
         Returns:
             list: 지중배관 설정 리스트
         """
-        data = self.load_box_ips()
-        if data and 'groundpipe' in data:
-            return data['groundpipe']
-        return []
+        data = self._load_box_ips_cached()
+        return data['groundpipe'] if data else []
     
     def get_powermeter_groups(self) -> List[Dict[str, Any]]:
         """전력량계 그룹 목록 조회 (box_ips.json 기준)"""
-        data = self.load_box_ips()
-        if data and 'powermeter_groups' in data:
-            return data['powermeter_groups']
-        return []
+        data = self._load_box_ips_cached()
+        return data['powermeter_groups'] if data else []
 
     def get_all_power_meter_devices(self) -> List[Dict[str, Any]]:
         """전체 전력량계 장치 목록 조회 (box_ips.json 기준, 그룹 펼쳐서 반환)"""
         groups = self.get_powermeter_groups()
         meters = []
         for group in groups:
-            for meter in group.get('meters', []):
+            for meter in group['meters']:
                 m = dict(meter)
                 m['ip']   = group['ip']
                 m['port'] = group['port']
@@ -179,19 +459,14 @@ class ConfigService:
             >>>     print(config['ip'])
             >>>     print(config['sensors']['temp1_slave_id'])
         """
-        data = self.load_box_ips()
-        if not data:
+        snapshot = self._load_box_snapshot()
+        if snapshot is None or not snapshot[1]:
             return None
         
-        # 히트펌프에서 찾기
-        for device in data.get('heatpump', []):
-            if device['device_id'] == device_id:
-                return device
-        
-        # 지중배관에서 찾기
-        for device in data.get('groundpipe', []):
-            if device['device_id'] == device_id:
-                return device
+        _, data, index = snapshot
+        device = self._find_device(data, index, device_id)
+        if device is not None:
+            return device
         
         logger.warning(f"장치를 찾을 수 없음: {device_id}")
         return None
@@ -218,45 +493,28 @@ class ConfigService:
             >>> service.update_device_ip('HP_1', '192.168.1.150')
             >>> service.update_device_ip('GP_1', '192.168.1.200', 502)
         """
-        data = self.load_box_ips()
-        if not data:
+        snapshot = self._load_box_snapshot()
+        if snapshot is None or not snapshot[1]:
             logger.error("설정 파일을 로드할 수 없습니다.")
             return False
         
-        updated = False
-        
-        # 히트펌프에서 찾아서 업데이트
-        for device in data.get('heatpump', []):
-            if device['device_id'] == device_id:
-                old_ip = device['ip']
-                device['ip'] = new_ip
-                if new_port is not None:
-                    device['port'] = new_port
-                updated = True
-                logger.info(
-                    f"[{device_id}] IP 업데이트: {old_ip} → {new_ip}"
-                )
-                break
-        
-        # 지중배관에서 찾아서 업데이트
-        if not updated:
-            for device in data.get('groundpipe', []):
-                if device['device_id'] == device_id:
-                    old_ip = device['ip']
-                    device['ip'] = new_ip
-                    if new_port is not None:
-                        device['port'] = new_port
-                    updated = True
-                    logger.info(
-                        f"[{device_id}] IP 업데이트: {old_ip} → {new_ip}"
-                    )
-                    break
-        
-        if updated:
-            return self.save_box_ips(data)
-        else:
+        # 사본을 수정하되 인덱스는 같은 스냅샷 것을 사용
+        _, cached, index = snapshot
+        data = copy.deepcopy(cached)
+        device = self._find_device(data, index, device_id)
+        if device is None:
             logger.error(f"장치를 찾을 수 없음: {device_id}")
             return False
+        
+        old_ip = device['ip']
+        device['ip'] = new_ip
+        if new_port is not None:
+            device['port'] = new_port
+        logger.info(
+            f"[{device_id}] IP 업데이트: {old_ip} → {new_ip}"
+        )
+        
+        return self.save_box_ips(data)
     
     def update_device_slave_ids(
         self,
@@ -289,25 +547,19 @@ class ConfigService:
             >>>     flow_slave_id=12
             >>> )
         """
-        data = self.load_box_ips()
-        if not data:
+        snapshot = self._load_box_snapshot()
+        if snapshot is None or not snapshot[1]:
             logger.error("설정 파일을 로드할 수 없습니다.")
             return False
         
+        # 사본을 수정하되 인덱스는 같은 스냅샷 것을 사용
+        _, cached, index = snapshot
+        data = copy.deepcopy(cached)
+        
         updated = False
         
         # 업데이트할 장치 찾기
-        target_device = None
-        for device in data.get('heatpump', []):
-            if device['device_id'] == device_id:
-                target_device = device
-                break
-        
-        if not target_device:
-            for device in data.get('groundpipe', []):
-                if device['device_id'] == device_id:
-                    target_device = device
-                    break
+        target_device = self._find_device(data, index, device_id)
         
         if target_device:
             # sensors 키가 없으면 생성
@@ -351,19 +603,38 @@ class ConfigService:
         전력량계 설정 로드
         
         Returns:
-            dict: 설정 딕셔너리 (실패 시 None)
+            dict: 설정 딕셔너리 사본 (실패 시 None)
+        """
+        data = self._load_power_meter_config_cached()
+        return copy.deepcopy(data) if data is not None else None
+    
+    def _load_power_meter_config_cached(self) -> Optional[Dict[str, Any]]:
+        """
+        전력량계 설정 로드 (읽기 전용 캐시)
+        
+        반환값은 캐시 원본이므로 수정하지 마세요.
         """
         try:
-            if not self.power_meter_file.exists():
-                logger.warning(f"설정 파일 없음: {self.power_meter_file}")
-                return None
+            mtime = self.power_meter_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            logger.warning(f"설정 파일 없음: {self.power_meter_file}")
+            return None
+        
+        if self._pm_cache is not None and mtime == self._pm_mtime:
+            return self._pm_cache
+        
+        try:
+            data = _validate_power_meter(load_json_file(self.power_meter_file))
             
-            with open(self.power_meter_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            self._pm_cache = data
+            self._pm_mtime = mtime
             
             logger.debug(f"전력량계 설정 로드: {self.power_meter_file}")
             return data
             
+        except _EXPECTED_LOAD_ERRORS as e:
+            logger.error(f"전력량계 설정 로드 실패: {type(e).__name__}: {e}")
+            return None
         except Exception as e:
             logger.error(f"전력량계 설정 로드 실패: {e}", exc_info=True)
             return None
@@ -379,16 +650,23 @@ class ConfigService:
             bool: 저장 성공 시 True
         """
         try:
-            # 수정 시간 업데이트
-            data['last_updated'] = datetime.now().isoformat()
+            # 수정 시간 업데이트 (직렬화 전에 미리 계산, 같은 값이면 재기록 생략)
+            last_updated = _last_updated_stamp()
+            if data.get('last_updated') != last_updated:
+                data['last_updated'] = last_updated
+            
+            # JSON 저장 (원자적 교체)
+            _write_json_atomic(self.power_meter_file, data)
             
-            # JSON 저장
-            with open(self.power_meter_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 다음 조회 시 다시 읽도록 캐시 무효화
+            self._pm_cache = None
             
             logger.info(f"전력량계 설정 저장: {self.power_meter_file}")
             return True
             
+        except OSError as e:
+            logger.error(f"전력량계 설정 저장 실패: {type(e).__name__}: {e}")
+            return False
         except Exception as e:
             logger.error(f"전력량계 설정 저장 실패: {e}", exc_info=True)
             return False
@@ -409,10 +687,8 @@ class ConfigService:
         Returns:
             str: IP 주소 (기본값: 192.168.1.200)
         """
-        data = self.load_power_meter_config()
-        if data and 'ip' in data:
-            return data['ip']
-        return '192.168.1.200'
+        data = self._load_power_meter_config_cached()
+        return data['ip'] if data else '192.168.1.200'
     
     def get_power_meters(self) -> List[Dict[str, Any]]:
         """
@@ -421,10 +697,8 @@ class ConfigService:
         Returns:
             list: 전력량계 설정 리스트
         """
-        data = self.load_power_meter_config()
-        if data and 'meters' in data:
-            return data['meters']
-        return []
+        data = self._load_power_meter_config_cached()
+        return data['meters'] if data else []
     
     def update_power_meter_ip(self, new_ip: str, new_port: Optional[int] = None) -> bool:
         """
@@ -477,7 +751,7 @@ class ConfigService:
             return False
         
         updated = False
-        for meter in data.get('meters', []):
+        for meter in data['meters']:
             if meter['device_id'] == device_id:
                 old_slave_id = meter.get('slave_id', 'N/A')
                 meter['slave_id'] = new_slave_id
@@ -10,18 +10,205 @@
 - 전력량계 데이터 내보내기
 - 날짜 범위 지정
 - 장치별 파일 생성
+- 완성된 파일 순차 반환 (iter_export_*_data)
 """
 
-import csv
+import functools
+import gzip
+import io
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from core.database import execute_query
+from core.database import execute_query, get_db_connection, get_pool_maxconn
 
 logger = logging.getLogger(__name__)
 
+# 엑셀 호환용 UTF-8 BOM (COPY 출력은 bytes이므로 직접 기록)
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# 출력 파일 버퍼 크기 (COPY는 행마다 write하므로 크게 모아서 기록)
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# gzip 압축 레벨 (1: 가장 빠름, CSV는 중복이 많아 1로도 충분히 줄어듦)
+GZIP_COMPRESS_LEVEL = 1
+
+
+def _open_output(filepath: Path):
+    """
+    내보내기 출력 파일 열기 (바이너리 쓰기)
+    
+    확장자가 .gz면 gzip으로 압축하며, 어느 쪽이든 WRITE_BUFFER_SIZE 단위로 모아서 기록합니다.
+    """
+    if filepath.suffix == '.gz':
+        return io.BufferedWriter(
+            gzip.GzipFile(filepath, 'wb', compresslevel=GZIP_COMPRESS_LEVEL),
+            buffer_size=WRITE_BUFFER_SIZE
+        )
+    return open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE)
+
+# SELECT 컬럼 (CSV 헤더명 별칭, 포맷은 서버에서 처리)
+COL_DEVICE_ID = 'device_id AS "장치ID"'
+# (to_char 템플릿 해석 대신 초 단위 절삭 후 기본 ISO 출력 사용)
+COL_TIMESTAMP = "date_trunc('second', timestamp) AS \"측정시간\""
+# 소수 둘째 자리 고정: 형변환 한 번으로 반올림 + 자릿수 맞춤 (NULL은 COPY가 빈 칸으로 출력)
+COL_INPUT_TEMP = 'input_temp::numeric(18,2) AS "입구온도(°C)"'
+COL_OUTPUT_TEMP = 'output_temp::numeric(18,2) AS "출구온도(°C)"'
+COL_FLOW = 'flow::numeric(18,2) AS "유량(L)"'
+COL_ENERGY = 'energy::numeric(18,2) AS "누적전력량(kWh)"'
+COL_TOTAL_ENERGY = 'total_energy::numeric(18,2) AS "누적전력량(kWh)"'
+
+
+# 장치 목록 캐시 {테이블: (조회 시각(monotonic), device_id 목록)}
+_device_id_cache: Dict[str, Tuple[float, List[str]]] = {}
+DEVICE_ID_CACHE_TTL = 60.0  # 초
+
+# 장치별 파일 동시 내보내기 스레드 수 상한 (워커마다 DB 연결 1개 + 스냅샷 연결 1개 사용)
+EXPORT_MAX_WORKERS = 4
+
+# 내보내기 중에도 수집 INSERT / UI 조회용으로 남겨 둘 연결 수
+# (ThreadedConnectionPool은 빈 연결이 없으면 기다리지 않고 PoolError를 냄)
+EXPORT_POOL_RESERVE = 6
+
+# device_id 인덱스를 건너뛰며 고유 값만 찾는 쿼리 (loose index scan)
+# DISTINCT는 테이블 전체를 훑지만 이 방식은 장치 수만큼만 인덱스를 탐색
+_DEVICE_ID_QUERY = """
+    WITH RECURSIVE ids AS (
+        SELECT min(device_id) AS device_id FROM {table}
+        UNION ALL
+        SELECT (SELECT min(device_id) FROM {table} WHERE device_id > ids.device_id)
+        FROM ids
+        WHERE ids.device_id IS NOT NULL
+    )
+    SELECT device_id FROM ids WHERE device_id IS NOT NULL
+"""
+
+
+@dataclass(frozen=True)
+class ExportSchema:
+    """내보내기 대상 테이블 정의"""
+    table: str                  # DB 테이블명
+    prefix: str                 # 파일명 접두어
+    label: str                  # 로그용 이름
+    columns: Tuple[str, ...]    # 장치ID/측정시간 뒤에 붙는 SELECT 컬럼
+
+
+HEATPUMP_SCHEMA = ExportSchema(
+    table='heatpump',
+    prefix='heatpump',
+    label='히트펌프',
+    columns=(COL_INPUT_TEMP, COL_OUTPUT_TEMP, COL_FLOW, COL_ENERGY)
+)
+
+GROUNDPIPE_SCHEMA = ExportSchema(
+    table='groundpipe',
+    prefix='groundpipe',
+    label='지중배관',
+    columns=(COL_INPUT_TEMP, COL_OUTPUT_TEMP, COL_FLOW)
+)
+
+POWER_SCHEMA = ExportSchema(
+    table='elec',
+    prefix='power',
+    label='전력량계',
+    columns=(COL_TOTAL_ENERGY,)
+)
+
+# 내보내기 대상 테이블 (장치별 ORDER BY timestamp에 (device_id, timestamp) 인덱스 필요)
+EXPORT_TABLES = tuple(
+    schema.table for schema in (HEATPUMP_SCHEMA, GROUNDPIPE_SCHEMA, POWER_SCHEMA)
+)
+
+# (device_id, timestamp ...)로 시작하는 인덱스가 있는 테이블 조회
+# (DESC 인덱스도 역방향 스캔으로 ASC 정렬에 그대로 사용됨)
+_INDEX_CHECK_QUERY = """
+    SELECT DISTINCT tablename FROM pg_indexes
+    WHERE tablename = ANY(%s)
+      AND indexdef ILIKE '%%(device_id, "timestamp"%%'
+"""
+
+# 기간 조건 (항상 포함, None이면 ±infinity로 대체되어 조건이 무효화됨)
+# 쿼리 문자열이 날짜 지정 여부와 무관하게 고정되고, NULL이어도 인덱스 범위 조건으로 계획됨
+_DATE_RANGE = (
+    "timestamp >= COALESCE(%s::timestamp, '-infinity'::timestamp) "
+    "AND timestamp <= COALESCE(%s::timestamp, 'infinity'::timestamp)"
+)
+
+# 내보내기 쿼리 템플릿 (파라미터: 장치 ID(목록), 시작 날짜, 종료 날짜)
+_EXPORT_SQL_TEMPLATES = {
+    # 기간 내 데이터가 있는 장치만 (입력 순서 유지)
+    'active_devices': """
+        SELECT d.device_id
+        FROM unnest(%s::varchar[]) WITH ORDINALITY AS d(device_id, ord)
+        WHERE EXISTS (
+            SELECT 1 FROM {table} t
+            WHERE t.device_id = d.device_id AND {date_range}
+        )
+        ORDER BY d.ord
+    """,
+    # 여러 장치를 하나의 파일로
+    # (unnest 조인으로 장치마다 (device_id, timestamp) 인덱스를 탐색)
+    'single_file': """
+        SELECT {device_id}, {timestamp}, {columns}
+        FROM unnest(%s::varchar[]) AS d(device_id)
+        JOIN {table} USING (device_id)
+        WHERE {date_range}
+        ORDER BY device_id, timestamp ASC
+    """,
+    # 한 장치를 장치별 파일로
+    'device_file': """
+        SELECT {timestamp}, {columns}
+        FROM {table}
+        WHERE device_id = %s AND {date_range}
+        ORDER BY timestamp ASC
+    """,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _export_sql(schema: ExportSchema, kind: str) -> str:
+    """
+    테이블별 내보내기 쿼리 (최초 1회 생성 후 재사용)
+    
+    Args:
+        schema: 내보낼 테이블 정의
+        kind: 'active_devices' / 'single_file' / 'device_file'
+    """
+    return _EXPORT_SQL_TEMPLATES[kind].format(
+        table=schema.table,
+        device_id=COL_DEVICE_ID,
+        timestamp=COL_TIMESTAMP,
+        columns=', '.join(schema.columns),
+        date_range=_DATE_RANGE
+    )
+
+
+def _get_device_ids(table: str, ttl: float = DEVICE_ID_CACHE_TTL) -> List[str]:
+    """
+    테이블의 장치 ID 목록 조회 (TTL 캐시)
+    
+    Args:
+        table: 'heatpump' / 'groundpipe' / 'elec'
+        ttl: 캐시 유효 시간 (초)
+    
+    Returns:
+        list: device_id 목록 (정렬됨)
+    """
+    now = time.monotonic()
+    cached = _device_id_cache.get(table)
+    if cached is not None and now - cached[0] < ttl:
+        return list(cached[1])
+    
+    result = execute_query(_DEVICE_ID_QUERY.format(table=table), fetch_mode='all_tuples')
+    device_ids = [device_id for (device_id,) in result]
+    _device_id_cache[table] = (now, device_ids)
+    return list(device_ids)
+
 
 class CSVExportService:
     """CSV 내보내기 서비스"""
@@ -29,273 +216,331 @@ class CSVExportService:
     def __init__(self):
         """초기화"""
         logger.info("CSVExportService 초기화")
+        self._check_indexes()
     
-    def export_heatpump_data(
-        self,
-        output_dir: str,
-        device_ids: Optional[List[str]] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        single_file: bool = False
-    ) -> dict:
+    def _check_indexes(self) -> List[str]:
         """
-        히트펌프 데이터 CSV 내보내기
+        (device_id, timestamp) 복합 인덱스 존재 확인
         
-        Args:
-            output_dir: 출력 디렉토리
-            device_ids: 장치 ID 리스트 (None이면 전체)
-            start_date: 시작 날짜 (None이면 전체)
-            end_date: 종료 날짜 (None이면 전체)
-            single_file: True면 하나의 파일로, False면 장치별 파일로
+        인덱스가 없으면 장치별 내보내기마다 메모리 정렬이 발생하므로 경고만 남깁니다.
         
         Returns:
-            dict: {'success': bool, 'files': List[str], 'total_rows': int}
+            list: 인덱스가 없는 테이블 목록 (확인 실패 시 빈 리스트)
         """
         try:
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-            # 장치 목록 조회
-            if device_ids is None:
-                query = "SELECT DISTINCT device_id FROM heatpump ORDER BY device_id"
-                result = execute_query(query, fetch_mode='all')
-                device_ids = [row['device_id'] for row in result]
-            
-            if not device_ids:
-                logger.warning("내보낼 히트펌프 장치가 없습니다.")
-                return {'success': False, 'files': [], 'total_rows': 0}
-            
-            exported_files = []
-            total_rows = 0
-            
-            if single_file:
-                # 하나의 파일로 내보내기
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f'heatpump_all_{timestamp}.csv'
-                filepath = output_path / filename
-                
-                rows = self._export_heatpump_single_file(
-                    filepath, device_ids, start_date, end_date
-                )
-                
-                if rows > 0:
-                    exported_files.append(str(filepath))
-                    total_rows += rows
-            else:
-                # 장치별 파일로 내보내기
-                for device_id in device_ids:
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    filename = f'heatpump_{device_id}_{timestamp}.csv'
-                    filepath = output_path / filename
-                    
-                    rows = self._export_heatpump_device_file(
-                        filepath, device_id, start_date, end_date
-                    )
-                    
-                    if rows > 0:
-                        exported_files.append(str(filepath))
-                        total_rows += rows
-            
-            logger.info(f"히트펌프 데이터 내보내기 완료: {len(exported_files)}개 파일, {total_rows}행")
-            
-            return {
-                'success': True,
-                'files': exported_files,
-                'total_rows': total_rows
-            }
+            result = execute_query(
+                _INDEX_CHECK_QUERY, (list(EXPORT_TABLES),), fetch_mode='all_tuples'
+            )
+        except Exception as e:
+            logger.warning(f"내보내기 인덱스 확인 실패: {e}")
+            return []
+        
+        indexed = {tablename for (tablename,) in result}
+        missing = [table for table in EXPORT_TABLES if table not in indexed]
+        for table in missing:
+            logger.warning(
+                f"{table} 테이블에 (device_id, timestamp) 인덱스가 없습니다 - "
+                f"내보내기 시 메모리 정렬 발생 (ensure_indexes()로 생성 가능)"
+            )
+        return missing
+    
+    def ensure_indexes(self) -> bool:
+        """
+        누락된 (device_id, timestamp) 인덱스 생성 (운영 중 유지보수용)
+        
+        CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로
+        autocommit 연결에서 실행하며, 쓰기를 막지 않고 생성됩니다.
+        
+        Returns:
+            bool: 성공 여부
+        """
+        missing = self._check_indexes()
+        if not missing:
+            return True
+        
+        try:
+            with get_db_connection() as conn:
+                conn.autocommit = True
+                try:
+                    with conn.cursor() as cur:
+                        for table in missing:
+                            cur.execute(
+                                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                                f"idx_{table}_device_timestamp "
+                                f"ON {table}(device_id, timestamp DESC)"
+                            )
+                            logger.info(f"{table} (device_id, timestamp) 인덱스 생성 완료")
+                finally:
+                    conn.autocommit = False
+            return True
         
         except Exception as e:
-            logger.error(f"히트펌프 데이터 내보내기 실패: {e}", exc_info=True)
-            return {'success': False, 'files': [], 'total_rows': 0}
+            logger.error(f"내보내기 인덱스 생성 실패: {e}", exc_info=True)
+            return False
     
-    def _export_heatpump_single_file(
-        self,
-        filepath: Path,
-        device_ids: List[str],
-        start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> int:
-        """히트펌프 데이터를 하나의 파일로 내보내기"""
-        query = """
-            SELECT 
-                device_id,
-                timestamp,
-                input_temp,
-                output_temp,
-                flow,
-                energy
-            FROM heatpump
-            WHERE device_id = ANY(%s)
+    def invalidate_device_cache(self):
+        """장치 목록 캐시 초기화 (장치 추가/삭제 후 호출)"""
+        _device_id_cache.clear()
+    
+    @contextmanager
+    def _snapshot_connection(self, snapshot_id: Optional[str] = None):
         """
-        params = [device_ids]
+        내보내기용 연결 (REPEATABLE READ READ ONLY 트랜잭션 1개)
         
-        if start_date:
-            query += " AND timestamp >= %s"
-            params.append(start_date)
+        Args:
+            snapshot_id: pg_export_snapshot() 값. 주면 해당 스냅샷을 그대로 사용
+                (병렬 워커들이 같은 시점의 데이터를 보도록 함)
+        """
+        with get_db_connection() as conn:
+            # COPY 출력 bytes를 UTF-8로 받기 위해 클라이언트 인코딩 고정
+            if conn.encoding != 'UTF8':
+                conn.set_client_encoding('UTF8')
+            
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY"
+                    )
+                    if snapshot_id:
+                        cur.execute("SET TRANSACTION SNAPSHOT %s", (snapshot_id,))
+                    # 측정시간을 'YYYY-MM-DD HH:MM:SS'로 출력 (트랜잭션 종료 시 원복)
+                    cur.execute("SET LOCAL DateStyle TO 'ISO, YMD'")
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def _copy_to_csv(self, conn, filepath: Path, query: str, params: tuple) -> int:
+        """
+        SELECT 결과를 COPY TO STDOUT으로 파일에 바로 스트리밍
         
-        if end_date:
-            query += " AND timestamp <= %s"
-            params.append(end_date)
+        행 변환/포맷은 서버에서 처리하므로 Python 행 루프가 없습니다.
+        결과가 0행이면 파일을 남기지 않습니다.
         
-        query += " ORDER BY device_id, timestamp ASC"
+        Args:
+            conn: _snapshot_connection()으로 연 연결
+            filepath: 출력 파일 경로
+            query: SELECT 쿼리 (컬럼 별칭이 CSV 헤더가 됨)
+            params: 쿼리 파라미터
         
-        data = execute_query(query, tuple(params), fetch_mode='all')
+        Returns:
+            int: 내보낸 행 수 (헤더 제외)
+        """
+        try:
+            with conn.cursor() as cur:
+                sql = cur.mogrify(query, params).decode('utf-8')
+                with _open_output(filepath) as f:
+                    f.write(UTF8_BOM)
+                    cur.copy_expert(
+                        f"COPY ({sql}) TO STDOUT WITH (FORMAT CSV, HEADER TRUE)",
+                        f
+                    )
+                rows = cur.rowcount
+        except Exception:
+            filepath.unlink(missing_ok=True)
+            raise
         
-        if not data:
+        if rows <= 0:
+            filepath.unlink(missing_ok=True)
             return 0
         
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
+        return rows
+    
+    def _iter_device_files(
+        self,
+        output_path: Path,
+        schema: ExportSchema,
+        device_ids: List[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        timestamp: str,
+        ext: str = '.csv'
+    ) -> Iterator[Tuple[Path, int]]:
+        """
+        장치별 파일 병렬 내보내기 (완료되는 순서대로 반환)
+        
+        스냅샷을 하나 만들어 내보내고(pg_export_snapshot), 각 워커는 자기 연결에서
+        그 스냅샷을 가져와 COPY하므로 파일 간 데이터 시점이 일치합니다.
+        
+        Args:
+            output_path: 출력 디렉토리
+            schema: 내보낼 테이블 정의
+            device_ids: 장치 ID 리스트
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            timestamp: 파일명에 붙일 내보내기 시각 (전체 파일 공통)
+            ext: 파일 확장자 ('.csv' 또는 '.csv.gz')
+        
+        Yields:
+            tuple: (생성된 파일 경로, 행 수)
+        """
+        def export_one(device_id: str, filepath: Path) -> Tuple[Path, int]:
+            with self._snapshot_connection(snapshot_id) as conn:
+                rows = self._export_device_file(
+                    conn, filepath, schema, device_id, start_date, end_date
+                )
+            return filepath, rows
+        
+        # 스냅샷 기준 트랜잭션은 워커가 모두 끝날 때까지 열어 둠
+        with self._snapshot_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT pg_export_snapshot()")
+                snapshot_id = cur.fetchone()[0]
             
-            # 헤더
-            writer.writerow([
-                '장치ID',
-                '측정시간',
-                '입구온도(°C)',
-                '출구온도(°C)',
-                '유량(L)',
-                '누적전력량(kWh)'
-            ])
+            # 기간 내 데이터가 있는 장치만 내보내기 (같은 스냅샷이므로 빈 파일 없음)
+            device_ids = self._filter_active_devices(
+                conn, schema, device_ids, start_date, end_date
+            )
+            if not device_ids:
+                return
             
-            # 데이터
-            for row in data:
-                writer.writerow([
-                    row['device_id'],
-                    row['timestamp'].strftime('%Y-%m-%d %H:%M:%S') if row['timestamp'] else '',
-                    f"{row['input_temp']:.2f}" if row['input_temp'] is not None else '',
-                    f"{row['output_temp']:.2f}" if row['output_temp'] is not None else '',
-                    f"{row['flow']:.2f}" if row['flow'] is not None else '',
-                    f"{row['energy']:.2f}" if row['energy'] is not None else ''
-                ])
-        
-        return len(data)
+            # 풀 크기 - 스냅샷 연결 - 예비분 만큼만 워커 사용 (최소 1개)
+            max_workers = max(1, min(
+                EXPORT_MAX_WORKERS,
+                len(device_ids),
+                get_pool_maxconn() - 1 - EXPORT_POOL_RESERVE
+            ))
+            with ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix='CSVExport'
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        export_one, device_id,
+                        output_path / f'{schema.prefix}_{device_id}_{timestamp}{ext}'
+                    )
+                    for device_id in device_ids
+                ]
+                try:
+                    for future in as_completed(futures):
+                        filepath, rows = future.result()
+                        if rows > 0:
+                            yield filepath, rows
+                finally:
+                    # 중간에 중단되면 시작 전인 작업은 취소
+                    for future in futures:
+                        future.cancel()
     
-    def _export_heatpump_device_file(
+    def _filter_active_devices(
         self,
-        filepath: Path,
-        device_id: str,
+        conn,
+        schema: ExportSchema,
+        device_ids: List[str],
         start_date: Optional[datetime],
         end_date: Optional[datetime]
-    ) -> int:
-        """히트펌프 데이터를 장치별 파일로 내보내기"""
-        query = """
-            SELECT 
-                timestamp,
-                input_temp,
-                output_temp,
-                flow,
-                energy
-            FROM heatpump
-            WHERE device_id = %s
+    ) -> List[str]:
         """
-        params = [device_id]
+        기간 내 데이터가 있는 장치만 조회 (쿼리 1회)
         
-        if start_date:
-            query += " AND timestamp >= %s"
-            params.append(start_date)
+        장치마다 (device_id, timestamp) 인덱스에서 첫 행만 확인하므로
+        빈 장치에 COPY 쿼리를 보내지 않습니다.
         
-        if end_date:
-            query += " AND timestamp <= %s"
-            params.append(end_date)
+        Returns:
+            list: 데이터가 있는 장치 ID (입력 순서 유지)
+        """
+        with conn.cursor() as cur:
+            cur.execute(
+                _export_sql(schema, 'active_devices'),
+                (list(device_ids), start_date, end_date)
+            )
+            return [device_id for (device_id,) in cur.fetchall()]
+    
+    def _iter_export(
+        self,
+        schema: ExportSchema,
+        output_dir: str,
+        device_ids: Optional[List[str]],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        single_file: bool,
+        compress: bool
+    ) -> Iterator[Tuple[Path, int]]:
+        """
+        테이블 데이터 CSV 내보내기 (iter_export_*_data 공통 처리)
+        
+        파일이 완성될 때마다 바로 반환하므로 호출 측에서 진행률 표시나
+        후속 처리를 전체 완료 전에 시작할 수 있습니다.
         
-        query += " ORDER BY timestamp ASC"
+        Args:
+            schema: 내보낼 테이블 정의
+            나머지: export_heatpump_data 참고
+        
+        Yields:
+            tuple: (생성된 파일 경로, 행 수) - 0행 파일은 만들지 않음
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
         
-        data = execute_query(query, tuple(params), fetch_mode='all')
+        # 내보내기 시각 (이번 내보내기의 모든 파일명에 공통 사용)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        ext = '.csv.gz' if compress else '.csv'
         
-        if not data:
-            return 0
+        # 장치 목록 조회
+        if device_ids is None:
+            device_ids = _get_device_ids(schema.table)
         
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
+        if not device_ids:
+            return
+        
+        if single_file:
+            # 하나의 파일로 내보내기
+            filepath = output_path / f'{schema.prefix}_all_{timestamp}{ext}'
             
-            # 헤더
-            writer.writerow([
-                '측정시간',
-                '입구온도(°C)',
-                '출구온도(°C)',
-                '유량(L)',
-                '누적전력량(kWh)'
-            ])
+            with self._snapshot_connection() as conn:
+                rows = self._export_single_file(
+                    conn, filepath, schema, device_ids, start_date, end_date
+                )
             
-            # 데이터
-            for row in data:
-                writer.writerow([
-                    row['timestamp'].strftime('%Y-%m-%d %H:%M:%S') if row['timestamp'] else '',
-                    f"{row['input_temp']:.2f}" if row['input_temp'] is not None else '',
-                    f"{row['output_temp']:.2f}" if row['output_temp'] is not None else '',
-                    f"{row['flow']:.2f}" if row['flow'] is not None else '',
-                    f"{row['energy']:.2f}" if row['energy'] is not None else ''
-                ])
-        
-        return len(data)
+            if rows > 0:
+                yield filepath, rows
+        else:
+            # 장치별 파일로 내보내기 (같은 스냅샷으로 병렬 처리)
+            yield from self._iter_device_files(
+                output_path, schema, device_ids, start_date, end_date,
+                timestamp, ext
+            )
     
-    def export_groundpipe_data(
+    def _export_data(
         self,
+        schema: ExportSchema,
         output_dir: str,
-        device_ids: Optional[List[str]] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        single_file: bool = False
+        device_ids: Optional[List[str]],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        single_file: bool,
+        compress: bool
     ) -> dict:
         """
-        지중배관 데이터 CSV 내보내기
+        테이블 데이터 CSV 내보내기 (export_*_data 공통 처리)
         
         Args:
-            output_dir: 출력 디렉토리
-            device_ids: 장치 ID 리스트 (None이면 전체)
-            start_date: 시작 날짜 (None이면 전체)
-            end_date: 종료 날짜 (None이면 전체)
-            single_file: True면 하나의 파일로, False면 장치별 파일로
+            schema: 내보낼 테이블 정의
+            나머지: export_heatpump_data 참고
         
         Returns:
             dict: {'success': bool, 'files': List[str], 'total_rows': int}
         """
         try:
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-            
             # 장치 목록 조회
             if device_ids is None:
-                query = "SELECT DISTINCT device_id FROM groundpipe ORDER BY device_id"
-                result = execute_query(query, fetch_mode='all')
-                device_ids = [row['device_id'] for row in result]
+                device_ids = _get_device_ids(schema.table)
             
             if not device_ids:
-                logger.warning("내보낼 지중배관 장치가 없습니다.")
+                logger.warning(f"내보낼 {schema.label} 장치가 없습니다.")
                 return {'success': False, 'files': [], 'total_rows': 0}
             
             exported_files = []
             total_rows = 0
             
-            if single_file:
-                # 하나의 파일로 내보내기
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f'groundpipe_all_{timestamp}.csv'
-                filepath = output_path / filename
-                
-                rows = self._export_groundpipe_single_file(
-                    filepath, device_ids, start_date, end_date
-                )
-                
-                if rows > 0:
-                    exported_files.append(str(filepath))
-                    total_rows += rows
-            else:
-                # 장치별 파일로 내보내기
-                for device_id in device_ids:
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    filename = f'groundpipe_{device_id}_{timestamp}.csv'
-                    filepath = output_path / filename
-                    
-                    rows = self._export_groundpipe_device_file(
-                        filepath, device_id, start_date, end_date
-                    )
-                    
-                    if rows > 0:
-                        exported_files.append(str(filepath))
-                        total_rows += rows
+            for filepath, rows in self._iter_export(
+                schema, output_dir, device_ids, start_date, end_date,
+                single_file, compress
+            ):
+                exported_files.append(str(filepath))
+                total_rows += rows
             
-            logger.info(f"지중배관 데이터 내보내기 완료: {len(exported_files)}개 파일, {total_rows}행")
+            logger.info(f"{schema.label} 데이터 내보내기 완료: {len(exported_files)}개 파일, {total_rows}행")
             
             return {
                 'success': True,
@@ -304,123 +549,96 @@ class CSVExportService:
             }
         
         except Exception as e:
-            logger.error(f"지중배관 데이터 내보내기 실패: {e}", exc_info=True)
+            logger.error(f"{schema.label} 데이터 내보내기 실패: {e}", exc_info=True)
             return {'success': False, 'files': [], 'total_rows': 0}
     
-    def _export_groundpipe_single_file(
+    def _export_single_file(
         self,
+        conn,
         filepath: Path,
+        schema: ExportSchema,
         device_ids: List[str],
         start_date: Optional[datetime],
         end_date: Optional[datetime]
     ) -> int:
-        """지중배관 데이터를 하나의 파일로 내보내기"""
-        query = """
-            SELECT 
-                device_id,
-                timestamp,
-                input_temp,
-                output_temp,
-                flow
-            FROM groundpipe
-            WHERE device_id = ANY(%s)
-        """
-        params = [device_ids]
-        
-        if start_date:
-            query += " AND timestamp >= %s"
-            params.append(start_date)
-        
-        if end_date:
-            query += " AND timestamp <= %s"
-            params.append(end_date)
-        
-        query += " ORDER BY device_id, timestamp ASC"
-        
-        data = execute_query(query, tuple(params), fetch_mode='all')
+        """여러 장치 데이터를 하나의 파일로 내보내기"""
+        # 중복 장치 ID는 조인 시 행이 중복되므로 제거
+        params = (list(dict.fromkeys(device_ids)), start_date, end_date)
         
-        if not data:
-            return 0
-        
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
-            
-            # 헤더
-            writer.writerow([
-                '장치ID',
-                '측정시간',
-                '입구온도(°C)',
-                '출구온도(°C)',
-                '유량(L)'
-            ])
-            
-            # 데이터
-            for row in data:
-                writer.writerow([
-                    row['device_id'],
-                    row['timestamp'].strftime('%Y-%m-%d %H:%M:%S') if row['timestamp'] else '',
-                    f"{row['input_temp']:.2f}" if row['input_temp'] is not None else '',
-                    f"{row['output_temp']:.2f}" if row['output_temp'] is not None else '',
-                    f"{row['flow']:.2f}" if row['flow'] is not None else ''
-                ])
-        
-        return len(data)
+        return self._copy_to_csv(
+            conn, filepath, _export_sql(schema, 'single_file'), params
+        )
     
-    def _export_groundpipe_device_file(
+    def _export_device_file(
         self,
+        conn,
         filepath: Path,
+        schema: ExportSchema,
         device_id: str,
         start_date: Optional[datetime],
         end_date: Optional[datetime]
     ) -> int:
-        """지중배관 데이터를 장치별 파일로 내보내기"""
-        query = """
-            SELECT 
-                timestamp,
-                input_temp,
-                output_temp,
-                flow
-            FROM groundpipe
-            WHERE device_id = %s
+        """한 장치 데이터를 장치별 파일로 내보내기"""
+        return self._copy_to_csv(
+            conn, filepath, _export_sql(schema, 'device_file'),
+            (device_id, start_date, end_date)
+        )
+    
+    def export_heatpump_data(
+        self,
+        output_dir: str,
+        device_ids: Optional[List[str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        single_file: bool = False,
+        compress: bool = False
+    ) -> dict:
         """
-        params = [device_id]
-        
-        if start_date:
-            query += " AND timestamp >= %s"
-            params.append(start_date)
-        
-        if end_date:
-            query += " AND timestamp <= %s"
-            params.append(end_date)
+        히트펌프 데이터 CSV 내보내기
         
-        query += " ORDER BY timestamp ASC"
+        Args:
+            output_dir: 출력 디렉토리
+            device_ids: 장치 ID 리스트 (None이면 전체)
+            start_date: 시작 날짜 (None이면 전체)
+            end_date: 종료 날짜 (None이면 전체)
+            single_file: True면 하나의 파일로, False면 장치별 파일로
+            compress: True면 gzip 압축 (*.csv.gz)
         
-        data = execute_query(query, tuple(params), fetch_mode='all')
+        Returns:
+            dict: {'success': bool, 'files': List[str], 'total_rows': int}
+        """
+        return self._export_data(
+            HEATPUMP_SCHEMA, output_dir, device_ids, start_date, end_date,
+            single_file, compress
+        )
+    
+    def export_groundpipe_data(
+        self,
+        output_dir: str,
+        device_ids: Optional[List[str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        single_file: bool = False,
+        compress: bool = False
+    ) -> dict:
+        """
+        지중배관 데이터 CSV 내보내기
         
-        if not data:
-            return 0
+        Args:
+            output_dir: 출력 디렉토리
+            device_ids: 장치 ID 리스트 (None이면 전체)
+            start_date: 시작 날짜 (None이면 전체)
+            end_date: 종료 날짜 (None이면 전체)
+            single_file: True면 하나의 파일로, False면 장치별 파일로
+            compress: True면 gzip 압축 (*.csv.gz)
         
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
-            
-            # 헤더
-            writer.writerow([
-                '측정시간',
-                '입구온도(°C)',
-                '출구온도(°C)',
-                '유량(L)'
-            ])
-            
-            # 데이터
-            for row in data:
-                writer.writerow([
-                    row['timestamp'].strftime('%Y-%m-%d %H:%M:%S') if row['timestamp'] else '',
-                    f"{row['input_temp']:.2f}" if row['input_temp'] is not None else '',
-                    f"{row['output_temp']:.2f}" if row['output_temp'] is not None else '',
-                    f"{row['flow']:.2f}" if row['flow'] is not None else ''
-                ])
-        
-        return len(data)
+        Returns:
+            dict: {'success': bool, 'files': List[str], 'total_rows': int}
+        """
+        return self._export_data(
+            GROUNDPIPE_SCHEMA, output_dir, device_ids, start_date, end_date,
+            single_file, compress
+        )
     
     def export_power_meter_data(
         self,
@@ -428,7 +646,8 @@ class CSVExportService:
         device_ids: Optional[List[str]] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        single_file: bool = False
+        single_file: bool = False,
+        compress: bool = False
     ) -> dict:
         """
         전력량계 데이터 CSV 내보내기
@@ -439,170 +658,82 @@ class CSVExportService:
             start_date: 시작 날짜 (None이면 전체)
             end_date: 종료 날짜 (None이면 전체)
             single_file: True면 하나의 파일로, False면 장치별 파일로
+            compress: True면 gzip 압축 (*.csv.gz)
         
         Returns:
             dict: {'success': bool, 'files': List[str], 'total_rows': int}
         """
-        try:
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-            # 장치 목록 조회
-            if device_ids is None:
-                query = "SELECT DISTINCT device_id FROM elec ORDER BY device_id"
-                result = execute_query(query, fetch_mode='all')
-                device_ids = [row['device_id'] for row in result]
-            
-            if not device_ids:
-                logger.warning("내보낼 전력량계 장치가 없습니다.")
-                return {'success': False, 'files': [], 'total_rows': 0}
-            
-            exported_files = []
-            total_rows = 0
-            
-            if single_file:
-                # 하나의 파일로 내보내기
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f'power_all_{timestamp}.csv'
-                filepath = output_path / filename
-                
-                rows = self._export_power_single_file(
-                    filepath, device_ids, start_date, end_date
-                )
-                
-                if rows > 0:
-                    exported_files.append(str(filepath))
-                    total_rows += rows
-            else:
-                # 장치별 파일로 내보내기
-                for device_id in device_ids:
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    filename = f'power_{device_id}_{timestamp}.csv'
-                    filepath = output_path / filename
-                    
-                    rows = self._export_power_device_file(
-                        filepath, device_id, start_date, end_date
-                    )
-                    
-                    if rows > 0:
-                        exported_files.append(str(filepath))
-                        total_rows += rows
-            
-            logger.info(f"전력량계 데이터 내보내기 완료: {len(exported_files)}개 파일, {total_rows}행")
-            
-            return {
-                'success': True,
-                'files': exported_files,
-                'total_rows': total_rows
-            }
-        
-        except Exception as e:
-            logger.error(f"전력량계 데이터 내보내기 실패: {e}", exc_info=True)
-            return {'success': False, 'files': [], 'total_rows': 0}
+        return self._export_data(
+            POWER_SCHEMA, output_dir, device_ids, start_date, end_date,
+            single_file, compress
+        )
+
     
-    def _export_power_single_file(
+    def iter_export_heatpump_data(
         self,
-        filepath: Path,
-        device_ids: List[str],
-        start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> int:
-        """전력량계 데이터를 하나의 파일로 내보내기"""
-        query = """
-            SELECT 
-                device_id,
-                timestamp,
-                total_energy
-            FROM elec
-            WHERE device_id = ANY(%s)
+        output_dir: str,
+        device_ids: Optional[List[str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        single_file: bool = False,
+        compress: bool = False
+    ) -> Iterator[Tuple[Path, int]]:
         """
-        params = [device_ids]
-        
-        if start_date:
-            query += " AND timestamp >= %s"
-            params.append(start_date)
+        히트펌프 데이터 CSV 내보내기 (파일이 완성될 때마다 반환)
         
-        if end_date:
-            query += " AND timestamp <= %s"
-            params.append(end_date)
+        Args: export_heatpump_data 참고
         
-        query += " ORDER BY device_id, timestamp ASC"
-        
-        data = execute_query(query, tuple(params), fetch_mode='all')
-        
-        if not data:
-            return 0
-        
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
-            
-            # 헤더
-            writer.writerow([
-                '장치ID',
-                '측정시간',
-                '누적전력량(kWh)'
-            ])
-            
-            # 데이터
-            for row in data:
-                writer.writerow([
-                    row['device_id'],
-                    row['timestamp'].strftime('%Y-%m-%d %H:%M:%S') if row['timestamp'] else '',
-                    f"{row['total_energy']:.2f}" if row['total_energy'] is not None else ''
-                ])
-        
-        return len(data)
+        Yields:
+            tuple: (생성된 파일 경로, 행 수) - 장치별 파일은 완료 순서
+        """
+        return self._iter_export(
+            HEATPUMP_SCHEMA, output_dir, device_ids, start_date, end_date,
+            single_file, compress
+        )
     
-    def _export_power_device_file(
+    def iter_export_groundpipe_data(
         self,
-        filepath: Path,
-        device_id: str,
-        start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> int:
-        """전력량계 데이터를 장치별 파일로 내보내기"""
-        query = """
-            SELECT 
-                timestamp,
-                total_energy
-            FROM elec
-            WHERE device_id = %s
+        output_dir: str,
+        device_ids: Optional[List[str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        single_file: bool = False,
+        compress: bool = False
+    ) -> Iterator[Tuple[Path, int]]:
         """
-        params = [device_id]
+        지중배관 데이터 CSV 내보내기 (파일이 완성될 때마다 반환)
         
-        if start_date:
-            query += " AND timestamp >= %s"
-            params.append(start_date)
+        Args: export_groundpipe_data 참고
         
-        if end_date:
-            query += " AND timestamp <= %s"
-            params.append(end_date)
-        
-        query += " ORDER BY timestamp ASC"
-        
-        data = execute_query(query, tuple(params), fetch_mode='all')
-        
-        if not data:
-            return 0
+        Yields:
+            tuple: (생성된 파일 경로, 행 수) - 장치별 파일은 완료 순서
+        """
+        return self._iter_export(
+            GROUNDPIPE_SCHEMA, output_dir, device_ids, start_date, end_date,
+            single_file, compress
+        )
+    
+    def iter_export_power_meter_data(
+        self,
+        output_dir: str,
+        device_ids: Optional[List[str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        single_file: bool = False,
+        compress: bool = False
+    ) -> Iterator[Tuple[Path, int]]:
+        """
+        전력량계 데이터 CSV 내보내기 (파일이 완성될 때마다 반환)
         
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
-            
-            # 헤더
-            writer.writerow([
-                '측정시간',
-                '누적전력량(kWh)'
-            ])
-            
-            # 데이터
-            for row in data:
-                writer.writerow([
-                    row['timestamp'].strftime('%Y-%m-%d %H:%M:%S') if row['timestamp'] else '',
-                    f"{row['total_energy']:.2f}" if row['total_energy'] is not None else ''
-                ])
+        Args: export_power_meter_data 참고
         
-        return len(data)
-
+        Yields:
+            tuple: (생성된 파일 경로, 행 수) - 장치별 파일은 완료 순서
+        """
+        return self._iter_export(
+            POWER_SCHEMA, output_dir, device_ids, start_date, end_date,
+            single_file, compress
+        )
 
 # ==============================================
 # 테스트 코드
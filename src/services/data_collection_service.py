@@ -16,21 +16,29 @@ import logging
 import threading
 import time
 import sys
-from typing import Optional, Dict, Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import TYPE_CHECKING, Optional, Dict, Callable
 from datetime import datetime
 
-from sensors.box.service import BoxSensorService
-from sensors.power.service import PowerMeterService
 from services.remote_sync_service import RemoteSyncService
 from services.alarm_service import AlarmService
 from core.config import get_config
 from core.database import get_queue_count
 
+if TYPE_CHECKING:
+    from sensors.box.service import BoxSensorService
+    from sensors.power.service import PowerMeterService
+
 logger = logging.getLogger(__name__)
 
 # Watchdog 임계값 — 이 시간(초) 동안 수집이 없으면 루프 재시작
 WATCHDOG_TIMEOUT = 300   # 5분
 MAX_RESTART_COUNT = 10   # 최대 자동 재시작 횟수
+MAX_BACKOFF_FACTOR = 10  # 연속 실패 시 대기 상한 (수집 주기의 배수)
+
+# 로그 구분선 (매 수집마다 새로 만들지 않도록 한 번만 생성)
+_SEP = "=" * 70
 
 
 class DataCollectionService:
@@ -39,14 +47,21 @@ class DataCollectionService:
     def __init__(self):
         self.config = get_config()
 
-        self.power_meter_service = PowerMeterService()
-        self.box_sensor_service  = BoxSensorService()
+        # 센서 서비스는 Modbus 드라이버를 끌어오므로 처음 쓸 때 생성 (_ensure_services)
+        self.power_meter_service: Optional['PowerMeterService'] = None
+        self.box_sensor_service: Optional['BoxSensorService'] = None
+        self._services_lock = threading.Lock()
         self.remote_sync_service = RemoteSyncService()
         self.alarm_service       = AlarmService.get_instance()
 
+        # 전력량계 수집을 박스 센서 수집과 동시에 돌리는 전용 워커 (stop() 시 종료)
+        self._executor = self._new_executor()
+        self._executor_closed = False
+
         self._thread: Optional[threading.Thread] = None
         self._watchdog_thread: Optional[threading.Thread] = None
         self._stop_event   = threading.Event()
+        self._trigger_event = threading.Event()   # 수동 수집 요청 / 중지 시 대기 해제
         self._running      = False
         self.interval      = 60
 
@@ -54,16 +69,18 @@ class DataCollectionService:
         self._last_collection_time: Optional[float] = None
         self._restart_count = 0
 
-        # 통계
-        self.stats = {
-            'total_collections': 0,
-            'successful_collections': 0,
-            'failed_collections': 0,
-            'last_collection_time': None,
-            'last_success_time': None,
-            'last_error': None,
-            'restart_count': 0,
-        }
+        # 통계 (get_stats()에서 dict로 변환, 시각은 epoch 초로 보관)
+        self._total_collections = 0
+        self._successful_collections = 0
+        self._failed_collections = 0
+        self._last_collection_at: Optional[float] = None
+        self._last_success_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._consecutive_failures = 0   # 연속 실패 횟수 (재시도 간격 백오프용)
+
+        # 최근 수집한 전력량 {device_id: kWh} (UI 조회용, DB 조회 없이 제공)
+        self._latest_power_data: Optional[Dict] = None
+        self._latest_lock = threading.Lock()
 
         self.on_collection_complete: Optional[Callable] = None
         self.on_collection_error: Optional[Callable] = None
@@ -100,16 +117,44 @@ class DataCollectionService:
         threading.excepthook = handle_thread_exception
         logger.info("전역 예외 핸들러 등록 완료")
 
+    # ─────────────────────────────────────────
+    # 센서 서비스 지연 생성
+    # ─────────────────────────────────────────
+    def _ensure_services(self):
+        """전력량계 / 박스 센서 서비스를 처음 필요할 때 import 후 생성"""
+        if self.box_sensor_service is not None:
+            return
+        with self._services_lock:
+            if self.box_sensor_service is not None:
+                return
+            from sensors.box.service import BoxSensorService
+            from sensors.power.service import PowerMeterService
+
+            self.power_meter_service = PowerMeterService()
+            # box_sensor_service가 생성 완료 표시이므로 마지막에 대입
+            self.box_sensor_service = BoxSensorService()
+            logger.info("센서 서비스 생성 완료")
+
     # ─────────────────────────────────────────
     # 시작 / 종료
     # ─────────────────────────────────────────
+    @staticmethod
+    def _new_executor() -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="PowerCollect")
+
     def start(self, interval: Optional[int] = None):
         if self._running:
             logger.warning("이미 실행 중입니다.")
             return
 
+        self._ensure_services()
+        if self._executor_closed:
+            # stop() 후 재시작 — 종료된 실행기 대신 새로 생성
+            self._executor = self._new_executor()
+            self._executor_closed = False
         self.interval = interval or self.config.collection_interval
         self._stop_event.clear()
+        self._trigger_event.clear()
         self._running = True
         self._last_collection_time = time.time()
 
@@ -133,15 +178,19 @@ class DataCollectionService:
         self.remote_sync_service.start()
 
         logger.info(f"DataCollectionService 시작 (주기: {self.interval}초)")
-        logger.info("=" * 70)
+        logger.info(_SEP)
 
     def stop(self):
         if not self._running:
             return
         logger.info("DataCollectionService 중지 요청")
         self._stop_event.set()
+        self._trigger_event.set()
         self._running = False
         self.remote_sync_service.stop()
+        # 진행 중인 전력량계 수집은 기다리지 않음 (종료 시 비데몬 워커에 막히지 않도록)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor_closed = True
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=10)
         logger.info("DataCollectionService 중지 완료")
@@ -151,19 +200,51 @@ class DataCollectionService:
     # ─────────────────────────────────────────
     def _collection_loop(self):
         logger.info("통합 데이터 수집 루프 시작")
+        # 정기 수집 기준 시각 (수동 수집은 이 주기를 밀지 않음)
+        next_deadline = time.monotonic()
         while not self._stop_event.is_set():
+            self._trigger_event.clear()
+            started = time.monotonic()
+            success = False
             try:
-                self._collect_once()
+                success = self._collect_once()
                 self._last_collection_time = time.time()
             except Exception as e:
                 logger.error(f"수집 루프 오류: {e}", exc_info=True)
-                self.stats['last_error'] = str(e)
+                self._last_error = str(e)
                 if self.on_collection_error:
                     try:
                         self.on_collection_error(str(e))
                     except Exception:
                         pass
-            self._stop_event.wait(self.interval)
+
+            # 다음 정기 수집 시각 계산 (놓친 주기는 건너뜀)
+            now = time.monotonic()
+            while next_deadline <= now:
+                next_deadline += self.interval
+
+            # 연속 실패 시 재시도 간격을 2배씩 늘림 (상한: 주기 × MAX_BACKOFF_FACTOR)
+            if success:
+                if self._consecutive_failures:
+                    logger.info(
+                        f"수집 복구 — 연속 실패 {self._consecutive_failures}회 후 "
+                        f"정상 주기({self.interval}초)로 복귀"
+                    )
+                self._consecutive_failures = 0
+            else:
+                self._consecutive_failures += 1
+                backoff = self.interval * min(
+                    2 ** (self._consecutive_failures - 1), MAX_BACKOFF_FACTOR
+                )
+                if started + backoff > next_deadline:
+                    next_deadline = started + backoff
+                    logger.warning(
+                        f"연속 수집 실패 {self._consecutive_failures}회 — "
+                        f"{backoff}초 후 재시도"
+                    )
+
+            # 다음 주기까지 대기 (collect_now / stop 시 즉시 깨어남)
+            self._trigger_event.wait(next_deadline - now)
         logger.info("통합 데이터 수집 루프 종료")
 
     # ─────────────────────────────────────────
@@ -193,7 +274,6 @@ class DataCollectionService:
 
                 logger.warning("수집 스레드가 종료됨 — 자동 재시작")
                 self._restart_count += 1
-                self.stats['restart_count'] = self._restart_count
 
                 self._thread = threading.Thread(
                     target=self._collection_loop,
@@ -227,47 +307,59 @@ class DataCollectionService:
     # ─────────────────────────────────────────
     # 실제 수집
     # ─────────────────────────────────────────
-    def _collect_once(self):
-        start_time = time.time()
+    def _collect_once(self) -> bool:
+        """한 번 수집. 하나 이상의 장치가 성공하면 True"""
+        t0 = time.perf_counter()
 
-        logger.info("=" * 70)
-        logger.info("통합 데이터 수집 시작")
-        logger.info("=" * 70)
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(_SEP)
+            logger.info("통합 데이터 수집 시작")
+            logger.info(_SEP)
 
-        self.stats['total_collections'] += 1
-        self.stats['last_collection_time'] = datetime.now()
+        self._total_collections += 1
+        self._last_collection_at = time.time()
 
         try:
-            # ── 1단계: 전력량계 ──────────────────────
+            # ── 전력량계 + 박스 센서 동시 수집 ──────
+            # 박스 센서는 읽기를 먼저 하고, 히트펌프 저장 직전에만 전력량 결과를 기다림
             logger.info("[1/2] 전력량계 데이터 수집")
             try:
-                power_meter_data = self.power_meter_service.collector.collect_all()
-                power_success = sum(1 for v in power_meter_data.values() if v is not None)
-                logger.info(f"전력량계 수집 완료: {power_success}/{len(power_meter_data)}개")
-            except Exception as e:
-                logger.error(f"전력량계 수집 실패: {e}", exc_info=True)
-                power_meter_data = {}
-                power_success = 0
+                power_future = self._executor.submit(self._collect_power)
+            except RuntimeError:
+                # 실행기가 종료된 경우 순차 수집
+                power_future = None
 
-            # ── 2단계: 박스 센서 (장치별 독립) ──────
             logger.info("[2/2] 플라스틱 함 센서 데이터 수집")
+            if power_future is None:
+                power_meter_data = self._collect_power()
+                box_input = power_meter_data
+            else:
+                box_input = power_future
+
             try:
-                box_results = self.box_sensor_service.collector.collect_all(power_meter_data)
-                box_success = (
-                    sum(1 for v in box_results['heatpump'].values()
-                        if isinstance(v, dict) and v.get('success')) +
-                    sum(1 for v in box_results['groundpipe'].values()
-                        if isinstance(v, dict) and v.get('success'))
-                )
-                box_total = (
-                    len(box_results['heatpump']) + len(box_results['groundpipe'])
+                box_results = self.box_sensor_service.collector.collect_all(box_input)
+                hp_results = box_results['heatpump']
+                gp_results = box_results['groundpipe']
+                box_success = sum(
+                    1 for v in chain(hp_results.values(), gp_results.values())
+                    if isinstance(v, dict) and v.get('success')
                 )
+                box_total = len(hp_results) + len(gp_results)
                 logger.info(f"플라스틱 함 센서 수집 완료: {box_success}/{box_total}개")
             except Exception as e:
                 logger.error(f"박스 센서 수집 실패: {e}", exc_info=True)
                 box_results = {'heatpump': {}, 'groundpipe': {}}
                 box_success = 0
 
+            if power_future is not None:
+                try:
+                    power_meter_data = power_future.result()
+                except Exception as e:
+                    logger.error(f"전력량계 수집 실패: {e}", exc_info=True)
+                    power_meter_data = {}
+            power_success = sum(1 for v in power_meter_data.values() if v is not None)
+
             # ── DB 연결 풀 상태 체크 ─────────────────
             self._check_db_pool()
 
@@ -295,20 +387,21 @@ class DataCollectionService:
             # ── 통계 ─────────────────────────────────
             total_success = power_success + box_success
             if total_success > 0:
-                self.stats['successful_collections'] += 1
-                self.stats['last_success_time'] = datetime.now()
+                self._successful_collections += 1
+                self._last_success_at = time.time()
                 # 수집 성공 시 watchdog 타임아웃 알림 해제
                 self.alarm_service.resolve('collection_timeout')
             else:
-                self.stats['failed_collections'] += 1
-
-            elapsed = time.time() - start_time
-            logger.info("=" * 70)
-            logger.info(
-                f"수집 완료: 전력량계 {power_success}개, "
-                f"박스 센서 {box_success}개, 소요 {elapsed:.2f}초"
-            )
-            logger.info("=" * 70)
+                self._failed_collections += 1
+
+            elapsed = time.perf_counter() - t0
+            if log_info:
+                logger.info(_SEP)
+                logger.info(
+                    f"수집 완료: 전력량계 {power_success}개, "
+                    f"박스 센서 {box_success}개, 소요 {elapsed:.2f}초"
+                )
+                logger.info(_SEP)
 
             if self.on_collection_complete:
                 try:
@@ -320,15 +413,46 @@ class DataCollectionService:
                 except Exception:
                     pass
 
+            return total_success > 0
+
         except Exception as e:
-            self.stats['failed_collections'] += 1
-            self.stats['last_error'] = str(e)
+            self._failed_collections += 1
+            self._last_error = str(e)
             logger.error(f"통합 수집 실패: {e}", exc_info=True)
             if self.on_collection_error:
                 try:
                     self.on_collection_error(str(e))
                 except Exception:
                     pass
+            return False
+
+    def _collect_power(self) -> Dict[str, Optional[float]]:
+        """
+        전력량계 수집 후 장치별 전력량으로 정리
+
+        실행기에서 돌리면 박스 센서 수집기가 이 Future의 결과를 기다려 씁니다.
+
+        Returns:
+            dict: {device_id: 전력량(kWh), 읽기 실패 장치는 None}
+        """
+        try:
+            # collect_all() 결과는 {'success_count', 'total_count', 'data', 'errors'}
+            # 'data'에는 읽기에 성공한 전력량계만 들어 있음
+            data = self.power_meter_service.collector.collect_all().get('data', [])
+        except Exception as e:
+            logger.error(f"전력량계 수집 실패: {e}", exc_info=True)
+            data = []
+
+        power_meter_data = {
+            m.device_id: None
+            for m in self.power_meter_service.collector.reader.meter_configs
+        }
+        power_meter_data.update({d.device_id: d.total_energy for d in data})
+
+        with self._latest_lock:
+            self._latest_power_data = power_meter_data
+        logger.info(f"전력량계 수집 완료: {len(data)}/{len(power_meter_data)}개")
+        return power_meter_data
 
     # ─────────────────────────────────────────
     # DB 연결 풀 자동 복구
@@ -357,6 +481,11 @@ class DataCollectionService:
     # ─────────────────────────────────────────
     def collect_now(self):
         logger.info("수동 수집 트리거")
+        if self._running:
+            # 수집 스레드가 바로 수집 (동시 수집 방지)
+            self._trigger_event.set()
+            return
+        self._ensure_services()
         threading.Thread(
             target=self._collect_once, daemon=True, name="ManualCollection"
         ).start()
@@ -365,14 +494,47 @@ class DataCollectionService:
         return self._running
 
     def get_stats(self) -> Dict:
-        return self.stats.copy()
+        last_collection = self._last_collection_at
+        last_success = self._last_success_at
+        return {
+            'total_collections': self._total_collections,
+            'successful_collections': self._successful_collections,
+            'failed_collections': self._failed_collections,
+            'last_collection_time': (
+                datetime.fromtimestamp(last_collection) if last_collection else None
+            ),
+            'last_success_time': (
+                datetime.fromtimestamp(last_success) if last_success else None
+            ),
+            'last_error': self._last_error,
+            'restart_count': self._restart_count,
+            'consecutive_failures': self._consecutive_failures,
+        }
+
+    def get_latest_power_meter_data(self) -> Optional[Dict]:
+        """
+        최근 수집한 전력량 조회 (메모리 캐시, DB 조회 없음)
+
+        Returns:
+            dict: {device_id: 전력량(kWh), 읽기 실패 장치는 None}
+            None: 아직 수집된 데이터 없음
+        """
+        with self._latest_lock:
+            latest = self._latest_power_data
+        if latest is not None:
+            return dict(latest)
+        # 통합 수집 전에는 전력량계 서비스 자체 수집 결과 사용
+        self._ensure_services()
+        return self.power_meter_service.get_latest_data()
 
     def get_all_stats(self) -> Dict:
+        self._ensure_services()
         return {
             'integrated': self.get_stats(),
-            'power_meter': self.power_meter_service.get_stats(),
+            'power_meter': self.power_meter_service.get_stats().to_dict(),
             'box_sensor': self.box_sensor_service.get_stats()
         }
 
     def reload_config(self):
+        self._ensure_services()
         self.power_meter_service.reload_config()
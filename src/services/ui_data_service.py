@@ -12,11 +12,124 @@ GUI에서 사용할 데이터베이스 조회 서비스
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from core.database import execute_query
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+from core.database import execute_query, execute_query_iter
 
 logger = logging.getLogger(__name__)
 
+# 시계열 차트 최대 점 수 (초과하는 기간은 서버에서 구간 평균으로 축약)
+TIMESERIES_MAX_POINTS = 500
+
+# 테이블별 조회 가능 필드 (UI 필드명 → DB 컬럼명, DB 컬럼명으로도 조회 가능)
+# SQL에 직접 삽입되므로 이 목록에 있는 컬럼만 허용
+TIMESERIES_FIELDS = {
+    'heatpump': {
+        't_in': 'input_temp',
+        't_out': 'output_temp',
+        'flow': 'flow',
+        'energy': 'energy',
+    },
+    'groundpipe': {
+        't_in': 'input_temp',
+        't_out': 'output_temp',
+        'flow': 'flow',
+    },
+    'elec': {
+        'total_energy': 'total_energy',
+    },
+}
+
+# 시계열 쿼리 템플릿 (파라미터 자리만 바뀌고 텍스트는 (테이블, 컬럼)별로 고정)
+_TIMESERIES_SQL_TEMPLATES = {
+    # 최근 N시간, 구간 평균 (파라미터: device_id, 시작 시각, 구간 초)
+    'bucketed': """
+        SELECT MAX(timestamp) AS timestamp, AVG({column}) AS value
+        FROM {table}
+        WHERE device_id = %s
+          AND timestamp >= %s
+        GROUP BY floor(extract(epoch FROM timestamp) / %s)
+        ORDER BY 1 ASC
+    """,
+    # 시작~끝 범위 원본 (파라미터: device_id, 시작 시각, 종료 시각)
+    'range': """
+        SELECT timestamp, {column}
+        FROM {table}
+        WHERE device_id = %s
+          AND timestamp >= %s
+          AND timestamp <= %s
+          AND {column} IS NOT NULL
+        ORDER BY timestamp ASC
+    """,
+}
+
+
+# (테이블, 필드, 종류)별 완성 쿼리 (모듈 로드 시 1회 생성)
+_TIMESERIES_SQL = {
+    (table, name, kind): template.format(table=table, column=column)
+    for table, fields in TIMESERIES_FIELDS.items()
+    for field, column in fields.items()
+    for name in (field, column)
+    for kind, template in _TIMESERIES_SQL_TEMPLATES.items()
+}
+
+
+def _timeseries_sql(table: str, field: str, kind: str) -> str:
+    """
+    시계열 쿼리 조회
+    
+    Args:
+        table: 'heatpump' / 'groundpipe' / 'elec'
+        field: UI 필드명('t_in' 등) 또는 DB 컬럼명
+        kind: 'bucketed' / 'range'
+    
+    Raises:
+        ValueError: 허용되지 않은 테이블/필드
+    """
+    try:
+        return _TIMESERIES_SQL[(table, field, kind)]
+    except KeyError:
+        raise ValueError(f"조회할 수 없는 필드: {table}.{field}") from None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 통계 행 → 결과 dict 변환 (단일/다중 장치 조회 공용)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _stat(latest, avg, mx, mn, cnt, ndigits: int = 1) -> Dict:
+    """필드 하나의 통계 (NULL은 0)"""
+    return {
+        'latest': round(float(latest), ndigits) if latest is not None else 0.0,
+        'avg':    round(float(avg),    ndigits) if avg    is not None else 0.0,
+        'max':    round(float(mx),     ndigits) if mx     is not None else 0.0,
+        'min':    round(float(mn),     ndigits) if mn     is not None else 0.0,
+        'count':  int(cnt) if cnt is not None else 0,
+    }
+
+
+def _heatpump_stats(r) -> Dict:
+    return {
+        't_in':  _stat(r['latest_in'],   r['avg_in'],   r['max_in'],   r['min_in'],   r['cnt']),
+        't_out': _stat(r['latest_out'],  r['avg_out'],  r['max_out'],  r['min_out'],  r['cnt']),
+        'flow':  _stat(r['latest_flow'], r['avg_flow'], r['max_flow'], r['min_flow'], r['cnt']),
+        'energy': _stat(r['latest_energy'], r['avg_energy'], r['max_energy'], r['min_energy'],
+                        r['cnt'], ndigits=2),
+    }
+
+
+def _groundpipe_stats(r) -> Dict:
+    return {
+        't_in':  _stat(r['latest_in'],   r['avg_in'],   r['max_in'],   r['min_in'],   r['cnt']),
+        't_out': _stat(r['latest_out'],  r['avg_out'],  r['max_out'],  r['min_out'],  r['cnt']),
+        'flow':  _stat(r['latest_flow'], r['avg_flow'], r['max_flow'], r['min_flow'], r['cnt']),
+    }
+
+
+def _power_stats(r) -> Dict:
+    return _stat(r['latest'], r['avg'], r['max'], r['min'], r['cnt'], ndigits=2)
+
 
 class UIDataService:
     """UI 데이터 서비스 클래스"""
@@ -30,11 +143,14 @@ class UIDataService:
 
     def _cache_get(self, key: str):
         """캐시에서 값 조회. 만료됐으면 None 반환."""
-        if key in self._cache:
-            expired_at, data = self._cache[key]
-            if datetime.now().timestamp() < expired_at:
-                return data
-            del self._cache[key]
+        # 수집 스레드가 동시에 키를 지울 수 있으므로 조회/삭제는 각각 한 번의 dict 연산으로
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expired_at, data = entry
+        if datetime.now().timestamp() < expired_at:
+            return data
+        self._cache.pop(key, None)
         return None
 
     def _cache_set(self, key: str, data):
@@ -45,49 +161,82 @@ class UIDataService:
     def _cache_invalidate(self, prefix: str = ''):
         """캐시 무효화 (특정 prefix 또는 전체)."""
         if prefix:
-            keys = [k for k in self._cache if k.startswith(prefix)]
+            # 수집 스레드에서도 호출되므로 키 목록을 복사한 뒤 삭제
+            keys = [k for k in list(self._cache) if k.startswith(prefix)]
             for k in keys:
-                del self._cache[k]
+                self._cache.pop(k, None)
         else:
             self._cache.clear()
 
+    def invalidate_latest(self, device_id: Optional[str] = None):
+        """
+        통계(최신값 포함) 캐시 무효화 - 새 데이터 수집 완료 시 호출
+        
+        Args:
+            device_id: 특정 장치만 무효화 (None이면 전체)
+        """
+        if device_id is None:
+            self._cache_invalidate('stats_')
+            return
+        keys = [
+            k for k in list(self._cache)
+            if k.startswith('stats_') and k.split('_', 2)[2].startswith(f'{device_id}_')
+        ]
+        for k in keys:
+            self._cache.pop(k, None)
+
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 센서 목록 조회
+    # 센서 목록 조회 (TTL 캐시, 장치 추가/삭제 시 invalidate_device_caches)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     
-    def get_all_heatpump_devices(self) -> List[str]:
+    def invalidate_device_caches(self):
+        """센서 목록 캐시 무효화 (다음 조회 시 DB에서 다시 읽음)"""
+        self._cache_invalidate('devices_')
+    
+    def get_all_devices(self) -> Dict[str, List[str]]:
+        """
+        전체 장치 ID 조회 (세 테이블을 UNION ALL 한 번으로)
+        
+        Returns:
+            Dict[str, List[str]]: {'heatpump': [...], 'groundpipe': [...], 'power': [...]}
+        """
+        cached = self._cache_get('devices_all')
+        if cached is not None:
+            return {k: list(v) for k, v in cached.items()}
+        
         try:
             query = """
-                SELECT DISTINCT device_id
-                FROM heatpump
-                ORDER BY device_id
+                SELECT 'heatpump' AS src, device_id FROM heatpump GROUP BY device_id
+                UNION ALL
+                SELECT 'groundpipe', device_id FROM groundpipe GROUP BY device_id
+                UNION ALL
+                SELECT 'power', device_id FROM elec GROUP BY device_id
             """
-            result = execute_query(query, fetch_mode='all')
-            devices = [row['device_id'] for row in result]
-
-            # 숫자 기준 정렬 (HP_1, HP_2, HP_3, HP_4)
-            devices.sort(key=lambda x: int(x.split('_')[-1]) if x.split('_')[-1].isdigit() else 0)
-            return devices
+            result = execute_query(query, fetch_mode='all_tuples')
+            
+            devices = {'heatpump': [], 'groundpipe': [], 'power': []}
+            for src, device_id in result:
+                devices[src].append(device_id)
+            
+            # 숫자 기준 정렬 (HP_1, HP_2, ... / GP_1, GP_2, ... GP_10)
+            num_key = lambda x: int(x.split('_')[-1]) if x.split('_')[-1].isdigit() else 0
+            devices['heatpump'].sort()
+            devices['heatpump'].sort(key=num_key)
+            devices['groundpipe'].sort()
+            devices['groundpipe'].sort(key=num_key)
+            devices['power'].sort()
+            
+            self._cache_set('devices_all', devices)
+            return {k: list(v) for k, v in devices.items()}
         except Exception as e:
-            logger.error(f"히트펌프 장치 목록 조회 실패: {e}")
-            return []
+            logger.error(f"장치 목록 조회 실패: {e}")
+            return {'heatpump': [], 'groundpipe': [], 'power': []}
+    
+    def get_all_heatpump_devices(self) -> List[str]:
+        return self.get_all_devices()['heatpump']
     
     def get_all_groundpipe_devices(self) -> List[str]:
-        try:
-            query = """
-                SELECT DISTINCT device_id
-                FROM groundpipe
-                ORDER BY device_id
-            """
-            result = execute_query(query, fetch_mode='all')
-            devices = [row['device_id'] for row in result]
-
-            # 숫자 기준 정렬 (GP_1, GP_2, ... GP_10)
-            devices.sort(key=lambda x: int(x.split('_')[-1]) if x.split('_')[-1].isdigit() else 0)
-            return devices
-        except Exception as e:
-            logger.error(f"지중배관 장치 목록 조회 실패: {e}")
-            return []
+        return self.get_all_devices()['groundpipe']
     
     def get_all_power_devices(self) -> List[str]:
         """
@@ -96,27 +245,108 @@ class UIDataService:
         Returns:
             List[str]: 장치 ID 리스트 (예: ['Total', 'HP_1', ...])
         """
-        try:
-            query = """
-                SELECT DISTINCT device_id
-                FROM elec
-                ORDER BY device_id
-            """
-            result = execute_query(query, fetch_mode='all')
-            return [row['device_id'] for row in result]
-        except Exception as e:
-            logger.error(f"전력량계 장치 목록 조회 실패: {e}")
-            return []
+        return self.get_all_devices()['power']
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 시계열 데이터 조회
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     
+    def _query_timeseries(
+        self,
+        table: str,
+        field: str,
+        device_id: str,
+        hours: int,
+        max_points: int
+    ) -> List[tuple]:
+        """
+        시계열 조회 (서버에서 구간 평균으로 축약)
+        
+        조회 기간을 max_points개 구간으로 나눠 구간별 평균만 가져오므로
+        긴 기간에도 전송 행 수와 Python 변환 횟수가 max_points 이하로 유지됩니다.
+        구간 시각은 구간 내 마지막 측정 시각 (최신 점의 시각은 원본과 같음).
+        
+        Returns:
+            list: [(timestamp, value), ...]
+        """
+        start_time = datetime.now() - timedelta(hours=hours)
+        bucket_sec = max(1, hours * 3600 // max(1, max_points))
+        
+        return execute_query(
+            _timeseries_sql(table, field, 'bucketed'),
+            (device_id, start_time, bucket_sec),
+            fetch_mode='all_tuples'
+        )
+    
+    def _fetch_timeseries(
+        self,
+        table: str,
+        field: str,
+        device_id: str,
+        hours: int,
+        max_points: int
+    ) -> List[Dict]:
+        """시계열 조회 결과를 [{'timestamp', 'value'}, ...]로 변환"""
+        return [
+            {
+                'timestamp': ts,
+                'value': float(value) if value is not None else 0.0
+            }
+            for ts, value in self._query_timeseries(table, field, device_id, hours, max_points)
+        ]
+    
+    def _fetch_timeseries_arrays(
+        self,
+        table: str,
+        field: str,
+        device_id: str,
+        hours: int,
+        max_points: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        시계열 조회 결과를 (시각 배열, 값 배열)로 변환 (점마다 dict를 만들지 않음)
+        
+        Returns:
+            tuple: (datetime64[s] 배열, float64 배열) - 값이 NULL이면 0.0
+        """
+        rows = self._query_timeseries(table, field, device_id, hours, max_points)
+        timestamps = np.array([ts for ts, _ in rows], dtype='datetime64[s]')
+        values = np.fromiter(
+            (0.0 if value is None else float(value) for _, value in rows),
+            dtype=np.float64,
+            count=len(rows)
+        )
+        return timestamps, values
+    
+    def _timeseries_arrays(
+        self,
+        cache_prefix: str,
+        table: str,
+        field: str,
+        device_id: str,
+        hours: int,
+        max_points: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """get_timeseries_*_arrays 공통 처리 (TTL 캐시 포함)"""
+        cache_key = f'tsa_{cache_prefix}_{device_id}_{hours}_{field}_{max_points}'
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            result = self._fetch_timeseries_arrays(table, field, device_id, hours, max_points)
+            self._cache_set(cache_key, result)
+            return result
+        except Exception as e:
+            logger.error(f"시계열 배열 조회 실패 ({table}, {device_id}): {e}")
+            return np.empty(0, dtype='datetime64[s]'), np.empty(0, dtype=np.float64)
+    
     def get_timeseries_heatpump(
         self,
         device_id: str,
         hours: int = 1,
-        field: str = 't_in'
+        field: str = 't_in',
+        max_points: int = TIMESERIES_MAX_POINTS
     ) -> List[Dict]:
         """
         히트펌프 시계열 데이터 조회
@@ -125,45 +355,19 @@ class UIDataService:
             device_id: 장치 ID (예: 'HP_1')
             hours: 조회 시간 (시간 단위)
             field: 측정 항목 ('t_in', 't_out', 'flow', 'energy')
+            max_points: 최대 점 수 (초과 시 서버에서 구간 평균으로 축약)
         
         Returns:
             List[Dict]: [{'timestamp': datetime, 'value': float}, ...]
         """
             
-        cache_key = f'ts_hp_{device_id}_{hours}_{field}'
+        cache_key = f'ts_hp_{device_id}_{hours}_{field}_{max_points}'
         cached = self._cache_get(cache_key)
         if cached is not None:
             return cached
         
         try:
-            # 필드명 매핑 (UI 필드명 → DB 컬럼명)
-            field_mapping = {
-                't_in': 'input_temp',
-                't_out': 'output_temp',
-                'flow': 'flow',
-                'energy': 'energy'
-            }
-            
-            db_field = field_mapping.get(field, field)
-            start_time = datetime.now() - timedelta(hours=hours)
-            
-            query = f"""
-                SELECT timestamp, {db_field}
-                FROM heatpump
-                WHERE device_id = %s
-                  AND timestamp >= %s
-                ORDER BY timestamp ASC
-            """
-            
-            result = execute_query(query, (device_id, start_time), fetch_mode='all')
-            
-            result = [
-                {
-                    'timestamp': row['timestamp'],
-                    'value': float(row[db_field]) if row[db_field] is not None else 0.0
-                }
-                for row in result
-            ]
+            result = self._fetch_timeseries('heatpump', field, device_id, hours, max_points)
             
             self._cache_set(cache_key, result)
             
@@ -177,7 +381,8 @@ class UIDataService:
         self,
         device_id: str,
         hours: int = 1,
-        field: str = 't_in'
+        field: str = 't_in',
+        max_points: int = TIMESERIES_MAX_POINTS
     ) -> List[Dict]:
         """
         지중배관 시계열 데이터 조회
@@ -186,44 +391,19 @@ class UIDataService:
             device_id: 장치 ID (예: 'GP_1')
             hours: 조회 시간 (시간 단위)
             field: 측정 항목 ('t_in', 't_out', 'flow')
+            max_points: 최대 점 수 (초과 시 서버에서 구간 평균으로 축약)
         
         Returns:
             List[Dict]: [{'timestamp': datetime, 'value': float}, ...]
         """
                 
-        cache_key = f'ts_gp_{device_id}_{hours}_{field}'
+        cache_key = f'ts_gp_{device_id}_{hours}_{field}_{max_points}'
         cached = self._cache_get(cache_key)
         if cached is not None:
             return cached
         
         try:
-            # 필드명 매핑
-            field_mapping = {
-                't_in': 'input_temp',
-                't_out': 'output_temp',
-                'flow': 'flow'
-            }
-            
-            db_field = field_mapping.get(field, field)
-            start_time = datetime.now() - timedelta(hours=hours)
-            
-            query = f"""
-                SELECT timestamp, {db_field}
-                FROM groundpipe
-                WHERE device_id = %s
-                  AND timestamp >= %s
-                ORDER BY timestamp ASC
-            """
-            
-            result = execute_query(query, (device_id, start_time), fetch_mode='all')
-            
-            result = [
-                {
-                    'timestamp': row['timestamp'],
-                    'value': float(row[db_field]) if row[db_field] is not None else 0.0
-                }
-                for row in result
-            ]
+            result = self._fetch_timeseries('groundpipe', field, device_id, hours, max_points)
             self._cache_set(cache_key, result)
             
             return result
@@ -236,7 +416,8 @@ class UIDataService:
         self,
         device_id: str,
         hours: int = 1,
-        field: str = 'total_energy'
+        field: str = 'total_energy',
+        max_points: int = TIMESERIES_MAX_POINTS
     ) -> List[Dict]:
     
         """
@@ -246,36 +427,19 @@ class UIDataService:
             device_id: 장치 ID (예: 'HP_1')
             hours: 조회 시간 (시간 단위)
             field: 측정 항목 ('total_energy')
+            max_points: 최대 점 수 (초과 시 서버에서 구간 평균으로 축약)
         
         Returns:
             List[Dict]: [{'timestamp': datetime, 'value': float}, ...]
         """
         
-        cache_key = f'ts_elec_{device_id}_{hours}_{field}'
+        cache_key = f'ts_elec_{device_id}_{hours}_{field}_{max_points}'
         cached = self._cache_get(cache_key)
         if cached is not None:
             return cached
         
         try:
-            start_time = datetime.now() - timedelta(hours=hours)
-            
-            query = """
-                SELECT timestamp, total_energy
-                FROM elec
-                WHERE device_id = %s
-                  AND timestamp >= %s
-                ORDER BY timestamp ASC
-            """
-            
-            result = execute_query(query, (device_id, start_time), fetch_mode='all')
-            
-            result = [
-                {
-                    'timestamp': row['timestamp'],
-                    'value': float(row['total_energy']) if row['total_energy'] is not None else 0.0
-                }
-                for row in result
-            ]
+            result = self._fetch_timeseries('elec', 'total_energy', device_id, hours, max_points)
             
             self._cache_set(cache_key, result)
             
@@ -284,6 +448,56 @@ class UIDataService:
             logger.error(f"전력량계 시계열 데이터 조회 실패: {e}")
             return []
     
+    def get_timeseries_heatpump_arrays(
+        self,
+        device_id: str,
+        hours: int = 1,
+        field: str = 't_in',
+        max_points: int = TIMESERIES_MAX_POINTS
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        히트펌프 시계열 데이터 조회 (배열 형태)
+        
+        Args: get_timeseries_heatpump 참고
+        
+        Returns:
+            tuple: (timestamps: datetime64[s] 배열, values: float64 배열)
+        """
+        return self._timeseries_arrays('hp', 'heatpump', field, device_id, hours, max_points)
+    
+    def get_timeseries_groundpipe_arrays(
+        self,
+        device_id: str,
+        hours: int = 1,
+        field: str = 't_in',
+        max_points: int = TIMESERIES_MAX_POINTS
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        지중배관 시계열 데이터 조회 (배열 형태)
+        
+        Args: get_timeseries_groundpipe 참고
+        
+        Returns:
+            tuple: (timestamps: datetime64[s] 배열, values: float64 배열)
+        """
+        return self._timeseries_arrays('gp', 'groundpipe', field, device_id, hours, max_points)
+    
+    def get_timeseries_power_arrays(
+        self,
+        device_id: str,
+        hours: int = 1,
+        max_points: int = TIMESERIES_MAX_POINTS
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        전력량계 시계열 데이터 조회 (배열 형태)
+        
+        Args: get_timeseries_power 참고
+        
+        Returns:
+            tuple: (timestamps: datetime64[s] 배열, values: float64 배열)
+        """
+        return self._timeseries_arrays('elec', 'elec', 'total_energy', device_id, hours, max_points)
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 통계 데이터 조회
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -298,9 +512,10 @@ class UIDataService:
 
         Returns:
             Dict: {
-                't_in':  {'latest', 'avg', 'max', 'min', 'count'},
-                't_out': {'latest', 'avg', 'max', 'min', 'count'},
-                'flow':  {'latest', 'avg', 'max', 'min', 'count'},
+                't_in':   {'latest', 'avg', 'max', 'min', 'count'},
+                't_out':  {'latest', 'avg', 'max', 'min', 'count'},
+                'flow':   {'latest', 'avg', 'max', 'min', 'count'},
+                'energy': {'latest', 'avg', 'max', 'min', 'count'},  # 소수 둘째 자리
             }
         """
         
@@ -314,43 +529,43 @@ class UIDataService:
         try:
             start_time = datetime.now() - timedelta(hours=hours)
 
+            # 최신 행은 LATERAL 하나로 한 번만 조회 (필드별 LIMIT 1 서브쿼리 3회 → 1회)
             query = """
                 SELECT
-                    -- 최신값 (DISTINCT ON 활용)
-                    (SELECT input_temp  FROM heatpump WHERE device_id = %s ORDER BY timestamp DESC LIMIT 1) AS latest_in,
-                    (SELECT output_temp FROM heatpump WHERE device_id = %s ORDER BY timestamp DESC LIMIT 1) AS latest_out,
-                    (SELECT flow        FROM heatpump WHERE device_id = %s ORDER BY timestamp DESC LIMIT 1) AS latest_flow,
-                    -- 기간 통계
-                    AVG(input_temp)   AS avg_in,  MAX(input_temp)   AS max_in,  MIN(input_temp)   AS min_in,
-                    AVG(output_temp)  AS avg_out, MAX(output_temp)  AS max_out, MIN(output_temp)  AS min_out,
-                    AVG(flow)         AS avg_flow, MAX(flow)         AS max_flow, MIN(flow)        AS min_flow,
-                    COUNT(*)          AS cnt
-                FROM heatpump
-                WHERE device_id = %s
-                AND timestamp >= %s
+                    l.input_temp      AS latest_in,
+                    l.output_temp     AS latest_out,
+                    l.flow            AS latest_flow,
+                    l.energy          AS latest_energy,
+                    s.*
+                FROM (
+                    SELECT
+                        -- 기간 통계
+                        AVG(input_temp)   AS avg_in,  MAX(input_temp)   AS max_in,  MIN(input_temp)   AS min_in,
+                        AVG(output_temp)  AS avg_out, MAX(output_temp)  AS max_out, MIN(output_temp)  AS min_out,
+                        AVG(flow)         AS avg_flow, MAX(flow)         AS max_flow, MIN(flow)        AS min_flow,
+                        AVG(energy)       AS avg_energy, MAX(energy)     AS max_energy, MIN(energy)    AS min_energy,
+                        COUNT(*)          AS cnt
+                    FROM heatpump
+                    WHERE device_id = %s
+                    AND timestamp >= %s
+                ) s
+                LEFT JOIN LATERAL (
+                    SELECT input_temp, output_temp, flow, energy
+                    FROM heatpump
+                    WHERE device_id = %s
+                    ORDER BY timestamp DESC
+                    LIMIT 1
+                ) l ON TRUE
             """
             r = execute_query(
                 query,
-                (device_id, device_id, device_id, device_id, start_time),
+                (device_id, start_time, device_id),
                 fetch_mode='one'
             )
             if not r:
-                return {'t_in': empty, 't_out': empty, 'flow': empty}
+                return {'t_in': empty, 't_out': empty, 'flow': empty, 'energy': empty}
 
-            def _s(latest, avg, mx, mn, cnt):
-                return {
-                    'latest': round(float(latest), 1) if latest is not None else 0.0,
-                    'avg':    round(float(avg),    1) if avg    is not None else 0.0,
-                    'max':    round(float(mx),     1) if mx     is not None else 0.0,
-                    'min':    round(float(mn),     1) if mn     is not None else 0.0,
-                    'count':  int(cnt) if cnt is not None else 0,
-                }
-
-            result = {
-                't_in':  _s(r['latest_in'],   r['avg_in'],   r['max_in'],   r['min_in'],   r['cnt']),
-                't_out': _s(r['latest_out'],  r['avg_out'],  r['max_out'],  r['min_out'],  r['cnt']),
-                'flow':  _s(r['latest_flow'], r['avg_flow'], r['max_flow'], r['min_flow'], r['cnt']),
-            }
+            result = _heatpump_stats(r)
             
             self._cache_set(cache_key, result)
             
@@ -358,7 +573,7 @@ class UIDataService:
 
         except Exception as e:
             logger.error(f"히트펌프 통계 조회 실패: {e}")
-            return {'t_in': empty, 't_out': empty, 'flow': empty}
+            return {'t_in': empty, 't_out': empty, 'flow': empty, 'energy': empty}
     
     def get_statistics_groundpipe(
         self,
@@ -375,41 +590,40 @@ class UIDataService:
         try:
             start_time = datetime.now() - timedelta(hours=hours)
 
+            # 최신 행은 LATERAL 하나로 한 번만 조회 (필드별 LIMIT 1 서브쿼리 3회 → 1회)
             query = """
                 SELECT
-                    (SELECT input_temp  FROM groundpipe WHERE device_id = %s ORDER BY timestamp DESC LIMIT 1) AS latest_in,
-                    (SELECT output_temp FROM groundpipe WHERE device_id = %s ORDER BY timestamp DESC LIMIT 1) AS latest_out,
-                    (SELECT flow        FROM groundpipe WHERE device_id = %s ORDER BY timestamp DESC LIMIT 1) AS latest_flow,
-                    AVG(input_temp)   AS avg_in,  MAX(input_temp)   AS max_in,  MIN(input_temp)   AS min_in,
-                    AVG(output_temp)  AS avg_out, MAX(output_temp)  AS max_out, MIN(output_temp)  AS min_out,
-                    AVG(flow)         AS avg_flow, MAX(flow)         AS max_flow, MIN(flow)        AS min_flow,
-                    COUNT(*)          AS cnt
-                FROM groundpipe
-                WHERE device_id = %s
-                AND timestamp >= %s
+                    l.input_temp      AS latest_in,
+                    l.output_temp     AS latest_out,
+                    l.flow            AS latest_flow,
+                    s.*
+                FROM (
+                    SELECT
+                        AVG(input_temp)   AS avg_in,  MAX(input_temp)   AS max_in,  MIN(input_temp)   AS min_in,
+                        AVG(output_temp)  AS avg_out, MAX(output_temp)  AS max_out, MIN(output_temp)  AS min_out,
+                        AVG(flow)         AS avg_flow, MAX(flow)         AS max_flow, MIN(flow)        AS min_flow,
+                        COUNT(*)          AS cnt
+                    FROM groundpipe
+                    WHERE device_id = %s
+                    AND timestamp >= %s
+                ) s
+                LEFT JOIN LATERAL (
+                    SELECT input_temp, output_temp, flow
+                    FROM groundpipe
+                    WHERE device_id = %s
+                    ORDER BY timestamp DESC
+                    LIMIT 1
+                ) l ON TRUE
             """
             r = execute_query(
                 query,
-                (device_id, device_id, device_id, device_id, start_time),
+                (device_id, start_time, device_id),
                 fetch_mode='one'
             )
             if not r:
                 return {'t_in': empty, 't_out': empty, 'flow': empty}
 
-            def _s(latest, avg, mx, mn, cnt):
-                return {
-                    'latest': round(float(latest), 1) if latest is not None else 0.0,
-                    'avg':    round(float(avg),    1) if avg    is not None else 0.0,
-                    'max':    round(float(mx),     1) if mx     is not None else 0.0,
-                    'min':    round(float(mn),     1) if mn     is not None else 0.0,
-                    'count':  int(cnt) if cnt is not None else 0,
-                }
-
-            result = {
-                't_in':  _s(r['latest_in'],   r['avg_in'],   r['max_in'],   r['min_in'],   r['cnt']),
-                't_out': _s(r['latest_out'],  r['avg_out'],  r['max_out'],  r['min_out'],  r['cnt']),
-                'flow':  _s(r['latest_flow'], r['avg_flow'], r['max_flow'], r['min_flow'], r['cnt']),
-            }
+            result = _groundpipe_stats(r)
             
             self._cache_set(cache_key, result)
             
@@ -445,19 +659,179 @@ class UIDataService:
             if not r:
                 return empty
 
-            result = {
-                'latest': round(float(r['latest']), 2) if r['latest'] is not None else 0.0,
-                'avg':    round(float(r['avg']),    2) if r['avg']    is not None else 0.0,
-                'max':    round(float(r['max']),    2) if r['max']    is not None else 0.0,
-                'min':    round(float(r['min']),    2) if r['min']    is not None else 0.0,
-                'count':  int(r['cnt']) if r['cnt'] is not None else 0,
-            }
+            result = _power_stats(r)
             self._cache_set(cache_key, result)
             return result
         except Exception as e:
             logger.error(f"전력량계 통계 조회 실패: {e}")
             return empty
 
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 여러 장치 통계 한 번에 조회 (장치 목록 화면용)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _statistics_bulk(
+        self,
+        cache_prefix: str,
+        query: str,
+        convert,
+        device_ids: List[str],
+        hours: int,
+    ) -> Dict[str, Dict]:
+        """
+        장치별 통계를 쿼리 한 번으로 조회 (단일 조회와 캐시 키 공유)
+
+        캐시에 있는 장치는 건너뛰고 나머지만 조회한다.
+        query 파라미터: (장치 목록, 장치 목록, 시작 시각)
+        """
+        result = {}
+        missing = []
+        for device_id in dict.fromkeys(device_ids):
+            cached = self._cache_get(f'{cache_prefix}_{device_id}_{hours}')
+            if cached is not None:
+                result[device_id] = cached
+            else:
+                missing.append(device_id)
+
+        if missing:
+            start_time = datetime.now() - timedelta(hours=hours)
+            rows = execute_query(query, (missing, missing, start_time)) or []
+            for r in rows:
+                stats = convert(r)
+                self._cache_set(f'{cache_prefix}_{r["device_id"]}_{hours}', stats)
+                result[r['device_id']] = stats
+
+        return result
+
+    def get_statistics_heatpump_bulk(
+        self,
+        device_ids: List[str],
+        hours: int = 24,
+    ) -> Dict[str, Dict]:
+        """
+        여러 히트펌프 통계 조회 (GROUP BY device_id 한 번)
+
+        Returns:
+            Dict: {device_id: get_statistics_heatpump()와 같은 형식}
+        """
+        # 기간 내 데이터가 없는 장치도 최신값은 채우도록 장치 목록 기준으로 조인
+        query = """
+            SELECT *
+            FROM unnest(%s::varchar[]) AS d(device_id)
+            LEFT JOIN (
+                SELECT
+                    device_id,
+                    AVG(input_temp)   AS avg_in,  MAX(input_temp)   AS max_in,  MIN(input_temp)   AS min_in,
+                    AVG(output_temp)  AS avg_out, MAX(output_temp)  AS max_out, MIN(output_temp)  AS min_out,
+                    AVG(flow)         AS avg_flow, MAX(flow)         AS max_flow, MIN(flow)        AS min_flow,
+                    AVG(energy)       AS avg_energy, MAX(energy)     AS max_energy, MIN(energy)    AS min_energy,
+                    COUNT(*)          AS cnt
+                FROM heatpump
+                WHERE device_id = ANY(%s)
+                AND timestamp >= %s
+                GROUP BY device_id
+            ) s USING (device_id)
+            LEFT JOIN LATERAL (
+                SELECT
+                    input_temp  AS latest_in,
+                    output_temp AS latest_out,
+                    flow        AS latest_flow,
+                    energy      AS latest_energy
+                FROM heatpump h
+                WHERE h.device_id = d.device_id
+                ORDER BY timestamp DESC
+                LIMIT 1
+            ) l ON TRUE
+        """
+        try:
+            return self._statistics_bulk('stats_hp', query, _heatpump_stats, device_ids, hours)
+        except Exception as e:
+            logger.error(f"히트펌프 통계 일괄 조회 실패: {e}")
+            return {}
+
+    def get_statistics_groundpipe_bulk(
+        self,
+        device_ids: List[str],
+        hours: int = 24,
+    ) -> Dict[str, Dict]:
+        """
+        여러 지중배관 통계 조회 (GROUP BY device_id 한 번)
+
+        Returns:
+            Dict: {device_id: get_statistics_groundpipe()와 같은 형식}
+        """
+        query = """
+            SELECT *
+            FROM unnest(%s::varchar[]) AS d(device_id)
+            LEFT JOIN (
+                SELECT
+                    device_id,
+                    AVG(input_temp)   AS avg_in,  MAX(input_temp)   AS max_in,  MIN(input_temp)   AS min_in,
+                    AVG(output_temp)  AS avg_out, MAX(output_temp)  AS max_out, MIN(output_temp)  AS min_out,
+                    AVG(flow)         AS avg_flow, MAX(flow)         AS max_flow, MIN(flow)        AS min_flow,
+                    COUNT(*)          AS cnt
+                FROM groundpipe
+                WHERE device_id = ANY(%s)
+                AND timestamp >= %s
+                GROUP BY device_id
+            ) s USING (device_id)
+            LEFT JOIN LATERAL (
+                SELECT
+                    input_temp  AS latest_in,
+                    output_temp AS latest_out,
+                    flow        AS latest_flow
+                FROM groundpipe g
+                WHERE g.device_id = d.device_id
+                ORDER BY timestamp DESC
+                LIMIT 1
+            ) l ON TRUE
+        """
+        try:
+            return self._statistics_bulk('stats_gp', query, _groundpipe_stats, device_ids, hours)
+        except Exception as e:
+            logger.error(f"지중배관 통계 일괄 조회 실패: {e}")
+            return {}
+
+    def get_statistics_power_bulk(
+        self,
+        device_ids: List[str],
+        hours: int = 24,
+    ) -> Dict[str, Dict]:
+        """
+        여러 전력량계 통계 조회 (GROUP BY device_id 한 번)
+
+        Returns:
+            Dict: {device_id: get_statistics_power()와 같은 형식}
+        """
+        query = """
+            SELECT *
+            FROM unnest(%s::varchar[]) AS d(device_id)
+            LEFT JOIN (
+                SELECT
+                    device_id,
+                    AVG(total_energy) AS avg,
+                    MAX(total_energy) AS max,
+                    MIN(total_energy) AS min,
+                    COUNT(*)          AS cnt
+                FROM elec
+                WHERE device_id = ANY(%s)
+                AND timestamp >= %s
+                GROUP BY device_id
+            ) s USING (device_id)
+            LEFT JOIN LATERAL (
+                SELECT total_energy AS latest
+                FROM elec e
+                WHERE e.device_id = d.device_id
+                ORDER BY timestamp DESC
+                LIMIT 1
+            ) l ON TRUE
+        """
+        try:
+            return self._statistics_bulk('stats_pw', query, _power_stats, device_ids, hours)
+        except Exception as e:
+            logger.error(f"전력량계 통계 일괄 조회 실패: {e}")
+            return {}
+
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # COP 계산용 범위 조회 (시작~끝 시각 지정)
@@ -483,29 +857,11 @@ class UIDataService:
             List[Dict]: [{'timestamp': datetime, 'value': float}, ...]
         """
         try:
-            field_mapping = {
-                't_in':  'input_temp',
-                't_out': 'output_temp',
-                'flow':  'flow',
-            }
-            db_field = field_mapping.get(field, field)
-
-            query = f"""
-                SELECT timestamp, {db_field}
-                FROM heatpump
-                WHERE device_id = %s
-                  AND timestamp >= %s
-                  AND timestamp <= %s
-                ORDER BY timestamp ASC
-            """
-            result = execute_query(query, (device_id, t_start, t_end), fetch_mode='all')
+            # NULL 행 제외 (센서 누락 대응), 범위가 길 수 있어 서버 커서로 나눠 받음
+            query = _timeseries_sql('heatpump', field, 'range')
             return [
-                {
-                    'timestamp': row['timestamp'],
-                    'value': float(row[db_field]) if row[db_field] is not None else None
-                }
-                for row in result
-                if row[db_field] is not None   # NULL 행 제외 (센서 누락 대응)
+                {'timestamp': ts, 'value': float(value)}
+                for ts, value in execute_query_iter(query, (device_id, t_start, t_end))
             ]
         except Exception as e:
             logger.error(f"히트펌프 범위 조회 실패: {e}")
@@ -530,22 +886,10 @@ class UIDataService:
               value = total_energy (누적값, 차분은 호출자에서 계산)
         """
         try:
-            query = """
-                SELECT timestamp, total_energy
-                FROM elec
-                WHERE device_id = %s
-                  AND timestamp >= %s
-                  AND timestamp <= %s
-                ORDER BY timestamp ASC
-            """
-            result = execute_query(query, (device_id, t_start, t_end), fetch_mode='all')
+            query = _timeseries_sql('elec', 'total_energy', 'range')
             return [
-                {
-                    'timestamp': row['timestamp'],
-                    'value': float(row['total_energy']) if row['total_energy'] is not None else None
-                }
-                for row in result
-                if row['total_energy'] is not None
+                {'timestamp': ts, 'value': float(value)}
+                for ts, value in execute_query_iter(query, (device_id, t_start, t_end))
             ]
         except Exception as e:
             logger.error(f"전력량계 범위 조회 실패: {e}")
@@ -19,7 +19,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QGroupBox, QRadioButton, QCheckBox,
     QDateTimeEdit, QFileDialog, QLineEdit, QMessageBox,
-    QProgressDialog, QListWidget, QButtonGroup
+    QProgressDialog, QListWidget, QListView, QButtonGroup
 )
 from PyQt6.QtCore import Qt, QDateTime, QThread, pyqtSignal
 
@@ -29,6 +29,13 @@ from services.ui_data_service import UIDataService
 
 logger = logging.getLogger(__name__)
 
+# 센서 타입 → 파일 단위 내보내기 메서드 (DB COPY 결과를 파일로 바로 스트리밍)
+_ITER_EXPORT = {
+    '히트펌프': CSVExportService.iter_export_heatpump_data,
+    '지중배관': CSVExportService.iter_export_groundpipe_data,
+    '전력량계': CSVExportService.iter_export_power_meter_data,
+}
+
 
 class ExportWorker(QThread):
     """CSV 내보내기 작업 스레드"""
@@ -36,7 +43,8 @@ class ExportWorker(QThread):
     finished = pyqtSignal(dict)
     progress = pyqtSignal(str)
     
-    def __init__(self, service, sensor_type, output_dir, start_date, end_date, single_file, device_ids):
+    def __init__(self, service, sensor_type, output_dir, start_date, end_date, single_file, device_ids,
+                 compress=False):
         super().__init__()
         self.service = service
         self.sensor_type = sensor_type
@@ -45,46 +53,64 @@ class ExportWorker(QThread):
         self.end_date = end_date
         self.single_file = single_file
         self.device_ids = device_ids
+        self.compress = compress
     
     def run(self):
         """작업 실행"""
         try:
             self.progress.emit(f"{self.sensor_type} 데이터 내보내기 중...")
             
-            if self.sensor_type == '히트펌프':
-                result = self.service.export_heatpump_data(
-                    output_dir=self.output_dir,
-                    device_ids=self.device_ids,
-                    start_date=self.start_date,
-                    end_date=self.end_date,
-                    single_file=self.single_file
-                )
-            elif self.sensor_type == '지중배관':
-                result = self.service.export_groundpipe_data(
-                    output_dir=self.output_dir,
-                    device_ids=self.device_ids,
-                    start_date=self.start_date,
-                    end_date=self.end_date,
-                    single_file=self.single_file
-                )
-            elif self.sensor_type == '전력량계':
-                result = self.service.export_power_meter_data(
-                    output_dir=self.output_dir,
-                    device_ids=self.device_ids,
-                    start_date=self.start_date,
-                    end_date=self.end_date,
-                    single_file=self.single_file
+            iter_export = _ITER_EXPORT.get(self.sensor_type)
+            if iter_export is None:
+                self.finished.emit({'success': False, 'files': [], 'total_rows': 0})
+                return
+            
+            files = []
+            total_rows = 0
+            
+            # 파일이 완성될 때마다 진행 상황 표시
+            for filepath, rows in iter_export(
+                self.service,
+                output_dir=self.output_dir,
+                device_ids=self.device_ids,
+                start_date=self.start_date,
+                end_date=self.end_date,
+                single_file=self.single_file,
+                compress=self.compress
+            ):
+                files.append(str(filepath))
+                total_rows += rows
+                self.progress.emit(
+                    f"{self.sensor_type} 데이터 내보내기 중... "
+                    f"({len(files)}개 파일, {total_rows:,}행)"
                 )
-            else:
-                result = {'success': False, 'files': [], 'total_rows': 0}
             
-            self.finished.emit(result)
+            logger.info(f"{self.sensor_type} 데이터 내보내기 완료: {len(files)}개 파일, {total_rows}행")
+            self.finished.emit({'success': True, 'files': files, 'total_rows': total_rows})
         
         except Exception as e:
             logger.error(f"CSV 내보내기 오류: {e}", exc_info=True)
             self.finished.emit({'success': False, 'files': [], 'total_rows': 0, 'error': str(e)})
 
 
+class ServiceInitWorker(QThread):
+    """서비스 생성 + 장치 목록 조회 스레드 (인덱스 점검 등 DB 조회로 UI가 멈추지 않도록)"""
+    
+    ready = pyqtSignal(object, object, dict)
+    failed = pyqtSignal(str)
+    
+    def run(self):
+        """작업 실행"""
+        try:
+            csv_service = CSVExportService()
+            data_service = UIDataService()
+            devices = data_service.get_all_devices()
+            self.ready.emit(csv_service, data_service, devices)
+        except Exception as e:
+            logger.error(f"CSV 내보내기 서비스 초기화 오류: {e}", exc_info=True)
+            self.failed.emit(str(e))
+
+
 class CSVExportDialog(QDialog):
     """CSV 내보내기 다이얼로그"""
     
@@ -95,11 +121,39 @@ class CSVExportDialog(QDialog):
         self.setWindowTitle('CSV 파일 내보내기')
         self.setMinimumSize(800, 700)
         
-        self.csv_service = CSVExportService()
-        self.data_service = UIDataService()
+        # 서비스는 ServiceInitWorker에서 생성 (준비 전까지 내보내기 비활성)
+        self.csv_service = None
+        self.data_service = None
+        
+        # 센서 타입별 장치 목록 {'heatpump' | 'groundpipe' | 'power': [device_id, ...]}
+        # 라디오 버튼 전환 시 DB 재조회 없이 사용 (invalidate_device_cache로 초기화)
+        self._device_cache: dict = {}
         
         self.init_ui()
+        
+        self._init_worker = ServiceInitWorker(self)
+        self._init_worker.ready.connect(self.on_services_ready)
+        self._init_worker.failed.connect(self.on_services_failed)
+        self._init_worker.start()
+    
+    def on_services_ready(self, csv_service, data_service, devices):
+        """서비스 준비 완료 → 장치 목록 표시, 내보내기 활성화"""
+        self.csv_service = csv_service
+        self.data_service = data_service
+        if any(devices.values()):
+            self._device_cache = devices
         self.load_devices()
+        self.btn_export.setEnabled(True)
+    
+    def on_services_failed(self, error_msg):
+        """서비스 초기화 실패"""
+        QMessageBox.critical(self, '오류', f'CSV 내보내기 준비 실패:\n{error_msg}')
+    
+    def done(self, result):
+        """닫을 때 초기화 스레드가 끝나기를 기다림 (실행 중인 QThread 파괴 방지)"""
+        if self._init_worker.isRunning():
+            self._init_worker.wait()
+        super().done(result)
     
     def init_ui(self):
         """UI 초기화"""
@@ -215,6 +269,10 @@ class CSVExportDialog(QDialog):
         self.device_list.setFont(Theme.font(11))
         self.device_list.setMaximumHeight(150)
         self.device_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
+        # 장치 ID는 짧은 한 줄 문자열 → 항목별 크기 계산 생략, 배치 단위 배치
+        self.device_list.setUniformItemSizes(True)
+        self.device_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.device_list.setBatchSize(200)
         self.device_list.itemSelectionChanged.connect(self.on_device_selection_changed)
         device_layout.addWidget(self.device_list)
         
@@ -241,6 +299,11 @@ class CSVExportDialog(QDialog):
         self.format_group.addButton(self.rb_multiple, 1)
         format_layout.addWidget(self.rb_multiple)
         
+        # gzip 압축 (*.csv.gz, 네트워크 드라이브 등 쓰기가 느린 위치에 유리)
+        self.cb_gzip = QCheckBox('Gzip 압축 (*.csv.gz)')
+        self.cb_gzip.setFont(Theme.font(11))
+        format_layout.addWidget(self.cb_gzip)
+        
         format_group.setLayout(format_layout)
         layout.addWidget(format_group)
         
@@ -272,12 +335,13 @@ class CSVExportDialog(QDialog):
         
         btn_layout = QHBoxLayout()
         
-        # 내보내기 버튼
-        btn_export = QPushButton('📥 내보내기')
-        btn_export.setFont(Theme.font(12, bold=True))
-        btn_export.setMinimumHeight(45)
-        btn_export.clicked.connect(self.start_export)
-        btn_layout.addWidget(btn_export)
+        # 내보내기 버튼 (서비스 준비 후 활성화)
+        self.btn_export = QPushButton('📥 내보내기')
+        self.btn_export.setFont(Theme.font(12, bold=True))
+        self.btn_export.setMinimumHeight(45)
+        self.btn_export.setEnabled(False)
+        self.btn_export.clicked.connect(self.start_export)
+        btn_layout.addWidget(self.btn_export)
         
         # 취소 버튼
         btn_cancel = QPushButton('✗ 취소')
@@ -291,23 +355,48 @@ class CSVExportDialog(QDialog):
         
         self.setLayout(layout)
     
+    def _sensor_key(self) -> str:
+        """선택된 센서 타입의 장치 목록 키"""
+        if self.rb_heatpump.isChecked():
+            return 'heatpump'
+        if self.rb_groundpipe.isChecked():
+            return 'groundpipe'
+        return 'power'
+    
+    def invalidate_device_cache(self):
+        """장치 목록 캐시 초기화 (장치 추가/삭제 후 호출)"""
+        self._device_cache.clear()
+        if self.data_service is not None:
+            self.data_service.invalidate_device_caches()
+    
     def load_devices(self):
         """장치 목록 로드"""
-        self.device_list.clear()
-        
-        if self.rb_heatpump.isChecked():
-            devices = self.data_service.get_all_heatpump_devices()
-        elif self.rb_groundpipe.isChecked():
-            devices = self.data_service.get_all_groundpipe_devices()
+        if self.data_service is None:
+            # 서비스 준비 전 (on_services_ready에서 다시 호출됨)
+            return
+        if not self._device_cache:
+            # 세 타입을 한 번에 조회해 두고 타입 전환 시 재사용
+            devices_by_type = self.data_service.get_all_devices()
+            if any(devices_by_type.values()):
+                self._device_cache = devices_by_type
         else:
-            devices = self.data_service.get_all_power_devices()
+            devices_by_type = self._device_cache
+        devices = devices_by_type.get(self._sensor_key(), [])
         
-        for device_id in devices:
-            self.device_list.addItem(device_id)
-        
-        # 전체 선택
-        if self.cb_all_devices.isChecked():
-            self.device_list.selectAll()
+        # 채우는 동안 갱신/시그널을 막고 선택 변경 처리는 마지막에 한 번만
+        self.device_list.blockSignals(True)
+        self.device_list.setUpdatesEnabled(False)
+        try:
+            self.device_list.clear()
+            self.device_list.addItems(devices)
+            
+            # 전체 선택
+            if self.cb_all_devices.isChecked():
+                self.device_list.selectAll()
+        finally:
+            self.device_list.setUpdatesEnabled(True)
+            self.device_list.blockSignals(False)
+        self.on_device_selection_changed()
     
     def on_sensor_type_changed(self):
         """센서 타입 변경"""
@@ -321,21 +410,24 @@ class CSVExportDialog(QDialog):
     
     def on_all_devices_changed(self, state):
         """전체 장치 체크박스 변경"""
-        if self.cb_all_devices.isChecked():
-            self.device_list.selectAll()
-        else:
-            self.device_list.clearSelection()
+        self.device_list.blockSignals(True)
+        try:
+            if self.cb_all_devices.isChecked():
+                self.device_list.selectAll()
+            else:
+                self.device_list.clearSelection()
+        finally:
+            self.device_list.blockSignals(False)
     
     def on_device_selection_changed(self):
         """장치 선택 변경"""
         selected_count = len(self.device_list.selectedItems())
         total_count = self.device_list.count()
         
-        # 전체 선택 체크박스 상태 업데이트
-        if selected_count == total_count:
-            self.cb_all_devices.setChecked(True)
-        else:
-            self.cb_all_devices.setChecked(False)
+        # 전체 선택 체크박스 상태 업데이트 (체크박스 시그널로 선택이 다시 바뀌지 않도록 차단)
+        self.cb_all_devices.blockSignals(True)
+        self.cb_all_devices.setChecked(selected_count == total_count)
+        self.cb_all_devices.blockSignals(False)
     
     def browse_output_dir(self):
         """출력 디렉토리 선택"""
@@ -364,6 +456,7 @@ class CSVExportDialog(QDialog):
         
         # 파일 형식
         single_file = self.rb_single.isChecked()
+        compress = self.cb_gzip.isChecked()
         
         # 출력 디렉토리
         output_dir = self.txt_output_dir.text()
@@ -392,7 +485,8 @@ class CSVExportDialog(QDialog):
             start_date,
             end_date,
             single_file,
-            device_ids
+            device_ids,
+            compress
         )
         self.worker.progress.connect(self.on_progress)
         self.worker.finished.connect(self.on_export_finished)
@@ -12,17 +12,149 @@
 - JSON 파일 저장
 """
 
-import json
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTableWidget, QTableWidgetItem,
-    QHeaderView, QMessageBox, QLineEdit, QCheckBox,
+    QPushButton, QTableView,
+    QHeaderView, QMessageBox,
 )
 from PyQt6.QtGui import QColor, QBrush
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 
 from ui.theme import Theme
+from services.config_service import load_json_file, save_json_file
+
+
+# 테이블 컬럼
+COLUMNS = ('ID', '이름', 'IP 주소', '포트', '활성화', '설명', '타입')
+COL_ID, COL_NAME, COL_IP, COL_PORT, COL_ENABLED, COL_DESC, COL_TYPE = range(len(COLUMNS))
+
+# 장치 타입 표시명
+TYPE_LABELS = {'heatpump': '히트펌프', 'groundpipe': '지중배관'}
+
+# 가운데 정렬 컬럼
+_CENTER_COLUMNS = frozenset((COL_ID, COL_PORT, COL_TYPE))
+
+
+class IPConfigModel(QAbstractTableModel):
+    """
+    장치 IP 설정 테이블 모델
+    
+    값은 컬럼별 리스트로 보관하고 data()에서 그때그때 반환하므로
+    셀마다 QTableWidgetItem / 행마다 QCheckBox 위젯을 만들지 않습니다.
+    """
+    
+    # 타입 컬럼 글자색 (QApplication 생성 후 첫 사용 시 1회 생성, 모든 인스턴스 공유)
+    _TYPE_BRUSHES = None
+    
+    @classmethod
+    def _brushes(cls):
+        if cls._TYPE_BRUSHES is None:
+            cls._TYPE_BRUSHES = {
+                'heatpump': QBrush(QColor(Theme.HEATPUMP_COLOR)),
+                'groundpipe': QBrush(QColor(Theme.PIPE_COLOR)),
+            }
+        return cls._TYPE_BRUSHES
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ids = []
+        self.names = []
+        self.ips = []
+        self.ports = []
+        self.enabled = []
+        self.descs = []
+        self.types = []
+        self._type_brushes = self._brushes()
+    
+    def set_devices(self, devices):
+        """장치 목록으로 모델 전체 교체"""
+        self.beginResetModel()
+        self.ids = [d['device_id'] for d in devices]
+        self.names = [d['name'] for d in devices]
+        self.ips = [d['ip'] for d in devices]
+        self.ports = [int(d['port']) for d in devices]
+        self.enabled = [bool(d['enabled']) for d in devices]
+        self.descs = [d.get('description', '') for d in devices]
+        self.types = [d['type'] for d in devices]
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ids)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        col = index.column()
+        if col == COL_ENABLED:
+            return flags | Qt.ItemFlag.ItemIsUserCheckable
+        if col in (COL_ID, COL_TYPE):
+            return flags
+        return flags | Qt.ItemFlag.ItemIsEditable
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if col == COL_ID:
+                return self.ids[row]
+            if col == COL_NAME:
+                return self.names[row]
+            if col == COL_IP:
+                return self.ips[row]
+            if col == COL_PORT:
+                return self.ports[row]
+            if col == COL_DESC:
+                return self.descs[row]
+            if col == COL_TYPE:
+                return TYPE_LABELS.get(self.types[row], self.types[row])
+            return None
+        
+        if role == Qt.ItemDataRole.CheckStateRole and col == COL_ENABLED:
+            return Qt.CheckState.Checked if self.enabled[row] else Qt.CheckState.Unchecked
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and col in _CENTER_COLUMNS:
+            return Qt.AlignmentFlag.AlignCenter
+        
+        if role == Qt.ItemDataRole.ForegroundRole and col == COL_TYPE:
+            return self._type_brushes.get(self.types[row])
+        
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+        row, col = index.row(), index.column()
+        
+        if role == Qt.ItemDataRole.CheckStateRole and col == COL_ENABLED:
+            self.enabled[row] = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif role == Qt.ItemDataRole.EditRole and col == COL_NAME:
+            self.names[row] = str(value)
+        elif role == Qt.ItemDataRole.EditRole and col == COL_IP:
+            self.ips[row] = str(value)
+        elif role == Qt.ItemDataRole.EditRole and col == COL_PORT:
+            try:
+                self.ports[row] = int(value)
+            except (TypeError, ValueError):
+                return False
+        elif role == Qt.ItemDataRole.EditRole and col == COL_DESC:
+            self.descs[row] = str(value)
+        else:
+            return False
+        
+        self.dataChanged.emit(index, index, [role])
+        return True
 
 
 class IPConfigDialog(QDialog):
@@ -36,6 +168,8 @@ class IPConfigDialog(QDialog):
         
         self.config_file = Path('config/box_ips.json')
         self.config_data = None
+        # 원본 장치 설정 {(타입, device_id): dict} (저장 시 sensors 정보 조회용)
+        self._original_by_id = {}
         
         self.init_ui()
         self.load_config()
@@ -60,11 +194,9 @@ class IPConfigDialog(QDialog):
         layout.addWidget(desc)
         
         # 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            'ID', '이름', 'IP 주소', '포트', '활성화', '설명', '타입'
-        ])
+        self.model = IPConfigModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
         # 컬럼 너비 설정
         header = self.table.horizontalHeader()
@@ -112,8 +244,7 @@ class IPConfigDialog(QDialog):
     def load_config(self):
         """설정 파일 로드"""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config_data = json.load(f)
+            self.config_data = load_json_file(self.config_file)
             
             # 히트펌프
             heatpumps = self.config_data.get('heatpump', [])
@@ -130,48 +261,8 @@ class IPConfigDialog(QDialog):
                 pipe['type'] = 'groundpipe'
                 all_devices.append(pipe)
             
-            self.table.setRowCount(len(all_devices))
-            
-            for row, device in enumerate(all_devices):
-                # ID
-                id_item = QTableWidgetItem(device['device_id'])
-                id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row, 0, id_item)
-                
-                # 이름
-                name_item = QTableWidgetItem(device['name'])
-                self.table.setItem(row, 1, name_item)
-                
-                # IP 주소
-                ip_item = QTableWidgetItem(device['ip'])
-                self.table.setItem(row, 2, ip_item)
-                
-                # 포트
-                port_item = QTableWidgetItem(str(device['port']))
-                port_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row, 3, port_item)
-                
-                # 활성화 (체크박스)
-                enabled_widget = QCheckBox()
-                enabled_widget.setChecked(device['enabled'])
-                enabled_widget.setStyleSheet('margin-left: 35px;')
-                self.table.setCellWidget(row, 4, enabled_widget)
-                
-                # 설명
-                desc_item = QTableWidgetItem(device.get('description', ''))
-                self.table.setItem(row, 5, desc_item)
-                
-                # 타입 (수정된 부분)
-                type_item = QTableWidgetItem('히트펌프' if device['type'] == 'heatpump' else '지중배관')
-                type_item.setFlags(type_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-                # ✅ QBrush 사용
-                color = Theme.HEATPUMP_COLOR if device['type'] == 'heatpump' else Theme.PIPE_COLOR
-                type_item.setForeground(QBrush(QColor(color)))
-
-                self.table.setItem(row, 6, type_item)
+            self._original_by_id = {(d['type'], d['device_id']): d for d in all_devices}
+            self.model.set_devices(all_devices)
         
         except Exception as e:
             QMessageBox.critical(self, '오류', f'설정 파일 로드 실패:\n{str(e)}')
@@ -179,31 +270,16 @@ class IPConfigDialog(QDialog):
     def save_config(self):
         """설정 파일 저장"""
         try:
-            # 테이블 데이터를 config_data에 반영
+            # 모델 데이터를 config_data에 반영
             heatpumps = []
             pipes = []
+            m = self.model
             
-            for row in range(self.table.rowCount()):
-                device_id = self.table.item(row, 0).text()
-                name = self.table.item(row, 1).text()
-                ip = self.table.item(row, 2).text()
-                port = int(self.table.item(row, 3).text())
-                enabled = self.table.cellWidget(row, 4).isChecked()
-                description = self.table.item(row, 5).text()
-                device_type = self.table.item(row, 6).text()
-                
+            for row, (device_id, name, ip, port, enabled, description, device_type) in enumerate(zip(
+                m.ids, m.names, m.ips, m.ports, m.enabled, m.descs, m.types
+            )):
                 # 원본 데이터에서 sensors 정보 가져오기
-                original_device = None
-                if device_type == '히트펌프':
-                    for hp in self.config_data.get('heatpump', []):
-                        if hp['device_id'] == device_id:
-                            original_device = hp
-                            break
-                else:
-                    for pipe in self.config_data.get('groundpipe', []):
-                        if pipe['device_id'] == device_id:
-                            original_device = pipe
-                            break
+                original_device = self._original_by_id.get((device_type, device_id))
                 
                 device = {
                     'id': row + 1,
@@ -224,7 +300,7 @@ class IPConfigDialog(QDialog):
                     }
                 }
                 
-                if device_type == '히트펌프':
+                if device_type == 'heatpump':
                     heatpumps.append(device)
                 else:
                     pipes.append(device)
@@ -232,9 +308,8 @@ class IPConfigDialog(QDialog):
             self.config_data['heatpump'] = heatpumps
             self.config_data['groundpipe'] = pipes
             
-            # 파일 저장
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, indent=4, ensure_ascii=False)
+            # 파일 저장 (orjson 있으면 사용)
+            save_json_file(self.config_file, self.config_data)
             
             QMessageBox.information(self, '저장 완료', '설정이 저장되었습니다.\n변경사항을 적용하려면 프로그램을 재시작하세요.')
             self.accept()
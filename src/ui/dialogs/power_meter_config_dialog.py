@@ -15,19 +15,224 @@
 """
 
 
-import json
+import re
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTableWidget, QTableWidgetItem,
-    QHeaderView, QMessageBox, QCheckBox, QSpinBox, QLineEdit
+    QPushButton, QTableWidget, QTableWidgetItem, QTableView,
+    QHeaderView, QMessageBox, QSpinBox, QLineEdit, QStyledItemDelegate
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QThread, pyqtSignal
 
 
 from ui.theme import Theme
+from services.config_service import parse_json_bytes, save_json_file
 
 
+# IP/포트 입력 검사
+_IPV4_RE = re.compile(
+    r'^(?:(?:25[0-5]|2[0-4]\d|[01]?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d?\d)$'
+)
+_PORT_RE = re.compile(r'^\d{1,5}$')
+
+
+# 스타일시트 (Theme 색상은 고정이므로 모듈 로드 시 1회 생성)
+_TITLE_QSS = f'color: {Theme.PRIMARY}; padding: 10px;'
+_DESC_QSS = f'color: {Theme.TEXT_SECONDARY}; padding: 5px;'
+_REFRESH_BTN_QSS = f'background-color: {Theme.SECONDARY};'
+_CANCEL_BTN_QSS = f'background-color: {Theme.TEXT_SECONDARY};'
+
+_LINEEDIT_QSS = f"""
+    QLineEdit {{
+        background-color: {Theme.BG_SECONDARY};
+        border: 1px solid {Theme.BORDER};
+        border-radius: 5px;
+        padding: 5px;
+        font-size: 12px;
+        color: {Theme.TEXT_PRIMARY};
+    }}
+    QLineEdit:focus {{
+        border: 2px solid {Theme.PRIMARY};
+    }}
+"""
+
+_SPINBOX_QSS = f"""
+    QSpinBox {{
+        background-color: {Theme.BG_SECONDARY};
+        border: 1px solid {Theme.BORDER};
+        border-radius: 5px;
+        padding: 5px;
+        font-size: 12px;
+    }}
+    QSpinBox:focus {{
+        border: 2px solid {Theme.PRIMARY};
+    }}
+"""
+
+
+# 설정 파일 원본 캐시 {경로: (st_mtime_ns, bytes)}
+# 다이얼로그를 다시 열거나 새로고침해도 파일이 바뀌지 않았으면 디스크를 읽지 않음
+_CONFIG_CACHE = {}
+
+
+def _load_cached(path: Path):
+    """
+    설정 파일 로드 (수정 시각이 같으면 캐시된 원본 재사용)
+    
+    매번 원본 bytes를 다시 파싱하므로 호출자마다 독립된 dict를 받습니다.
+    """
+    mtime = path.stat().st_mtime_ns
+    entry = _CONFIG_CACHE.get(path)
+    if entry is None or entry[0] != mtime:
+        entry = (mtime, path.read_bytes())
+        _CONFIG_CACHE[path] = entry
+    return parse_json_bytes(entry[1])
+
+
+# 전력량계 테이블 컬럼
+METER_COLUMNS = ('ID (수정 가능)', 'Slave ID', '이름', '활성화', '설명')
+COL_DEVICE_ID, COL_SLAVE_ID, COL_NAME, COL_ENABLED, COL_DESC = range(len(METER_COLUMNS))
+
+
+class MeterTableModel(QAbstractTableModel):
+    """
+    전력량계 목록 테이블 모델
+    
+    값은 컬럼별 리스트로 보관하고 data()에서 그때그때 반환합니다
+    (행마다 QTableWidgetItem을 만들지 않음).
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.device_ids = []
+        self.slave_ids = []
+        self.names = []
+        self.enabled = []
+        self.descs = []
+    
+    def set_meters(self, meters):
+        """전력량계 목록으로 모델 전체 교체"""
+        self.beginResetModel()
+        self.device_ids = [m['device_id'] for m in meters]
+        self.slave_ids = [int(m['slave_id']) for m in meters]
+        self.names = [m['name'] for m in meters]
+        self.enabled = [bool(m['enabled']) for m in meters]
+        self.descs = [m.get('description', '') for m in meters]
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.device_ids)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(METER_COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return METER_COLUMNS[section]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == COL_ENABLED:
+            return flags | Qt.ItemFlag.ItemIsUserCheckable
+        return flags | Qt.ItemFlag.ItemIsEditable
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if col == COL_DEVICE_ID:
+                return self.device_ids[row]
+            if col == COL_SLAVE_ID:
+                return self.slave_ids[row]
+            if col == COL_NAME:
+                return self.names[row]
+            if col == COL_DESC:
+                return self.descs[row]
+            return None
+        
+        if role == Qt.ItemDataRole.CheckStateRole and col == COL_ENABLED:
+            return Qt.CheckState.Checked if self.enabled[row] else Qt.CheckState.Unchecked
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and col in (COL_DEVICE_ID, COL_SLAVE_ID):
+            return Qt.AlignmentFlag.AlignCenter
+        
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+        row, col = index.row(), index.column()
+        
+        if role == Qt.ItemDataRole.CheckStateRole and col == COL_ENABLED:
+            self.enabled[row] = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif role == Qt.ItemDataRole.EditRole and col == COL_DEVICE_ID:
+            self.device_ids[row] = str(value)
+        elif role == Qt.ItemDataRole.EditRole and col == COL_SLAVE_ID:
+            try:
+                self.slave_ids[row] = int(value)
+            except (TypeError, ValueError):
+                return False
+        elif role == Qt.ItemDataRole.EditRole and col == COL_NAME:
+            self.names[row] = str(value)
+        elif role == Qt.ItemDataRole.EditRole and col == COL_DESC:
+            self.descs[row] = str(value)
+        else:
+            return False
+        
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+
+class ConfigLoadWorker(QThread):
+    """설정 파일 읽기 + JSON 파싱 스레드 (UI 스레드는 테이블 채우기만 담당)"""
+    
+    loaded = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, path: Path, parent=None):
+        super().__init__(parent)
+        self.path = path
+    
+    def run(self):
+        """작업 실행"""
+        try:
+            self.loaded.emit(_load_cached(self.path))
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class DeviceIdDelegate(QStyledItemDelegate):
+    """ID 편집기 (편집할 때만 QLineEdit 생성)"""
+    
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        editor.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        editor.setStyleSheet(_LINEEDIT_QSS)
+        return editor
+
+
+class SlaveIdDelegate(QStyledItemDelegate):
+    """Slave ID 편집기 (편집할 때만 QSpinBox 생성, 1~247)"""
+    
+    def createEditor(self, parent, option, index):
+        editor = QSpinBox(parent)
+        editor.setRange(1, 247)
+        editor.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        editor.setStyleSheet(_SPINBOX_QSS)
+        return editor
+    
+    def setEditorData(self, editor, index):
+        editor.setValue(int(index.data(Qt.ItemDataRole.EditRole) or 1))
+    
+    def setModelData(self, editor, model, index):
+        editor.interpretText()
+        model.setData(index, editor.value(), Qt.ItemDataRole.EditRole)
+
 
 class PowerMeterConfigDialog(QDialog):
     """전력량계 설정 다이얼로그"""
@@ -40,6 +245,10 @@ class PowerMeterConfigDialog(QDialog):
         
         self.config_file = Path('config/power_meter_config.json')
         self.config_data = None
+        self._load_worker = None
+        self._dirty = False   # 로드 후 수정 여부 (변경 없으면 저장 생략)
+        self._err_box = None   # 오류/안내 메시지 박스 (처음 쓸 때 한 번 생성 후 재사용)
+        self._info_box = None
         
         self.init_ui()
         self.load_config()
@@ -51,7 +260,7 @@ class PowerMeterConfigDialog(QDialog):
         # 제목
         title = QLabel('⚡ 전력량계 설정')
         title.setFont(Theme.font(16, bold=True))
-        title.setStyleSheet(f'color: {Theme.PRIMARY}; padding: 10px;')
+        title.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title)
         
         # 설명
@@ -60,9 +269,16 @@ class PowerMeterConfigDialog(QDialog):
             '각 전력량계는 고유한 ID와 Slave ID를 가져야 합니다.'
         )
         desc.setFont(Theme.font(10))
-        desc.setStyleSheet(f'color: {Theme.TEXT_SECONDARY}; padding: 5px;')
+        desc.setStyleSheet(_DESC_QSS)
         layout.addWidget(desc)
         
+        # 로딩 표시 (설정 파일 읽는 동안만)
+        self.loading_label = QLabel('로딩 중...')
+        self.loading_label.setFont(Theme.font(10))
+        self.loading_label.setStyleSheet(_DESC_QSS)
+        self.loading_label.hide()
+        layout.addWidget(self.loading_label)
+        
         # IP/Port 정보
         info_layout = QHBoxLayout()
         info_label = QLabel('📡 통신 설정')
@@ -83,6 +299,7 @@ class PowerMeterConfigDialog(QDialog):
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         
         layout.addWidget(self.info_table)
+        self.info_table.itemChanged.connect(self._mark_dirty)
         
         # 전력량계 목록
         meter_label = QLabel('📊 전력량계 목록')
@@ -91,11 +308,10 @@ class PowerMeterConfigDialog(QDialog):
         layout.addWidget(meter_label)
         
         # 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            'ID (수정 가능)', 'Slave ID', '이름', '활성화', '설명'
-        ])
+        self.model = MeterTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.model.dataChanged.connect(self._mark_dirty)
         
         # 컬럼 너비 설정
         header = self.table.horizontalHeader()
@@ -108,6 +324,10 @@ class PowerMeterConfigDialog(QDialog):
         self.table.setColumnWidth(0, 150)  # ID
         self.table.setColumnWidth(1, 100)  # Slave ID
         
+        # 편집기는 셀을 편집할 때만 생성 (행마다 위젯을 두지 않음)
+        self.table.setItemDelegateForColumn(COL_DEVICE_ID, DeviceIdDelegate(self.table))
+        self.table.setItemDelegateForColumn(COL_SLAVE_ID, SlaveIdDelegate(self.table))
+        
         layout.addWidget(self.table)
         
         # 버튼
@@ -116,22 +336,22 @@ class PowerMeterConfigDialog(QDialog):
         # 새로고침 버튼
         refresh_btn = QPushButton('🔄 새로고침')
         refresh_btn.setFont(Theme.font(11))
-        refresh_btn.setStyleSheet(f'background-color: {Theme.SECONDARY};')
+        refresh_btn.setStyleSheet(_REFRESH_BTN_QSS)
         refresh_btn.clicked.connect(self.load_config)
         btn_layout.addWidget(refresh_btn)
         
         btn_layout.addStretch()
         
         # 저장 버튼
-        save_btn = QPushButton('💾 저장')
-        save_btn.setFont(Theme.font(11, bold=True))
-        save_btn.clicked.connect(self.save_config)
-        btn_layout.addWidget(save_btn)
+        self.save_btn = QPushButton('💾 저장')
+        self.save_btn.setFont(Theme.font(11, bold=True))
+        self.save_btn.clicked.connect(self.save_config)
+        btn_layout.addWidget(self.save_btn)
         
         # 취소 버튼
         cancel_btn = QPushButton('✗ 취소')
         cancel_btn.setFont(Theme.font(11))
-        cancel_btn.setStyleSheet(f'background-color: {Theme.TEXT_SECONDARY};')
+        cancel_btn.setStyleSheet(_CANCEL_BTN_QSS)
         cancel_btn.clicked.connect(self.reject)
         btn_layout.addWidget(cancel_btn)
         
@@ -140,85 +360,107 @@ class PowerMeterConfigDialog(QDialog):
         self.setLayout(layout)
     
     def load_config(self):
-        """설정 파일 로드"""
+        """설정 파일 로드 (읽기/파싱은 ConfigLoadWorker에서)"""
+        if self._load_worker is not None and self._load_worker.isRunning():
+            return
+        
+        self.loading_label.show()
+        self.save_btn.setEnabled(False)
+        
+        self._load_worker = ConfigLoadWorker(self.config_file, self)
+        self._load_worker.loaded.connect(self._apply_config)
+        self._load_worker.failed.connect(self._on_load_failed)
+        self._load_worker.start()
+    
+    def _error(self, msg):
+        """오류 메시지 표시 (QMessageBox 재사용)"""
+        if self._err_box is None:
+            self._err_box = QMessageBox(
+                QMessageBox.Icon.Critical, '오류', '',
+                QMessageBox.StandardButton.Ok, self
+            )
+        self._err_box.setText(msg)
+        self._err_box.exec()
+    
+    def _info(self, title, msg):
+        """안내 메시지 표시 (QMessageBox 재사용)"""
+        if self._info_box is None:
+            self._info_box = QMessageBox(
+                QMessageBox.Icon.Information, title, '',
+                QMessageBox.StandardButton.Ok, self
+            )
+        self._info_box.setWindowTitle(title)
+        self._info_box.setText(msg)
+        self._info_box.exec()
+    
+    def _mark_dirty(self, *_):
+        """편집 발생 표시"""
+        self._dirty = True
+    
+    def _on_load_failed(self, error_msg):
+        """설정 파일 로드 실패"""
+        self.loading_label.hide()
+        self._error(f'설정 파일 로드 실패:\n{error_msg}')
+    
+    def _apply_config(self, data):
+        """파싱된 설정을 테이블에 표시"""
+        self.loading_label.hide()
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config_data = json.load(f)
-            
-            # IP/Port 정보
-            ip_item = QTableWidgetItem(self.config_data['ip'])
-            self.info_table.setItem(0, 0, ip_item)
+            self.config_data = data
             
-            port_item = QTableWidgetItem(str(self.config_data['port']))
-            port_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.info_table.setItem(0, 1, port_item)
-            
-            # 전력량계 목록
-            meters = self.config_data.get('meters', [])
-            self.table.setRowCount(len(meters))
-            
-            for row, meter in enumerate(meters):
-                # ✅✅ ID (LineEdit - 수정 가능)
-                id_edit = QLineEdit(meter['device_id'])
-                id_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                id_edit.setStyleSheet(f"""
-                    QLineEdit {{
-                        background-color: {Theme.BG_SECONDARY};
-                        border: 1px solid {Theme.BORDER};
-                        border-radius: 5px;
-                        padding: 5px;
-                        font-size: 12px;
-                        color: {Theme.TEXT_PRIMARY};
-                    }}
-                    QLineEdit:focus {{
-                        border: 2px solid {Theme.PRIMARY};
-                    }}
-                """)
-                self.table.setCellWidget(row, 0, id_edit)
-                
-                # Slave ID (SpinBox)
-                slave_id_spin = QSpinBox()
-                slave_id_spin.setMinimum(1)
-                slave_id_spin.setMaximum(247)
-                slave_id_spin.setValue(meter['slave_id'])
-                slave_id_spin.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                slave_id_spin.setStyleSheet(f"""
-                    QSpinBox {{
-                        background-color: {Theme.BG_SECONDARY};
-                        border: 1px solid {Theme.BORDER};
-                        border-radius: 5px;
-                        padding: 5px;
-                        font-size: 12px;
-                    }}
-                    QSpinBox:focus {{
-                        border: 2px solid {Theme.PRIMARY};
-                    }}
-                """)
-                self.table.setCellWidget(row, 1, slave_id_spin)
-                
-                # 이름
-                name_item = QTableWidgetItem(meter['name'])
-                self.table.setItem(row, 2, name_item)
-                
-                # 활성화 (체크박스)
-                enabled_widget = QCheckBox()
-                enabled_widget.setChecked(meter['enabled'])
-                enabled_widget.setStyleSheet('margin-left: 35px;')
-                self.table.setCellWidget(row, 3, enabled_widget)
+            # IP/Port 정보 (채우는 동안 화면 갱신/시그널 중지)
+            self.info_table.setUpdatesEnabled(False)
+            self.info_table.blockSignals(True)
+            try:
+                ip_item = QTableWidgetItem(self.config_data['ip'])
+                self.info_table.setItem(0, 0, ip_item)
                 
-                # 설명
-                desc_item = QTableWidgetItem(meter.get('description', ''))
-                self.table.setItem(row, 4, desc_item)
+                port_item = QTableWidgetItem(str(self.config_data['port']))
+                port_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.info_table.setItem(0, 1, port_item)
+            finally:
+                self.info_table.blockSignals(False)
+                self.info_table.setUpdatesEnabled(True)
+            
+            # 전력량계 목록 (모델 교체 한 번으로 갱신)
+            self.model.set_meters(self.config_data.get('meters', []))
+            self._dirty = False
+            self.save_btn.setEnabled(True)
         
         except Exception as e:
-            QMessageBox.critical(self, '오류', f'설정 파일 로드 실패:\n{str(e)}')
+            self._error(f'설정 파일 로드 실패:\n{str(e)}')
+    
+    def done(self, result):
+        """닫을 때 로드 스레드가 끝나기를 기다림 (실행 중인 QThread 파괴 방지)"""
+        if self._load_worker is not None and self._load_worker.isRunning():
+            self._load_worker.wait()
+        super().done(result)
     
     def save_config(self):
         """설정 파일 저장"""
+        # 로드 후 바뀐 것이 없으면 파일을 다시 쓰지 않음
+        if not self._dirty:
+            self.accept()
+            return
+        
         try:
+            # IP/Port 유효성 검사
+            ip_item = self.info_table.item(0, 0)
+            port_item = self.info_table.item(0, 1)
+            ip_text = ip_item.text().strip() if ip_item else ''
+            port_text = port_item.text().strip() if port_item else ''
+            
+            if not _IPV4_RE.match(ip_text):
+                QMessageBox.warning(self, '경고', f'IP 주소 형식이 올바르지 않습니다: {ip_text}')
+                return
+            
+            if not _PORT_RE.match(port_text) or not 1 <= int(port_text) <= 65535:
+                QMessageBox.warning(self, '경고', f'포트는 1~65535 사이의 숫자여야 합니다: {port_text}')
+                return
+            
             # IP/Port 정보 업데이트
-            self.config_data['ip'] = self.info_table.item(0, 0).text()
-            self.config_data['port'] = int(self.info_table.item(0, 1).text())
+            self.config_data['ip'] = ip_text
+            self.config_data['port'] = int(port_text)
             
             # ✅✅ ID 중복 검사 및 유효성 검사
             ids_seen = set()
@@ -226,10 +468,12 @@ class PowerMeterConfigDialog(QDialog):
             
             # 전력량계 목록 업데이트
             meters = []
-            for row in range(self.table.rowCount()):
-                # ✅✅ ID 가져오기 (LineEdit에서)
-                id_edit = self.table.cellWidget(row, 0)
-                device_id = id_edit.text().strip()
+            m = self.model
+            for row, (device_id, slave_id, name, enabled, description) in enumerate(zip(
+                m.device_ids, m.slave_ids, m.names, m.enabled, m.descs
+            )):
+                # ✅✅ ID 앞뒤 공백 제거
+                device_id = device_id.strip()
                 
                 # ✅✅ ID 유효성 검사
                 if not device_id:
@@ -250,9 +494,6 @@ class PowerMeterConfigDialog(QDialog):
                 
                 ids_seen.add(device_id)
                 
-                # Slave ID 가져오기
-                slave_id = self.table.cellWidget(row, 1).value()
-                
                 # ✅✅ Slave ID 중복 검사
                 if slave_id in slave_ids_seen:
                     QMessageBox.warning(
@@ -264,11 +505,6 @@ class PowerMeterConfigDialog(QDialog):
                 
                 slave_ids_seen.add(slave_id)
                 
-                # 나머지 필드
-                name = self.table.item(row, 2).text()
-                enabled = self.table.cellWidget(row, 3).isChecked()
-                description = self.table.item(row, 4).text()
-                
                 meter = {
                     'id': row + 1,
                     'device_id': device_id,
@@ -282,19 +518,19 @@ class PowerMeterConfigDialog(QDialog):
             
             self.config_data['meters'] = meters
             
-            # 파일 저장
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, indent=4, ensure_ascii=False)
+            # 파일 저장 (orjson 있으면 사용)
+            save_json_file(self.config_file, self.config_data)
+            _CONFIG_CACHE.pop(self.config_file, None)
+            self._dirty = False
             
-            QMessageBox.information(
-                self, 
-                '저장 완료', 
+            self._info(
+                '저장 완료',
                 '설정이 저장되었습니다.\n변경사항을 적용하려면 프로그램을 재시작하세요.'
             )
             self.accept()
         
         except Exception as e:
-            QMessageBox.critical(self, '오류', f'설정 저장 실패:\n{str(e)}')
+            self._error(f'설정 저장 실패:\n{str(e)}')
 
 
 
@@ -1057,10 +1057,18 @@ class MainWindow(QMainWindow):
         """config 기준 전체 장치 표시, DB 데이터 있으면 온라인"""
         rows = []
 
+        # 온라인 장치 통계는 종류별로 한 번에 조회
+        hp_stats = self.data_service.get_statistics_heatpump_bulk(
+            [d for d in all_hp if d in online_hp], hours=1)
+        gp_stats = self.data_service.get_statistics_groundpipe_bulk(
+            [d for d in all_gp if d in online_gp], hours=1)
+        pm_stats = self.data_service.get_statistics_power_bulk(
+            [d for d in all_pm if d in online_pm], hours=1)
+
         for dev in all_hp:
             is_online = dev in online_hp
-            if is_online:
-                s = self.data_service.get_statistics_heatpump(dev, hours=1)
+            if is_online and dev in hp_stats:
+                s = hp_stats[dev]
                 val = f"{s['t_in']['latest']:.1f}°C"
             else:
                 val = 'N/A'
@@ -1069,8 +1077,8 @@ class MainWindow(QMainWindow):
 
         for dev in all_gp:
             is_online = dev in online_gp
-            if is_online:
-                s = self.data_service.get_statistics_groundpipe(dev, hours=1)
+            if is_online and dev in gp_stats:
+                s = gp_stats[dev]
                 val = f"{s['t_in']['latest']:.1f}°C"
             else:
                 val = 'N/A'
@@ -1079,8 +1087,8 @@ class MainWindow(QMainWindow):
 
         for dev in all_pm:
             is_online = dev in online_pm
-            if is_online:
-                s = self.data_service.get_statistics_power(dev, hours=1)
+            if is_online and dev in pm_stats:
+                s = pm_stats[dev]
                 val = f"{s['latest']:.2f} kWh"
             else:
                 val = 'N/A'
@@ -10,6 +10,8 @@ Material Design 기반 화이트 모드 테마
 - 텍스트: 어두운 회색/검정
 """
 
+import functools
+
 from PyQt6.QtGui import QFont
 
 
@@ -58,9 +60,13 @@ class Theme:
     FONT_FAMILY = 'Malgun Gothic'  # 한글 폰트
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def font(size=10, bold=False):
         """
-        폰트 생성
+        폰트 생성 (같은 인자는 같은 객체 재사용)
+        
+        setFont()는 값을 복사하므로 공유해도 안전하지만,
+        반환된 폰트를 직접 수정하지 마세요.
         
         Args:
             size: 폰트 크기 (pt)
@@ -152,7 +158,7 @@ class Theme:
             /* ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━ */
             /* 테이블 */
             /* ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━ */
-            QTableWidget {{
+            QTableView {{
                 background-color: {Theme.BG_SECONDARY};
                 border: 1px solid {Theme.BORDER};
                 border-radius: 8px;
@@ -160,12 +166,12 @@ class Theme:
                 color: {Theme.TEXT_PRIMARY};
             }}
             
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 8px;
                 border: none;
             }}
             
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {Theme.BG_TERTIARY};
                 color: {Theme.TEXT_PRIMARY};
             }}
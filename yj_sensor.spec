@@ -75,6 +75,10 @@ hiddenimports += [
     
     # 환경 변수
     'dotenv',
+    
+    # JSON 설정 파일 읽기/쓰기/스키마 검증 (services.config_service에서 있으면 사용)
+    'orjson',
+    'fastjsonschema',
 ]
 
 # 6. 모델 파일 명시적 포함